@@ -0,0 +1,101 @@
+"""
+차트 저장 벤치마크: 기존 방식(화면 위젯을 띄워 processEvents + repaint 후 위젯을 캡처)
+vs utils.chart_renderer.ChartRenderer (데이터로 새 QChart를 만들어 offscreen으로 기록 → PDF/PNG)
+
+사용법:
+    python benchmarks/bench_chart_render.py [--charts 50] [--slices 10] [--dpi 300] [--out /tmp]
+
+가맹점별 민원 비중 파이 차트를 연속으로 저장해 초당 차트 수를 비교한다.
+(Qt 화면 없이 실행하려면 QT_QPA_PLATFORM=offscreen)
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def make_data(index: int, slices: int) -> dict[str, int]:
+    return {f"가맹점{index}-{k}": (index + k) % 7 + 1 for k in range(slices)}
+
+
+def legacy_export(app, data, file_path, title):
+    # 기존 utils/pdf_chart_exporter.export_qchartview_to_pdf: 위젯을 만들어 화면 크기 그대로 캡처
+    from PyQt6.QtCore import QMarginsF
+    from PyQt6.QtGui import QPainter, QPdfWriter, QPageSize, QPageLayout, QPicture
+    from widgets.pie_chart_widget import PieChartWidget
+
+    widget = PieChartWidget(title, data)
+    widget.resize(600, 500)
+    widget.show()
+    app.processEvents()
+    widget.chart_view.repaint()
+    picture = QPicture()
+    painter = QPainter(picture)
+    widget.chart_view.render(painter)
+    painter.end()
+
+    writer = QPdfWriter(file_path)
+    writer.setResolution(300)
+    writer.setPageLayout(QPageLayout(QPageSize(QPageSize.PageSizeId.A4), QPageLayout.Orientation.Landscape, QMarginsF(0, 0, 0, 0)))
+    painter = QPainter(writer)
+    painter.translate(20, 70)
+    painter.drawPicture(0, 0, picture)
+    painter.end()
+    widget.close()
+    widget.deleteLater()
+
+
+def timed(label, count, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed:8.3f}s  {count / elapsed:8.1f}개/초")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--charts", type=int, default=50)
+    parser.add_argument("--slices", type=int, default=10)
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--out", default=tempfile.gettempdir(), help="파일을 저장할 폴더")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+    from utils.chart_renderer import ChartRenderer
+    from widgets.pie_chart_widget import build_pie_chart
+    app = QApplication.instance() or QApplication([])
+
+    datasets = [make_data(i, args.slices) for i in range(args.charts)]
+    pdf_path = os.path.join(args.out, "bench_chart.pdf")
+    png_path = os.path.join(args.out, "bench_chart.png")
+    renderer = ChartRenderer(dpi=args.dpi)
+
+    def legacy():
+        for i, data in enumerate(datasets):
+            legacy_export(app, data, pdf_path, f"차트 {i}")
+
+    def record_only():
+        for i, data in enumerate(datasets):
+            renderer.record(build_pie_chart(f"차트 {i}", data, animated=False))
+
+    def render_pdf():
+        for i, data in enumerate(datasets):
+            renderer.render_pdf(build_pie_chart(f"차트 {i}", data, animated=False), pdf_path, title=f"차트 {i}")
+
+    def render_png():
+        for i, data in enumerate(datasets):
+            renderer.render_png(build_pie_chart(f"차트 {i}", data, animated=False), png_path)
+
+    print(f"파이 차트 {args.charts}개 (조각 {args.slices}개, {args.dpi}dpi)")
+    timed("기존: 위젯 표시 + 캡처 → PDF", args.charts, legacy)
+    timed("신규: 기록만 (GUI 스레드 부분)", args.charts, record_only)
+    timed("신규: 기록 + 벡터 PDF", args.charts, render_pdf)
+    timed("신규: 기록 + PNG", args.charts, render_png)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
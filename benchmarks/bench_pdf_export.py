@@ -0,0 +1,201 @@
+"""
+리포트 PDF 저장 벤치마크: 기존 matplotlib 방식(페이지마다 Figure + 셀마다 Table 셀, table.item() 반복 호출)
+vs utils.pdf_exporter.export_report_to_pdf (리포트 DataFrame → reportlab 페이지 단위 표)
+
+사용법:
+    python benchmarks/bench_pdf_export.py [--stores 300] [--tids 1000] [--rows 12000] [--skip-legacy] [--out /tmp]
+                                          [--workers 1,2,4]
+
+가맹점 종합 리포트(가로 A4)를 두 방식으로 저장해 걸린 시간과 초당 페이지 수를 비교한다.
+이어서 한 달치 일 단위 현황(날짜마다 PDF 한 개)을 reports.batch_export.run_batch_export로
+--workers의 프로세스 수마다 일괄 저장해 걸린 시간과 초당 파일 수를 비교한다.
+(Qt 화면 없이 실행하려면 QT_QPA_PLATFORM=offscreen)
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_store_report import make_frame
+from reports.batch_export import plan_batch, run_batch_export
+from utils.complaint_dataset import build_dataset
+from utils.pdf_exporter import export_report_to_pdf
+from reports.store_report import REPORT_COLUMNS, MONEY_COLUMNS, build_store_report, format_store_report
+from reports.catalog import STORE_REPORT_TABLE_COLUMNS
+
+
+def fill_table(table, report):
+    # 기존 화면처럼 QTableWidgetItem으로 채움 (기존 PDF 저장은 위젯 셀을 읽었음)
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtWidgets import QTableWidgetItem
+    rows = format_store_report(report)
+    table.setColumnCount(len(REPORT_COLUMNS))
+    table.setRowCount(len(rows))
+    table.setHorizontalHeaderLabels(REPORT_COLUMNS)
+    right = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    for row_idx, values in enumerate(rows):
+        for col_idx, text in enumerate(values):
+            item = QTableWidgetItem(text)
+            item.setTextAlignment(right if REPORT_COLUMNS[col_idx] in MONEY_COLUMNS else Qt.AlignmentFlag.AlignCenter)
+            table.setItem(row_idx, col_idx, item)
+
+
+def legacy_export_table_to_pdf(table, file_path, title, orientation="portrait", font_size=12):
+    # 기존 utils/pdf_exporter.export_table_to_pdf (matplotlib)
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.table import Table
+    from PyQt6.QtCore import Qt
+
+    TITLE_FONT_SIZE = 14
+    font_prop = font_manager.FontProperties(
+        family='Malgun Gothic' if sys.platform == 'win32' else 'AppleGothic',
+        size=font_size
+    )
+    pages = 0
+    with PdfPages(file_path) as pdf:
+        headers = [table.horizontalHeaderItem(i).text() for i in range(table.columnCount())]
+        rows = []
+        for row in range(table.rowCount()):
+            rows.append([table.item(row, col).text() if table.item(row, col) else "" for col in range(table.columnCount())])
+
+        table_data = [headers] + rows
+        col_count = table.columnCount()
+        col_lengths = [max(len(str(table_data[row][col])) for row in range(len(table_data))) for col in range(col_count)]
+        total_length = sum(col_lengths)
+        col_widths = [length / total_length for length in col_lengths]
+
+        global_prev_value = None
+        current_row = 0
+        page_num = 1
+        while current_row < len(table_data):
+            if orientation == 'landscape':
+                fig, ax = plt.subplots(figsize=(11.69, 8.27))
+            else:
+                fig, ax = plt.subplots(figsize=(8.27, 11.69))
+            fig.suptitle(f"{title} (p.{page_num})", fontproperties=font_prop, fontsize=TITLE_FONT_SIZE, y=0.98)
+            fig.subplots_adjust(left=0.02, right=0.98, top=0.96, bottom=0.04)
+            ax.axis('off')
+
+            rows_per_page = 30 - 1
+            end_row = min(current_row + rows_per_page, len(table_data))
+            page_rows = []
+            for i in range(current_row, end_row):
+                row = table_data[i]
+                original_first_col = row[0]
+                if original_first_col and global_prev_value == original_first_col:
+                    row = [""] + row[1:]
+                elif original_first_col:
+                    global_prev_value = original_first_col
+                if i == current_row and row[0] == "" and global_prev_value:
+                    row[0] = global_prev_value
+                page_rows.append(row)
+
+            if current_row == 0:
+                page_rows = [headers] + page_rows[1:]
+            else:
+                page_rows = [headers] + page_rows
+            while len(page_rows) < rows_per_page + 1:
+                page_rows.append([""] * col_count)
+
+            adjusted_bbox = [0.01, 0.02, 0.98, 0.96]
+            tab = Table(ax, bbox=adjusted_bbox)
+            for i, row in enumerate(page_rows):
+                for j, cell in enumerate(row):
+                    alignment = Qt.AlignmentFlag.AlignCenter
+                    if i > 0 and table.item(current_row + i - 1, j):
+                        alignment = table.item(current_row + i - 1, j).textAlignment()
+                    if alignment & Qt.AlignmentFlag.AlignLeft:
+                        cell_loc = 'left'
+                    elif alignment & Qt.AlignmentFlag.AlignRight:
+                        cell_loc = 'right'
+                    else:
+                        cell_loc = 'center'
+                    cell_height = (adjusted_bbox[3] - adjusted_bbox[1]) / len(page_rows)
+                    cell_obj = tab.add_cell(
+                        i, j, col_widths[j], cell_height, text=cell, loc=cell_loc,
+                        facecolor='#e0f0ff' if i == 0 else 'white'
+                    )
+                    cell_obj.PAD = 0.1
+                    cell_obj.get_text().set_fontproperties(font_prop)
+                    cell_obj.get_text().set_fontsize(font_size)
+                    cell_obj.get_text().set_weight("bold" if i > 0 and ">>" in row[0] else "normal")
+                    cell_obj.set_height(cell_height)
+                    if all(c == "" for c in row):
+                        cell_obj.set_edgecolor((1, 1, 1, 0))
+                        cell_obj.set_facecolor("white")
+
+            ax.add_table(tab)
+            pdf.savefig(fig)
+            plt.close(fig)
+            current_row = end_row
+            page_num += 1
+            pages += 1
+    return pages
+
+
+def timed_pages(label, func, *args):
+    start = time.perf_counter()
+    pages = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:30s} {elapsed:8.3f}s  {pages:5d}쪽  {pages / elapsed:8.1f}쪽/초")
+    return elapsed
+
+
+def sweep_workers(dataset, worker_counts: list[int], out: str):
+    # 기간별 파일 일괄 저장을 프로세스 수마다 측정 (프로세스 풀 생성/spawn 시간 포함)
+    jobs = plan_batch(dataset, ["daily_status"], "2025-03-01", "2025-03-31")
+    print(f"\n일괄 저장: 일 단위 현황 {len(jobs)}개 파일 (CPU {os.cpu_count()}개)")
+    for workers in worker_counts:
+        target = tempfile.mkdtemp(prefix="bench_batch_", dir=out)
+        start = time.perf_counter()
+        paths = run_batch_export(dataset, jobs, target, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"    프로세스 {workers:2d}개 {elapsed:8.3f}s  {len(paths) / elapsed:8.1f}파일/초")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stores", type=int, default=300)
+    parser.add_argument("--tids", type=int, default=1000)
+    parser.add_argument("--rows", type=int, default=12000)
+    parser.add_argument("--skip-legacy", action="store_true", help="기존 방식 측정 생략 (수 분 이상 걸릴 수 있음)")
+    parser.add_argument("--out", default=tempfile.gettempdir(), help="PDF를 저장할 폴더")
+    parser.add_argument("--workers", default="1,2,4", help="일괄 저장을 측정할 프로세스 수 목록 (쉼표 구분)")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication, QTableWidget
+    app = QApplication.instance() or QApplication([])
+
+    dataset = build_dataset(make_frame(args.stores, args.tids, args.rows))
+    report = build_store_report(dataset.cube.slice(2025, 3))
+    print(f"가맹점 {args.stores:,} / TID {args.tids:,} / 민원 {args.rows:,}건 → 리포트 {len(report):,}행")
+
+    new_path = os.path.join(args.out, "bench_pdf_new.pdf")
+    timed_pages("신규: reportlab 페이지 표", export_report_to_pdf,
+                report, STORE_REPORT_TABLE_COLUMNS, new_path, "가맹점 종합리포트", "landscape", 12)
+
+    if not args.skip_legacy:
+        # 한글 폰트가 없는 환경의 findfont 경고가 시간을 왜곡하지 않도록 끔
+        logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+        warnings.filterwarnings("ignore", category=UserWarning)
+        table = QTableWidget()
+        fill_table(table, report)
+        legacy_path = os.path.join(args.out, "bench_pdf_legacy.pdf")
+        timed_pages("기존: matplotlib 셀 단위", legacy_export_table_to_pdf,
+                    table, legacy_path, "가맹점 종합리포트", "landscape", 12)
+
+    sweep_workers(dataset, [int(count) for count in args.workers.split(",")], args.out)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+전체민원 검색 인덱스 벤치마크
+
+사용법:
+    python benchmarks/bench_search_index.py [--rows 200000] [--budget-ms 50]
+
+실제 전체민원 시트와 비슷한 컬럼 구성(날짜, 가맹점/카드사 등 저카디널리티 컬럼,
+금액, 승인번호/메모 같은 고카디널리티 컬럼 40개)으로 합성 데이터를 만들고,
+한 글자씩 입력하는 상황에서 키 입력당 검색 시간(화면과 같은 search_mask 경로)을 측정한다.
+첫 글자("2", "0", "1", "가")와 두 글자 검색어도 따로 재고, 가장 느린 키 입력이 --budget-ms를 넘으면 종료 코드 1을 반환한다.
+(빈 검색어가 아니면 search_mask가 실제 행 마스크를 돌려주는지도 확인한다)
+기존 방식(행마다 astype(str) 후 join 하는 DataFrame.apply)과도 비교한다.
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.search_index import RowSearchIndex
+
+SHORT_QUERIES = ["2", "0", "1", "가", "20", "01", "가맹", "고객"]
+TYPED_QUERIES = ["가맹점12", "2024-03-1", "010-12", "결제 관련 문의 777"]
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp("2024-01-01")
+    frame = {}
+    for name in ["접수일", "처리기한", "처리완료일", "취소일자", "입금일자"]:
+        frame[name] = start + pd.to_timedelta(rng.integers(0, 400, rows), unit="D")
+    stores = np.array([f"가맹점{i}" for i in range(800)], dtype=object)
+    frame["가맹점명"] = stores[rng.integers(0, 800, rows)]
+    frame["TID명"] = [f"{s}-T{t}" for s, t in zip(frame["가맹점명"], rng.integers(1, 6, rows))]
+    cards = np.array(["신한", "국민", "삼성", "현대", "롯데", "하나", "BC", "농협"], dtype=object)
+    frame["카드사"] = cards[rng.integers(0, len(cards), rows)]
+    for name in ["처리상태", "취소여부", "입금여부", "민원유형", "처리담당", "접수경로"]:
+        frame[name] = np.array([f"{name}{i}" for i in range(6)], dtype=object)[rng.integers(0, 6, rows)]
+    frame["승인금액"] = rng.integers(1_000, 900_000, rows).astype(float)
+    frame["입금금액"] = rng.integers(1_000, 900_000, rows).astype(float)
+    frame["승인번호"] = [f"{x:08d}" for x in rng.integers(0, 10**8, rows)]
+    frame["고객명"] = [f"고객{x}" for x in rng.integers(0, 50_000, rows)]
+    frame["연락처"] = [f"010-{x // 10000:04d}-{x % 10000:04d}" for x in rng.integers(0, 10**8, rows)]
+    frame["민원내용"] = [f"결제 관련 문의 {x}" for x in rng.integers(0, rows, rows)]
+    for i in range(40 - len(frame)):
+        frame[f"기타{i}"] = np.array([f"값{j}" for j in range(20)], dtype=object)[rng.integers(0, 20, rows)]
+    return pd.DataFrame(frame)
+
+
+def timed_search(index: RowSearchIndex, query: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    mask = index.search_mask(query)
+    ms = (time.perf_counter() - start) * 1000
+    # 필터를 건너뛰어 예산을 맞추지 않도록 (None은 빈 검색어에만 허용)
+    assert mask is not None and mask.dtype == bool and len(mask) == len(index), f"'{query}': 행 마스크가 아님"
+    return ms, f"{int(mask.sum()):,}행"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="키 입력당 허용 검색 시간")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    start = time.perf_counter()
+    index = RowSearchIndex(df, money_columns=["승인금액", "입금금액"])
+    print(f"{args.rows:,}행 x {len(df.columns)}컬럼, 인덱스 생성 {time.perf_counter() - start:.2f}s")
+    slowest = 0.0
+
+    print("짧은 검색어 (처음 입력):")
+    for query in SHORT_QUERIES:
+        index.reset_history()  # 직전 검색어로 좁히지 않은 첫 입력 기준
+        ms, result = timed_search(index, query)
+        slowest = max(slowest, ms)
+        print(f"    {query:20s} {ms:7.1f}ms  {result}{'  ❌' if ms > args.budget_ms else ''}")
+
+    for query in TYPED_QUERIES:
+        index.reset_history()
+        print(f"'{query}' 한 글자씩 입력:")
+        for i in range(1, len(query) + 1):
+            ms, result = timed_search(index, query[:i])
+            slowest = max(slowest, ms)
+            print(f"    {query[:i]:20s} {ms:7.1f}ms  {result}{'  ❌' if ms > args.budget_ms else ''}")
+
+    sample = df.head(20_000)
+    start = time.perf_counter()
+    sample.apply(lambda row: "가맹점12" in "".join(row.astype(str)).lower(), axis=1)
+    legacy = (time.perf_counter() - start) * args.rows / len(sample)
+    print(f"기존 DataFrame.apply 방식 (추정, {args.rows:,}행): {legacy:.0f}s / 키 입력")
+
+    over = slowest > args.budget_ms
+    print(f"\n가장 느린 키 입력 {slowest:.1f}ms, 예산 {args.budget_ms:.0f}ms: {'❌ 초과' if over else '✅ 통과'}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
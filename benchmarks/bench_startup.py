@@ -0,0 +1,130 @@
+"""
+프로그램 시작 시간 벤치마크: 첫 화면이 그려질 때까지 걸린 시간 + 모듈별 import 시간
+
+사용법:
+    python benchmarks/bench_startup.py [--runs 5] [--top 20] [--budget-ms 1500]
+
+새 파이썬 프로세스에서 main.MainWindow를 만들어 show()하고 첫 Paint 이벤트까지의 시간을 잰다.
+(프로세스 시작 → 첫 화면 / 그중 import·창 구성 시간, runs번 실행한 중앙값)
+첫 화면 시점에 무거운 모듈(reportlab, QtCharts, matplotlib, openpyxl)이 이미 import됐는지 함께 표시하고,
+`python -X importtime`으로 main import + MainWindow 구성 중 누적 import 시간이 큰 모듈을 보여준다.
+첫 화면 중앙값이 --budget-ms를 넘으면 종료 코드 1을 반환한다. (Qt 화면 없이 실행하려면 QT_QPA_PLATFORM=offscreen)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+HEAVY_MODULES = ["reportlab", "PyQt6.QtCharts", "matplotlib", "openpyxl"]
+PROJECT_PACKAGES = ("views", "widgets", "dialogs", "utils", "reports")
+# 첫 화면 모듈은 MainWindow가 importlib.import_module로 불러오는데, 그 경로는 -X importtime에 기록되지 않아 직접 import
+STARTUP_SCRIPT = (
+    "from PyQt6.QtWidgets import QApplication; app = QApplication([]); "
+    "import main; import views.complaints_view; main.MainWindow()"
+)
+
+
+def child():
+    # 측정용 자식 프로세스: import → 창 구성 → 첫 Paint 이벤트까지 시간을 JSON 한 줄로 출력
+    start = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+    import main
+    imported = time.perf_counter()
+    window = main.MainWindow()
+    built = time.perf_counter()
+    result = {}
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if not result and event.type() == QEvent.Type.Paint and getattr(obj, "window", None) and obj.window() is window:
+                result["paint"] = time.perf_counter()
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    watcher = FirstPaint()
+    app.installEventFilter(watcher)
+    window.show()
+    QTimer.singleShot(10000, app.quit)  # 그려지지 않는 환경에서도 끝나도록
+    app.exec()
+    print(json.dumps({
+        "import": imported - start,
+        "build": built - imported,
+        "paint": result.get("paint", time.perf_counter()) - start,
+        "heavy": [name for name in HEAVY_MODULES if name in sys.modules],
+    }))
+
+
+def measure_first_paint(runs: int) -> list[dict]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child"],
+            capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        sample["total"] = time.perf_counter() - started  # 자식 프로세스 종료까지 (첫 화면 직후 바로 종료)
+        samples.append(sample)
+    return samples
+
+
+def import_times(top: int) -> list[tuple[str, int]]:
+    """
+    `python -X importtime` (main import + MainWindow 구성) 결과 → (모듈, 누적 μs) 목록
+    (프로젝트 모듈 + 외부 패키지 최상위 모듈만, 표준 라이브러리 제외, 누적 시간 내림차순)
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+        capture_output=True, text=True, check=True, cwd=ROOT
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line.replace("import time:", "", 1).split("|"))
+        if name == "main" or name.startswith(PROJECT_PACKAGES) or ("." not in name and not name.startswith("_") and name not in sys.stdlib_module_names):
+            rows.append((name, int(cumulative_us)))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20, help="표시할 import 시간 상위 모듈 수")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="첫 화면까지 허용 시간 (중앙값 기준)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return 0
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    samples = measure_first_paint(args.runs)
+    median = lambda key: statistics.median(sample[key] for sample in samples) * 1000
+    print(f"첫 화면까지 ({args.runs}회 중앙값)")
+    print(f"  프로세스 시작 → 첫 화면  {median('total'):8.1f}ms  (인터프리터 시작 포함)")
+    print(f"  import main              {median('import'):8.1f}ms")
+    print(f"  MainWindow 구성           {median('build'):8.1f}ms")
+    print(f"  스크립트 시작 → 첫 Paint  {median('paint'):8.1f}ms")
+    print(f"  첫 화면 시점에 불러온 무거운 모듈: {', '.join(samples[0]['heavy']) or '없음'}")
+
+    print(f"\nimport 누적 시간 상위 {args.top}개 (main import + MainWindow 구성)")
+    for name, cumulative_us in import_times(args.top):
+        print(f"  {name:45s} {cumulative_us / 1000:8.1f}ms")
+
+    over = median("paint") > args.budget_ms
+    print(f"\n예산 {args.budget_ms:.0f}ms: {'❌ 초과' if over else '✅ 통과'}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+가맹점 종합 리포트 벤치마크: 기존 load_data 방식(그룹 6번 + merge + 소계 concat 삽입 + iterrows)
+vs reports.store_report.build_store_report (큐브 조각에서 한 번에 계산)
+
+사용법:
+    python benchmarks/bench_store_report.py [--stores 3000] [--tids 10000] [--rows 120000] [--skip-legacy]
+
+한 달치 합성 데이터를 만들어 계산 시간과 QTableWidget 채우기 시간을 따로 잰다.
+(Qt 화면 없이 실행하려면 QT_QPA_PLATFORM=offscreen)
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.complaint_dataset import build_dataset
+from reports.store_report import build_store_report, format_store_report, REPORT_COLUMNS
+
+
+def make_frame(stores: int, tids: int, rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    tid_store = rng.integers(0, stores, tids)
+    tid_store[:stores] = np.arange(stores)  # 모든 가맹점이 TID를 하나 이상 갖도록
+    tid = rng.integers(0, tids, rows)
+    return pd.DataFrame({
+        "접수일": pd.Timestamp("2025-03-01") + pd.to_timedelta(rng.integers(0, 31, rows), unit="D"),
+        "가맹점명": [f"가맹점{s}" for s in tid_store[tid]],
+        "TID명": [f"TID{t}" for t in tid],
+        "카드사": np.array(["신한", "국민", "삼성", "현대", "롯데", "하나", "BC", "농협"], dtype=object)[rng.integers(0, 8, rows)],
+        "처리상태": np.array(["Y", "N"], dtype=object)[rng.integers(0, 2, rows)],
+        "승인금액": rng.integers(1_000, 900_000, rows).astype(float),
+        "입금금액": rng.integers(1_000, 900_000, rows).astype(float),
+        "취소여부": np.array(["취소완료", ""], dtype=object)[rng.integers(0, 2, rows)],
+        "입금여부": np.array(["미입금", "입금"], dtype=object)[rng.integers(0, 2, rows)],
+        "할부": rng.choice([0, 2, 3, 6], rows).astype(float),
+    })
+
+
+def legacy_report(filtered_df: pd.DataFrame) -> pd.DataFrame:
+    # 기존 MonthlyStoreReportView.load_data 계산 부분
+    민원발생건수 = filtered_df.groupby(['가맹점명', 'TID명'], observed=True).size().reset_index(name='민원발생건수')
+    전체민원수 = filtered_df.shape[0]
+    민원발생건수['비중(%)'] = (민원발생건수['민원발생건수'] / 전체민원수 * 100).round(1)
+    처리완료_df = filtered_df[filtered_df['처리상태'] == 'Y']
+    민원처리건수 = 처리완료_df.groupby(['가맹점명', 'TID명'], observed=True).size().reset_index(name='민원처리건수')
+    결과 = 민원발생건수.merge(민원처리건수, on=['가맹점명', 'TID명'], how='left')
+    결과['민원처리건수'] = 결과['민원처리건수'].fillna(0).astype(int)
+    결과['회신율(%)'] = ((결과['민원처리건수'] / 결과['민원발생건수']) * 100).round(1)
+    거래액 = filtered_df.groupby(['가맹점명', 'TID명'], observed=True)['승인금액'].sum().reset_index(name='거래액')
+    거래액["거래액"] = 거래액["거래액"].fillna(0).astype(int)
+    취소완료_df = filtered_df[filtered_df['취소여부'] == '취소완료']
+    취소금액 = 취소완료_df.groupby(['가맹점명', 'TID명'], observed=True)['입금금액'].sum().reset_index(name='취소금액')
+    미수금_df = filtered_df[filtered_df['입금여부'] == '미입금']
+    미수금 = 미수금_df.groupby(['가맹점명', 'TID명'], observed=True)['입금금액'].sum().reset_index(name='미수금')
+    결과 = 결과.merge(거래액, on=['가맹점명', 'TID명'], how='left')
+    결과 = 결과.merge(취소금액, on=['가맹점명', 'TID명'], how='left')
+    결과 = 결과.merge(미수금, on=['가맹점명', 'TID명'], how='left')
+    결과[['취소금액', '미수금']] = 결과[['취소금액', '미수금']].fillna(0).astype(int)
+    결과['취소비율(%)'] = ((결과['취소금액'] / 결과['거래액']) * 100).round(1)
+    결과['미수비율(%)'] = ((결과['미수금'] / 결과['거래액']) * 100).round(1)
+    거래건수 = filtered_df.groupby(['가맹점명', 'TID명'], observed=True).size().reset_index(name='거래건수')
+    결과 = 결과.merge(거래건수, on=['가맹점명', 'TID명'], how='left')
+    결과['평균객단가'] = (결과['거래액'] / 결과['거래건수']).round(0).fillna(0).astype(int)
+    평균할부 = filtered_df.groupby(['가맹점명', 'TID명'], observed=True)['할부'].mean().reset_index(name='평균할부')
+    결과 = 결과.merge(평균할부, on=['가맹점명', 'TID명'], how='left')
+    결과['평균할부'] = 결과['평균할부'].fillna(0).round(1)
+    결과[['가맹점명', 'TID명']] = 결과[['가맹점명', 'TID명']].astype(str)
+    결과 = 결과.fillna("")
+
+    subtotals = []
+    for store, group in 결과.groupby('가맹점명'):
+        subtotal = {
+            "가맹점명": f"{store} >>", "TID명": "소계",
+            "민원발생건수": group["민원발생건수"].sum(),
+            "민원처리건수": group["민원처리건수"].sum(),
+            "거래액": group["거래액"].sum(),
+            "취소금액": group["취소금액"].sum(),
+            "미수금": group["미수금"].sum(),
+            "거래건수": group["거래건수"].sum(),
+            "평균객단가": 0,
+            "평균할부": round(group["평균할부"].mean(), 1),
+            "__row_type": "subtotal",
+        }
+        insert_index = 결과[결과["가맹점명"] == store].index.max() + 1
+        subtotals.append((insert_index, subtotal))
+    offset = 0
+    for idx, subtotal_row in subtotals:
+        결과 = pd.concat([결과.iloc[:idx + offset], pd.DataFrame([subtotal_row]), 결과.iloc[idx + offset:]]).reset_index(drop=True)
+        offset += 1
+    return 결과
+
+
+def legacy_render(table, 결과):
+    from PyQt6.QtWidgets import QTableWidgetItem
+    table.setColumnCount(len(REPORT_COLUMNS))
+    table.setRowCount(len(결과))
+    for row_idx, row_data in 결과.iterrows():
+        for col_idx, col_name in enumerate(REPORT_COLUMNS):
+            value = row_data.get(col_name, "")
+            table.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
+
+
+def new_render(table, report):
+    from PyQt6.QtWidgets import QTableWidgetItem
+    rows = format_store_report(report)
+    table.setUpdatesEnabled(False)
+    table.setColumnCount(len(REPORT_COLUMNS))
+    table.setRowCount(len(rows))
+    for row_idx, values in enumerate(rows):
+        for col_idx, text in enumerate(values):
+            table.setItem(row_idx, col_idx, QTableWidgetItem(text))
+    table.setUpdatesEnabled(True)
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"{label:34s} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stores", type=int, default=3000)
+    parser.add_argument("--tids", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=120000)
+    parser.add_argument("--skip-legacy", action="store_true", help="기존 방식 측정 생략 (수십 초 이상 걸릴 수 있음)")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication, QTableWidget
+    app = QApplication.instance() or QApplication([])
+
+    df = make_frame(args.stores, args.tids, args.rows)
+    print(f"가맹점 {args.stores:,} / TID {args.tids:,} / 민원 {args.rows:,}건")
+    dataset = timed("데이터셋 + 큐브 생성 (로딩 시 1회)", build_dataset, df)
+
+    report = timed("신규: 큐브 조각 + 리포트 계산", lambda: build_store_report(dataset.cube.slice(2025, 3)))
+    timed("신규: 테이블 채우기", new_render, QTableWidget(), report)
+    print(f"    리포트 행 수: {len(report):,}")
+
+    if not args.skip_legacy:
+        filtered = dataset.frame[(dataset.frame["접수년"] == 2025) & (dataset.frame["월"] == 3)]
+        legacy = timed("기존: 그룹/merge/소계 삽입", legacy_report, filtered)
+        timed("기존: iterrows 테이블 채우기", legacy_render, QTableWidget(), legacy)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
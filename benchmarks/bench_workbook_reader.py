@@ -0,0 +1,110 @@
+"""
+전체민원 워크북 로딩 벤치마크: 기존 경로(pd.ExcelFile + read_excel(dtype=str)) vs WorkbookReader
+
+사용법:
+    python benchmarks/bench_workbook_reader.py [워크북 경로] [--sheet 시트명] [--rows 150000]
+
+경로를 주지 않으면 지정한 행 수만큼 합성 워크북을 만들어 측정한다.
+각 경로는 별도 프로세스에서 실행해 로딩 시간과 최대 RSS(peak RSS)를 따로 잰다.
+"""
+import argparse
+import datetime
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def make_workbook(path: str, rows: int, sheet: str):
+    from openpyxl import Workbook
+
+    random.seed(0)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet)
+    columns = ["접수일", "가맹점명", "TID명", "카드사", "처리상태", "승인금액", "입금금액",
+               "취소여부", "입금여부", "할부", "처리기한", "처리완료일"]
+    columns += [f"비고{i}" for i in range(40 - len(columns))]
+    ws.append(columns)
+    stores = [f"가맹점{i}" for i in range(800)]
+    cards = ["신한", "국민", "삼성", "현대", "롯데", "하나", "BC", "농협"]
+    start = datetime.date(2024, 1, 1)
+    for i in range(rows):
+        day = start + datetime.timedelta(days=random.randint(0, 365))
+        store = random.choice(stores)
+        ws.append(
+            [day, store, f"{store}-T{random.randint(1, 5)}", random.choice(cards),
+             random.choice(["Y", "N"]), f"{random.randint(1000, 900000):,}", random.randint(1000, 900000),
+             random.choice(["취소완료", ""]), random.choice(["미입금", "입금"]), random.choice([0, 2, 3]),
+             day + datetime.timedelta(days=3), day + datetime.timedelta(days=2)]
+            + [f"메모 {i}-{j}" for j in range(40 - 12)]
+        )
+    wb.save(path)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run_legacy(path, sheet, queue):
+    import pandas as pd
+    from utils.excel_loader import normalize_complaints
+
+    start = time.perf_counter()
+    sheet_names = pd.ExcelFile(path).sheet_names
+    assert sheet in sheet_names
+    df = pd.read_excel(path, sheet_name=sheet, dtype=str).fillna("")
+    df = normalize_complaints(df)
+    queue.put(("legacy (ExcelFile + read_excel dtype=str)", time.perf_counter() - start, peak_rss_mb(), len(df)))
+
+
+def run_reader(path, sheet, queue):
+    from utils.excel_loader import normalize_complaints, DATE_COLUMNS, MONEY_COLUMNS
+    from utils.workbook_reader import WorkbookReader
+
+    start = time.perf_counter()
+    with WorkbookReader(path) as reader:
+        assert sheet in reader.sheet_names
+        df = reader.read_sheet(sheet, date_columns=DATE_COLUMNS, money_columns=MONEY_COLUMNS)
+    df = normalize_complaints(df)
+    queue.put(("WorkbookReader (single pass, typed)", time.perf_counter() - start, peak_rss_mb(), len(df)))
+
+
+def measure(target, path, sheet):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=target, args=(path, sheet, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--sheet", default="전체민원")
+    parser.add_argument("--rows", type=int, default=150_000)
+    args = parser.parse_args()
+
+    path = args.path
+    if path is None:
+        path = os.path.join(tempfile.gettempdir(), f"bench_complaints_{args.rows}.xlsx")
+        if not os.path.exists(path):
+            print(f"합성 워크북 생성 중: {path} ({args.rows:,}행)")
+            make_workbook(path, args.rows, args.sheet)
+
+    print(f"파일: {path} ({os.path.getsize(path) / 1024 / 1024:.1f}MB)")
+    for target in (run_legacy, run_reader):
+        name, elapsed, rss, rows = measure(target, path, args.sheet)
+        print(f"{name:45s} {elapsed:8.2f}s  peak RSS {rss:8.1f}MB  rows {rows:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import os
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QDateEdit, QCheckBox, QComboBox,
+    QRadioButton, QSpinBox, QDialogButtonBox, QGroupBox
+)
+from PyQt6.QtCore import QDate
+import pandas as pd
+from reports.catalog import REPORT_TYPES
+from reports.monthly_status import COMPARISON_MODES, DEFAULT_MODE
+
+
+class BatchExportDialog(QDialog):
+    def __init__(self, dataset, parent=None):
+        """
+        기간 + 리포트 종류를 골라 여러 리포트를 한 번에 PDF로 저장하는 설정 창
+
+        :param dataset: 공용 ComplaintDataset (기간 선택 범위를 접수일 최소/최대로 제한)
+        """
+        super().__init__(parent)
+        self.setWindowTitle("리포트 일괄 저장")
+        self.resize(360, 320)
+
+        dates = dataset.frame["접수일"]
+        first, last = _to_qdate(dates.min()), _to_qdate(dates.max())
+
+        layout = QVBoxLayout()
+        form = QFormLayout()
+
+        # 기간 (기본: 마지막 접수일이 있는 달 전체)
+        self.start_edit = QDateEdit(QDate(last.year(), last.month(), 1))
+        self.end_edit = QDateEdit(last)
+        for edit in (self.start_edit, self.end_edit):
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat("yyyy-MM-dd")
+            edit.setDateRange(first, last)
+        form.addRow("시작일", self.start_edit)
+        form.addRow("종료일", self.end_edit)
+
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(list(COMPARISON_MODES))
+        self.mode_combo.setCurrentText(DEFAULT_MODE)
+        form.addRow("증감 비교 기준", self.mode_combo)
+
+        self.worker_spin = QSpinBox()
+        self.worker_spin.setRange(1, os.cpu_count() or 1)
+        self.worker_spin.setValue(os.cpu_count() or 1)
+        form.addRow("동시 작업 수", self.worker_spin)
+        layout.addLayout(form)
+
+        # 리포트 종류
+        report_box = QGroupBox("리포트")
+        report_layout = QVBoxLayout()
+        self.report_checks = {}
+        for name, report_type in REPORT_TYPES.items():
+            check = QCheckBox(report_type.label)
+            check.setChecked(True)
+            report_layout.addWidget(check)
+            self.report_checks[name] = check
+        report_box.setLayout(report_layout)
+        layout.addWidget(report_box)
+
+        # 저장 방식
+        output_layout = QHBoxLayout()
+        self.split_radio = QRadioButton("기간별 파일")
+        self.merged_radio = QRadioButton("한 파일로 합치기")
+        self.split_radio.setChecked(True)
+        output_layout.addWidget(self.split_radio)
+        output_layout.addWidget(self.merged_radio)
+        layout.addLayout(output_layout)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        self.setLayout(layout)
+
+    def selected_reports(self) -> list[str]:
+        return [name for name, check in self.report_checks.items() if check.isChecked()]
+
+    def date_range(self) -> tuple[pd.Timestamp, pd.Timestamp]:
+        start = pd.Timestamp(self.start_edit.date().toString("yyyy-MM-dd"))
+        end = pd.Timestamp(self.end_edit.date().toString("yyyy-MM-dd"))
+        return min(start, end), max(start, end)
+
+    def comparison_mode(self) -> str:
+        return self.mode_combo.currentText()
+
+    def is_merged(self) -> bool:
+        return self.merged_radio.isChecked()
+
+    def max_workers(self) -> int:
+        return self.worker_spin.value()
+
+
+def _to_qdate(value) -> QDate:
+    value = pd.Timestamp(value)
+    return QDate(value.year, value.month, value.day)
@@ -0,0 +1,105 @@
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QProgressBar, QPushButton, QMessageBox
+from PyQt6.QtCore import Qt, QThread
+from utils.export_job import ExportWorker
+
+
+class ExportProgressDialog(QDialog):
+    def __init__(self, export, file_path: str, title: str, parent=None, unit: str = "쪽"):
+        """
+        파일 저장을 백그라운드 스레드에서 실행하면서 페이지 진행률과 취소 버튼을 보여주는 창
+
+        모달이 아니므로 저장 중에도 다른 리포트를 계속 볼 수 있다.
+        끝나면 완료/오류 메시지 상자를 띄우고 스스로 닫힌다.
+
+        :param export: ExportWorker에 넘길 저장 함수 export(file_path, on_page=..., is_cancelled=...)
+        :param file_path: 저장 경로
+        :param title: 창/메시지에 표시할 저장 대상 이름
+        :param unit: 진행률 단위 표시 ("쪽", "개 파일" 등)
+        :param parent: 부모 위젯 (부모가 닫히면 저장을 취소하고 스레드 종료를 기다림)
+        """
+        super().__init__(parent)
+        self.setWindowTitle("PDF 저장")
+        self.setModal(False)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.resize(360, 120)
+        self.title = title
+        self.unit = unit
+
+        layout = QVBoxLayout()
+        self.label = QLabel(f"{title}\n저장 준비 중...")
+        self.label.setWordWrap(True)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.cancel_button = QPushButton("취소")
+        self.cancel_button.clicked.connect(self.cancel)
+        layout.addWidget(self.label)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.cancel_button)
+        self.setLayout(layout)
+
+        self._thread = QThread()
+        self._worker = ExportWorker(export, file_path)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self.on_progress)
+        self._worker.finished.connect(self.on_finished)
+        self._worker.failed.connect(self.on_failed)
+        self._worker.cancelled.connect(self.on_cancelled)
+        for signal in (self._worker.finished, self._worker.failed, self._worker.cancelled):
+            signal.connect(self._thread.quit)
+
+    def start(self):
+        self.show()
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        return self._thread.isRunning()
+
+    def cancel(self):
+        self._worker.cancel()
+        self.cancel_button.setEnabled(False)
+        self.label.setText(f"{self.title}\n취소하는 중...")
+
+    def cancel_and_wait(self):
+        # 프로그램 종료 시 호출 (스레드가 끝나기 전에 객체가 지워지지 않도록)
+        self._worker.cancel()
+        self._thread.quit()
+        self._thread.wait()
+
+    def on_progress(self, done, total):
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+        self.label.setText(f"{self.title}\n{done:,} / {total:,}{self.unit} 저장 중...")
+
+    def on_finished(self, file_path):
+        self._finish()
+        QMessageBox.information(self.parentWidget(), "PDF 저장", f"PDF 저장 완료:\n{file_path}")
+
+    def on_failed(self, message):
+        self._finish()
+        QMessageBox.warning(self.parentWidget(), "PDF 저장", f"PDF 저장 중 오류가 발생했습니다.\n{message}")
+
+    def on_cancelled(self):
+        self._finish()
+
+    def closeEvent(self, event):
+        if self.is_running():
+            # 창을 닫으면 저장 취소 (스레드가 끝나면 on_cancelled에서 다시 닫힘)
+            self.cancel()
+            event.ignore()
+            return
+        super().closeEvent(event)
+
+    def _finish(self):
+        self._thread.quit()
+        self._thread.wait()
+        self.close()
+
+
+def start_export(parent, export, file_path: str, title: str, unit: str = "쪽") -> ExportProgressDialog:
+    """
+    저장 작업을 시작하고 진행 창을 반환
+    """
+    dialog = ExportProgressDialog(export, file_path, title, parent=parent, unit=unit)
+    dialog.start()
+    return dialog
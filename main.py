@@ -1,21 +1,37 @@
 import sys
 import os
+import importlib
+import multiprocessing
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QMainWindow, QVBoxLayout,
-    QHBoxLayout, QPushButton, QLabel, QStackedWidget, QFrame, QSizePolicy
+    QHBoxLayout, QPushButton, QLabel, QStackedWidget, QFrame, QSizePolicy,
+    QFileDialog, QDialog
 )
-from PyQt6.QtCore import Qt
-
-from views.daily_status_view import DailyStatusView
-from views.monthly_status_view import MonthlyStatusView
-from views.complaints_view import ComplaintsView
-#
-from views.unpaid_total_view import UnpaidTotalView
-from views.unpaid_by_store_view import UnpaidByStoreView
-#
-from views.monthly_store_report_view import MonthlyStoreReportView
+from PyQt6.QtCore import Qt, QThreadPool
+from functools import partial
+import pandas as pd
+
+# 리포트 화면들이 같은 데이터셋 DataFrame을 복사 없이 공유하므로,
+# 파생 DataFrame 수정이 원본에 번지지 않도록 Copy-on-Write 사용
+pd.set_option("mode.copy_on_write", True)
+
+from utils.report_cache import ReportCache
+from utils.report_prefetcher import ReportPrefetcher
+from dialogs.export_progress_dialog import ExportProgressDialog, start_export
+
+# 사이드바 순서대로 (MainWindow 속성 이름, 모듈, 클래스)
+# 첫 화면(전체민원)만 시작할 때 만들고, 나머지는 처음 열 때 모듈을 import해서 만든다.
+PAGES = [
+    ("complaints_view", "views.complaints_view", "ComplaintsView"),
+    ("daily_view", "views.daily_status_view", "DailyStatusView"),
+    ("monthly_view", "views.monthly_status_view", "MonthlyStatusView"),
+    ("monthly_store_report_view", "views.monthly_store_report_view", "MonthlyStoreReportView"),
+    ("unpaid_total_view", "views.unpaid_total_view", "UnpaidTotalView"),
+    ("unpaid_by_store_view", "views.unpaid_by_store_view", "UnpaidByStoreView"),
+]
+REPORT_PAGES = {"daily_view", "monthly_view", "monthly_store_report_view"}  # 공용 데이터셋/캐시를 받는 화면
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -49,7 +65,9 @@ class MainWindow(QMainWindow):
         main_layout = QHBoxLayout()
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
-        self.full_df = None  # 전체민원 데이터 저장용
+        self.dataset = None  # 리포트 공용 전체민원 데이터셋
+        self.report_cache = ReportCache()  # 리포트 화면 공용 계산 결과 캐시 (데이터셋이 바뀌면 비움)
+        self.report_prefetcher = ReportPrefetcher(self.report_cache)  # 인접 기간 백그라운드 계산
 
         # 사이드바 버튼 메뉴
         self.menu_items = [
@@ -86,22 +104,21 @@ class MainWindow(QMainWindow):
             btn.clicked.connect(lambda checked, idx=index: self.switch_page(idx))
             sidebar_layout.addWidget(btn)
             self.buttons.append(btn)
-        sidebar_layout.addStretch()
 
-        # 콘텐츠 영역
-        self.complaints_view = ComplaintsView()
-        self.complaints_view.data_loaded.connect(self.receive_full_data)
-        self.daily_view = DailyStatusView()
-        self.monthly_view = MonthlyStatusView()
+        # 여러 기간/리포트를 한 번에 PDF로 저장
+        self.batch_export_btn = QPushButton("리포트 일괄 저장")
+        self.batch_export_btn.setFixedHeight(45)
+        self.batch_export_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.batch_export_btn.clicked.connect(self.open_batch_export)
+        sidebar_layout.addWidget(self.batch_export_btn)
+        sidebar_layout.addStretch()
 
+        # 콘텐츠 영역 (아직 만들지 않은 화면 자리에는 빈 위젯을 두고 처음 열 때 교체)
         self.stack = QStackedWidget()
-        self.stack.addWidget(self.complaints_view)  # 전체민원 첫 페이지로
-        self.stack.addWidget(self.daily_view)
-        self.stack.addWidget(self.monthly_view)
-        self.monthly_store_report_view = MonthlyStoreReportView()
-        self.stack.addWidget(self.monthly_store_report_view)
-        self.stack.addWidget(UnpaidTotalView())
-        self.stack.addWidget(UnpaidByStoreView())
+        self.pages = [None] * len(PAGES)
+        for _ in PAGES:
+            self.stack.addWidget(QWidget())
+        self.page(0).dataset_changed.connect(self.receive_dataset)  # 전체민원 첫 페이지로
 
         self.stack.setCurrentIndex(0)  # 첫 페이지 설정
 
@@ -109,7 +126,26 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(sidebar_frame)
         main_layout.addWidget(self.stack)
 
+    def page(self, index):
+        """
+        index번 화면 (처음 요청할 때 모듈을 import해 만들고 자리 표시 위젯과 교체)
+        """
+        if self.pages[index] is None:
+            attr, module_name, class_name = PAGES[index]
+            view = getattr(importlib.import_module(module_name), class_name)()
+            if attr in REPORT_PAGES:
+                view.set_report_cache(self.report_cache, self.report_prefetcher)
+                view.set_dataset(self.dataset)
+            placeholder = self.stack.widget(index)
+            self.stack.removeWidget(placeholder)
+            self.stack.insertWidget(index, view)
+            placeholder.deleteLater()
+            self.pages[index] = view
+            setattr(self, attr, view)
+        return self.pages[index]
+
     def switch_page(self, index):
+        self.page(index)
         self.stack.setCurrentIndex(index)
 
         # 모든 버튼 기본 스타일로 리셋
@@ -123,16 +159,71 @@ class MainWindow(QMainWindow):
         self.buttons[index].style().unpolish(self.buttons[index])
         self.buttons[index].style().polish(self.buttons[index])
 
-    def receive_full_data(self, df):
-        self.full_df = df
-        self.daily_view.set_full_data(df)
-        self.monthly_view.set_full_data(df)
-        self.monthly_store_report_view.set_full_data(df)
+    def report_views(self):
+        # 이미 만든 리포트 화면만 (나머지는 만들 때 현재 데이터셋을 받음)
+        return [view for (attr, _, _), view in zip(PAGES, self.pages) if attr in REPORT_PAGES and view is not None]
+
+    def receive_dataset(self, dataset):
+        # 새 데이터셋(로딩/편집 반영)이 오면 이전 버전의 리포트 결과는 모두 버림
+        self.dataset = dataset
+        self.report_prefetcher.cancel()
+        self.report_cache.clear()
+        for view in self.report_views():
+            view.set_dataset(dataset)
+
+    def open_batch_export(self):
+        """
+        기간 + 리포트 종류를 골라 일괄 PDF 저장 (백그라운드 진행 창 + 취소)
+        """
+        if self.dataset is None or self.dataset.frame.empty:
+            print("❌ 일괄 저장할 데이터가 없습니다. 전체민원에서 엑셀을 먼저 불러오세요.")
+            return None
+
+        # 일괄 저장 모듈(reportlab PDF 생성 포함)은 처음 사용할 때 불러옴
+        from dialogs.batch_export_dialog import BatchExportDialog
+        from reports.batch_export import plan_batch, run_batch_export
+
+        dialog = BatchExportDialog(self.dataset, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return None
+        report_names = dialog.selected_reports()
+        start, end = dialog.date_range()
+        jobs = plan_batch(self.dataset, report_names, start, end, mode=dialog.comparison_mode())
+        if not jobs:
+            print("❌ 선택한 기간에 저장할 리포트가 없습니다.")
+            return None
+
+        merged = dialog.is_merged()
+        if merged:
+            target, _ = QFileDialog.getSaveFileName(self, "PDF 저장", "", "PDF Files (*.pdf)")
+        else:
+            target = QFileDialog.getExistingDirectory(self, "저장 폴더 선택")
+        if not target:
+            return None
+
+        export = partial(
+            run_batch_export, self.dataset, jobs,
+            merged=merged, max_workers=dialog.max_workers(), report_cache=self.report_cache
+        )
+        return start_export(self, export, target, "리포트 일괄 저장", unit="쪽" if merged else "개 파일")
+
+    def closeEvent(self, event):
+        # 종료 전에 백그라운드 미리 계산을 정리
+        self.report_prefetcher.cancel()
+        self.report_prefetcher.wait()
+        QThreadPool.globalInstance().waitForDone()
+        self.complaints_view.wait_rebuild()
+        # 저장 중인 PDF는 취소하고 작업 스레드가 끝날 때까지 기다림
+        for export_dialog in self.findChildren(ExportProgressDialog):
+            export_dialog.cancel_and_wait()
+        super().closeEvent(event)
 
     def apply_theme(self, mode):
         self.setStyleSheet(self.styleSheet())
 
 if __name__ == "__main__":
+    # 일괄 저장 프로세스 풀 (spawn)이 패키징된 실행 파일에서도 동작하도록
+    multiprocessing.freeze_support()
     app = QApplication([])
     window = MainWindow()
     window.show()
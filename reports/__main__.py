@@ -0,0 +1,192 @@
+"""
+리포트 명령줄 실행: GUI 없이 엑셀 파일에서 리포트를 계산해 PDF / XLSX / CSV로 저장
+
+사용법:
+    python -m reports WORKBOOK --report monthly_store_report [--report daily_status ...]
+                      [--sheet 전체민원] [--period 2025-03 | --start 2025-01-01 --end 2025-03-31]
+                      [--format pdf|xlsx|csv] [--out DIR] [--merged FILE.pdf]
+                      [--mode 전월] [--workers N] [--no-cache] [--top-n N]
+
+--period는 YYYY / YYYY-MM / YYYY-MM-DD 형식이며 일 단위 리포트에 YYYY-MM을 주면 그 달의 모든 날짜를 저장한다.
+기간을 생략하면 데이터가 있는 모든 날짜/월을 저장한다.
+차트 리포트(daily_share_chart, monthly_rate_chart)의 PDF는 Qt offscreen 플랫폼으로 그리므로
+데스크톱 세션이 없는 서버(야간 작업 등)에서도 실행된다.
+"""
+import argparse
+import os
+import sys
+import zipfile
+
+# Qt 화면 없이 차트를 그리도록 (QApplication 생성 전에 설정해야 함)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pandas as pd
+from openpyxl.utils.exceptions import InvalidFileException
+
+# 리포트 계산이 공용 DataFrame을 복사 없이 공유하므로 화면(main.py)과 같게 Copy-on-Write 사용
+pd.set_option("mode.copy_on_write", True)
+
+from reports.batch_export import plan_batch, run_batch_export, compute_job
+from reports.catalog import ALL_REPORT_TYPES
+from reports.monthly_status import COMPARISON_MODES, DEFAULT_MODE
+from utils.complaint_dataset import build_dataset
+from utils.excel_loader import read_complaints
+from utils.workbook_cache import WorkbookCache
+from utils.workbook_reader import WorkbookReader
+from widgets.report_table_model import ROW_TYPE_COLUMN
+
+FORMATS = ["pdf", "xlsx", "csv"]
+DEFAULT_SHEET = "전체민원"
+# 엑셀 형식이 아니거나(zip이 아님/xlsx 구조가 아님) 시트 내용을 읽을 수 없을 때 나는 오류
+WORKBOOK_ERRORS = (zipfile.BadZipFile, InvalidFileException, KeyError, ValueError)
+
+
+def parse_period(text: str) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    YYYY / YYYY-MM / YYYY-MM-DD → (시작일, 종료일)
+    """
+    try:
+        parts = [int(part) for part in text.split("-")]
+        if len(parts) == 1:
+            return pd.Timestamp(year=parts[0], month=1, day=1), pd.Timestamp(year=parts[0], month=12, day=31)
+        if len(parts) == 2:
+            start = pd.Timestamp(year=parts[0], month=parts[1], day=1)
+            return start, start + pd.offsets.MonthEnd(0)
+        if len(parts) == 3:
+            day = pd.Timestamp(year=parts[0], month=parts[1], day=parts[2])
+            return day, day
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"기간 형식이 올바르지 않습니다: {text} (YYYY, YYYY-MM, YYYY-MM-DD)")
+
+
+def parse_date(text: str) -> pd.Timestamp:
+    try:
+        return pd.Timestamp(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식이 올바르지 않습니다: {text} (YYYY-MM-DD)")
+
+
+def table_frame(frame: pd.DataFrame, columns=None) -> pd.DataFrame:
+    """
+    XLSX/CSV로 저장할 표 (내부 행 구분 컬럼 제거, ColumnSpec 순서/헤더 적용, 값은 서식 없이 원본 그대로)
+    """
+    frame = frame.drop(columns=[ROW_TYPE_COLUMN], errors="ignore")
+    if columns is not None:
+        frame = frame[[spec.name for spec in columns]]
+        frame.columns = [spec.title for spec in columns]
+    return frame
+
+
+def write_table(frame: pd.DataFrame, path: str, file_format: str, sheet_name: str):
+    if file_format == "xlsx":
+        frame.to_excel(path, index=False, sheet_name=sheet_name[:31])  # 엑셀 시트 이름은 31자 제한
+    else:
+        frame.to_csv(path, index=False, encoding="utf-8-sig")  # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m reports",
+        description="엑셀 파일에서 리포트를 계산해 PDF/XLSX/CSV로 저장",
+    )
+    parser.add_argument("workbook", help="전체민원 엑셀 파일 (.xlsx)")
+    parser.add_argument("--sheet", default=DEFAULT_SHEET, help=f"시트 이름 (기본: {DEFAULT_SHEET})")
+    parser.add_argument(
+        "--report", action="append", required=True, choices=list(ALL_REPORT_TYPES),
+        help="리포트 종류 (여러 번 지정 가능)"
+    )
+    parser.add_argument("--period", type=parse_period, help="기간 YYYY / YYYY-MM / YYYY-MM-DD (생략하면 전체 기간)")
+    parser.add_argument("--start", type=parse_date, help="시작일 YYYY-MM-DD (--period 대신)")
+    parser.add_argument("--end", type=parse_date, help="종료일 YYYY-MM-DD (--period 대신)")
+    parser.add_argument("--format", choices=FORMATS, default="pdf", help="저장 형식 (기본: pdf)")
+    parser.add_argument("--out", default=".", help="저장 폴더 (기본: 현재 폴더)")
+    parser.add_argument("--merged", metavar="FILE", help="표 리포트 PDF를 이 파일 하나로 합쳐 저장 (--format pdf)")
+    parser.add_argument("--mode", choices=list(COMPARISON_MODES), default=DEFAULT_MODE, help="월별 카드사 증감 비교 기준")
+    parser.add_argument("--workers", type=int, default=None, help="PDF 렌더링 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--no-cache", action="store_true", help="엑셀 변환 캐시를 사용하지 않음")
+    parser.add_argument("--top-n", type=int, default=None, help="차트 PDF에 표시할 상위 가맹점 수, 나머지는 기타 (기본: 차트별 기본값)")
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.period and (args.start or args.end):
+        parser.error("--period와 --start/--end는 함께 쓸 수 없습니다.")
+    if args.merged and args.format != "pdf":
+        parser.error("--merged는 --format pdf에서만 사용할 수 있습니다.")
+    if args.top_n is not None and args.top_n < 1:
+        parser.error("--top-n은 1 이상이어야 합니다.")
+
+    # 1) 엑셀 읽기 + 공용 데이터셋 구성 (화면 로딩과 같은 전처리/캐시)
+    try:
+        with WorkbookReader(args.workbook) as reader:
+            if args.sheet not in reader.sheet_names:
+                print(f"❌ 시트를 찾을 수 없습니다: {args.sheet} (시트 목록: {', '.join(reader.sheet_names)})")
+                return 1
+            df = read_complaints(reader, args.sheet, cache=None if args.no_cache else WorkbookCache())
+    except OSError as e:
+        print(f"❌ 엑셀 파일을 열 수 없습니다: {e}")
+        return 1
+    except WORKBOOK_ERRORS as e:
+        print(f"❌ 엑셀 파일을 읽을 수 없습니다 (.xlsx 형식인지 확인하세요): {args.workbook} ({type(e).__name__}: {e})")
+        return 1
+    dataset = build_dataset(df)
+    if dataset.empty:
+        print("❌ 리포트를 만들 데이터가 없습니다.")
+        return 1
+
+    # 2) 기간별 작업 목록
+    dates = dataset.frame["접수일"]
+    start, end = args.period or (args.start or dates.min(), args.end or dates.max())
+    report_names = list(dict.fromkeys(args.report))
+    jobs = plan_batch(dataset, report_names, start, end, mode=args.mode)
+    if not jobs:
+        print(f"❌ {start:%Y-%m-%d} ~ {end:%Y-%m-%d} 기간에 저장할 리포트가 없습니다.")
+        return 1
+    os.makedirs(args.out, exist_ok=True)
+
+    # 3) 저장
+    paths = []
+    if args.format == "pdf":
+        table_jobs = [job for job in jobs if job.report_type.chart is None]
+        chart_jobs = [job for job in jobs if job.report_type.chart is not None]
+        if table_jobs:
+            target = args.merged if args.merged else args.out
+            paths += run_batch_export(dataset, table_jobs, target, merged=bool(args.merged), max_workers=args.workers)
+        if chart_jobs:
+            from PyQt6.QtWidgets import QApplication
+            from utils.chart_renderer import ChartRenderer
+            app = QApplication.instance() or QApplication(sys.argv[:1])  # 차트 렌더링용 (offscreen, 저장이 끝날 때까지 유지)
+        renderers = {}  # 용지 방향별로 하나씩 만들어 여러 차트에 재사용
+        for job in chart_jobs:
+            frame = compute_job(dataset, job)
+            if frame.empty:
+                print(f"⚠️ 데이터가 없어 건너뜀: {job.title}")
+                continue
+            orientation = job.report_type.orientation
+            if orientation not in renderers:
+                renderers[orientation] = ChartRenderer(orientation=orientation)
+            path = os.path.join(args.out, job.file_name)
+            options = {} if args.top_n is None else {"top_n": args.top_n}
+            renderers[orientation].render_pdf(job.report_type.chart(job.title, frame, **options), path, title=job.title)
+            paths.append(path)
+    else:
+        for job in jobs:
+            frame = compute_job(dataset, job)
+            if frame.empty:
+                print(f"⚠️ 데이터가 없어 건너뜀: {job.title}")
+                continue
+            path = os.path.join(args.out, job.report_type.file_stem(job.params) + "." + args.format)
+            write_table(table_frame(frame, job.report_type.columns), path, args.format, job.report_type.label)
+            paths.append(path)
+
+    for path in paths:
+        print(path)
+    print(f"✅ 리포트 {len(paths)}개 저장 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import pandas as pd
+from reports.catalog import ALL_REPORT_TYPES
+from reports.monthly_status import DEFAULT_MODE
+from utils.export_job import ExportCancelled
+from utils.pdf_exporter import ReportSection, export_report_to_pdf, export_sections_to_pdf
+
+
+class BatchJob:
+    """
+    일괄 저장할 리포트 한 건 (리포트 종류 + 기간 params)
+    """
+
+    def __init__(self, report_type, params: tuple):
+        self.report_type = report_type
+        self.params = params
+
+    @property
+    def title(self) -> str:
+        return self.report_type.title(self.params)
+
+    @property
+    def file_name(self) -> str:
+        return self.report_type.file_stem(self.params) + ".pdf"
+
+
+def plan_batch(dataset, report_names: list, start, end, mode: str = DEFAULT_MODE) -> list[BatchJob]:
+    """
+    start~end(포함) 구간에서 데이터가 있는 날짜/월마다 선택한 리포트를 저장할 작업 목록
+
+    :param dataset: ComplaintDataset
+    :param report_names: ALL_REPORT_TYPES 키 목록 (예: ["daily_status", "monthly_store_report"])
+    :param mode: 월별 카드사 증감 현황의 비교 기준
+    """
+    jobs = []
+    for name in report_names:
+        report_type = ALL_REPORT_TYPES[name]
+        for period in report_type.periods(dataset.date_index, pd.Timestamp(start), pd.Timestamp(end)):
+            jobs.append(BatchJob(report_type, report_type.params_for(period, mode)))
+    return jobs
+
+
+def run_batch_export(
+    dataset,
+    jobs: list,
+    target: str,
+    merged: bool = False,
+    max_workers: int = None,
+    report_cache=None,
+    on_page=None,
+    is_cancelled=None
+) -> list[str]:
+    """
+    작업 목록의 리포트를 계산해 PDF로 저장
+
+    리포트 계산은 공용 데이터셋의 사전 집계로 빠르게 끝나므로 현재 프로세스에서 하고
+    (report_cache가 있으면 화면과 같은 키로 재사용/저장), 시간이 걸리는 PDF 렌더링은
+    기간별 파일마다 프로세스 풀에 나눠 CPU 코어 수만큼 동시에 실행한다.
+    merged=True이면 모든 리포트를 target 파일 하나에 섹션으로 이어 붙인다.
+    (PDF 병합 라이브러리 없이 하나의 문서로 만들어야 하므로 이 경우는 한 프로세스에서 렌더링)
+
+    :param target: 기간별 파일이면 저장 폴더, merged이면 저장할 PDF 경로
+    :param max_workers: 프로세스 수 (기본: CPU 코어 수)
+    :param on_page: on_page(완료 수, 전체 수). 기간별 파일은 파일 단위, merged는 페이지 단위
+    :param is_cancelled: True를 반환하면 남은 작업을 버리고 ExportCancelled를 던짐
+    :return: 저장한 파일 경로 목록
+    """
+    sections = []
+    for job in jobs:
+        if is_cancelled is not None and is_cancelled():
+            raise ExportCancelled()
+        frame = compute_job(dataset, job, report_cache)
+        report_type = job.report_type
+        sections.append(ReportSection(frame, report_type.columns, job.title, orientation=report_type.orientation))
+
+    if merged:
+        export_sections_to_pdf(sections, target, on_page=on_page, is_cancelled=is_cancelled)
+        return [target]
+
+    created = not os.path.isdir(target)
+    os.makedirs(target, exist_ok=True)
+    paths = [os.path.join(target, job.file_name) for job in jobs]
+    # 기간별 파일은 target 안의 숨김 임시 폴더에 쓰고 모두 성공했을 때만 target으로 옮김
+    # (취소/실패 시 이미 다 쓴 파일도 남기지 않고 임시 폴더째 삭제, 이번에 만든 저장 폴더도 삭제)
+    staging = tempfile.mkdtemp(prefix=".batch-export-", dir=target)
+    try:
+        staged = [os.path.join(staging, job.file_name) for job in jobs]
+        _render_files(sections, staged, max_workers, on_page, is_cancelled)
+        for staged_path, path in zip(staged, paths):
+            os.replace(staged_path, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        if created:
+            shutil.rmtree(target, ignore_errors=True)
+        raise
+    shutil.rmtree(staging, ignore_errors=True)
+    return paths
+
+
+def _render_files(sections: list, paths: list, max_workers=None, on_page=None, is_cancelled=None):
+    # 섹션마다 PDF 파일 하나를 프로세스 풀에서 동시에 렌더링 (풀을 벗어날 때 실행 중인 작업까지 모두 끝남)
+    # Qt 스레드가 떠 있는 프로세스에서 fork하지 않도록 spawn 사용
+    context = multiprocessing.get_context("spawn")
+    done = 0
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), mp_context=context) as executor:
+        pending = {
+            executor.submit(_render_section, section, path)
+            for section, path in zip(sections, paths)
+        }
+        try:
+            while pending:
+                finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    future.result()  # 작업 프로세스의 오류를 그대로 전달
+                    done += 1
+                    if on_page is not None:
+                        on_page(done, len(paths))
+                if is_cancelled is not None and is_cancelled():
+                    raise ExportCancelled()
+        except BaseException:
+            # 대기 중인 작업은 버리고, 실행 중인 작업만 끝날 때까지 기다림
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def compute_job(dataset, job: BatchJob, report_cache=None) -> pd.DataFrame:
+    """
+    작업의 리포트 DataFrame (report_cache가 있으면 화면과 같은 키로 재사용/저장)
+    """
+    key = (job.report_type.name, dataset.version, job.params)
+    frame = report_cache.get(key) if report_cache is not None else None
+    if frame is None:
+        frame = job.report_type.compute(dataset, job.params)
+        if report_cache is not None:
+            report_cache.put(key, frame)
+    return frame
+
+
+def _render_section(section: ReportSection, path: str) -> str:
+    # 프로세스 풀 작업 함수 (모듈 최상위에 있어야 spawn 프로세스에서 불러올 수 있음)
+    export_report_to_pdf(
+        section.frame, section.columns, path, section.title,
+        orientation=section.orientation, font_size=section.font_size
+    )
+    return path
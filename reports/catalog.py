@@ -0,0 +1,149 @@
+import pandas as pd
+from reports.charts import build_daily_share, build_monthly_rate, daily_share_chart, monthly_rate_chart
+from reports.daily_status import build_daily_status
+from reports.monthly_status import DEFAULT_MODE, build_monthly_comparison
+from reports.store_report import REPORT_COLUMNS as STORE_REPORT_COLUMNS, MONEY_COLUMNS, build_store_report
+from widgets.report_table_model import ColumnSpec, ALIGN_LEFT, ALIGN_RIGHT
+
+# 같은 가맹점의 두 번째 행부터는 접수일/가맹점명을 비워서 표시
+DAILY_STATUS_COLUMNS = [
+    ColumnSpec("접수일", kind="date", align=ALIGN_LEFT, group_by="가맹점명"),
+    ColumnSpec("가맹점명", align=ALIGN_LEFT, group_by="가맹점명"),
+    ColumnSpec("TID명"),
+    ColumnSpec("날짜별민원비중", align=ALIGN_RIGHT),
+    ColumnSpec("민원건수", align=ALIGN_RIGHT),
+    ColumnSpec("기한내처리건수", align=ALIGN_RIGHT),
+    ColumnSpec("회신율", align=ALIGN_RIGHT),
+]
+
+# 금액은 천 단위 콤마 + 오른쪽 정렬, 가맹점명은 가맹점 내 첫 상세 행에만 표시
+STORE_REPORT_TABLE_COLUMNS = [
+    ColumnSpec(col, kind="money" if col in MONEY_COLUMNS else "text", group_by="가맹점명" if col == "가맹점명" else None)
+    for col in STORE_REPORT_COLUMNS
+]
+
+
+class ReportType:
+    """
+    리포트 종류 하나의 계산/표시 규칙 (화면과 일괄 저장이 같이 사용)
+
+    params는 화면의 report_params()와 같은 튜플이라 ReportCache 키를 그대로 공유한다.
+
+    :param name: 캐시 키/파일 이름에 쓰는 이름 (화면의 report_name과 같음)
+    :param label: 표시 이름
+    :param period_unit: "day" (일 단위) / "month" (월 단위)
+    :param compute: compute(dataset, params) -> 리포트 DataFrame
+    :param columns: ColumnSpec 목록 (None이면 모든 컬럼을 가운데 정렬 문자열로)
+    :param title: title(params) -> PDF 제목
+    :param orientation: PDF 용지 방향
+    :param chart: chart(title, 리포트 DataFrame) -> QChart (차트 리포트만, PDF를 표 대신 차트로 저장)
+    """
+
+    def __init__(self, name, label, period_unit, compute, columns, title, orientation="portrait", chart=None):
+        self.name = name
+        self.label = label
+        self.period_unit = period_unit
+        self.compute = compute
+        self.columns = columns
+        self.title = title
+        self.orientation = orientation
+        self.chart = chart
+
+    def params_for(self, period: tuple, mode: str = DEFAULT_MODE) -> tuple:
+        """
+        :param period: (연, 월, 일) 또는 (연, 월)
+        """
+        year, month = period[0], period[1]
+        if self.period_unit == "day":
+            return year, month, period[2]
+        if self.name == "monthly_status":
+            return year, month, mode
+        return year, month
+
+    def periods(self, date_index, start: pd.Timestamp, end: pd.Timestamp) -> list[tuple]:
+        """
+        :return: start~end(포함) 구간에서 데이터가 있는 날짜 (연, 월, 일) 또는 월 (연, 월) 목록
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        periods = []
+        for year in date_index.years():
+            for month in date_index.months(year):
+                month_start = pd.Timestamp(year=year, month=month, day=1)
+                if month_start + pd.offsets.MonthEnd(0) < start.normalize() or month_start > end:
+                    continue
+                if self.period_unit == "month":
+                    periods.append((year, month))
+                    continue
+                for day in date_index.days(year, month):
+                    if start.normalize() <= pd.Timestamp(year=year, month=month, day=day) <= end:
+                        periods.append((year, month, day))
+        return periods
+
+    def file_stem(self, params: tuple) -> str:
+        if self.period_unit == "day":
+            return f"{self.name}_{params[0]:04d}-{params[1]:02d}-{params[2]:02d}"
+        return f"{self.name}_{params[0]:04d}-{params[1]:02d}"
+
+
+def _monthly_status(dataset, params):
+    year, month, mode = params
+    # ✅ 전체 가맹점 x 카드사 (선택월에 없더라도 포함) 기준/선택 구간 건수와 증감률을 추세 행렬에서 바로 계산
+    return build_monthly_comparison(
+        dataset.trend,
+        year,
+        month,
+        merchants=dataset.frame["가맹점명"].cat.categories,
+        cards=dataset.frame["카드사"].cat.categories,
+        mode=mode
+    )
+
+
+REPORT_TYPES = {
+    report.name: report for report in [
+        ReportType(
+            "daily_status", "일 단위 현황", "day",
+            lambda dataset, params: build_daily_status(dataset.cube, *params),
+            DAILY_STATUS_COLUMNS,
+            lambda params: f"{params[0]}년 {params[1]}월 {params[2]}일 단위 민원 리포트",
+            orientation="portrait",
+        ),
+        ReportType(
+            "monthly_status", "월별 카드사 증감 현황", "month",
+            _monthly_status,
+            None,
+            lambda params: f"{params[0]}년 {params[1]}월 단위 민원 리포트 ({params[2]})",
+            orientation="landscape",
+        ),
+        ReportType(
+            "monthly_store_report", "월별 가맹점 종합리포트", "month",
+            lambda dataset, params: build_store_report(dataset.cube.slice(*params)),
+            STORE_REPORT_TABLE_COLUMNS,
+            lambda params: f"{params[0]}년 {params[1]}월 가맹점 종합리포트",
+            orientation="landscape",
+        ),
+    ]
+}
+
+# 차트 리포트 (명령줄 실행에서 PDF는 차트, XLSX/CSV는 차트 데이터로 저장)
+CHART_TYPES = {
+    report.name: report for report in [
+        ReportType(
+            "daily_share_chart", "일 단위 가맹점별 민원 비중 차트", "day",
+            lambda dataset, params: build_daily_share(dataset.frame, *params),
+            None,
+            lambda params: f"{params[0]}-{params[1]:02d}-{params[2]:02d} 가맹점별 민원 비중 차트",
+            orientation="landscape",
+            chart=daily_share_chart,
+        ),
+        ReportType(
+            "monthly_rate_chart", "월별 가맹점별 카드사 증감률 차트", "month",
+            lambda dataset, params: build_monthly_rate(dataset.trend, *params),
+            None,
+            lambda params: f"{params[0]}-{params[1]:02d} 가맹점별 카드사 증감률",
+            orientation="landscape",
+            chart=monthly_rate_chart,
+        ),
+    ]
+}
+
+ALL_REPORT_TYPES = {**REPORT_TYPES, **CHART_TYPES}
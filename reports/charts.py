@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+from reports.trend import TrendMatrix
+
+DAILY_SHARE_COLUMNS = ["가맹점명", "민원건수", "비중"]
+MONTHLY_RATE_COLUMNS = ["가맹점명", "카드사", "전월건수", "당월건수", "증감률"]
+
+# 가맹점/카드사가 수백 개여도 차트가 읽히도록 상위 N개만 남기고 나머지는 "기타" 하나로 묶음
+OTHERS_LABEL = "기타"
+PIE_TOP_N = 15      # 파이 차트 조각 수 (기타 제외)
+BAR_TOP_N = 20      # 파일 저장용 막대 차트 가맹점 수 (화면은 이 수만큼 쪽을 나눠 표시)
+BAR_TOP_CARDS = 8   # 막대 차트 카드사 수 (기타 제외)
+
+
+def build_daily_share(frame: pd.DataFrame, year: int, month: int, day: int) -> pd.DataFrame:
+    """
+    선택일의 가맹점별 민원 건수/비중 (일 단위 파이 차트 데이터)
+
+    :param frame: 공용 ComplaintDataset.frame (접수일이 날짜 단위 datetime64)
+    :return: DAILY_SHARE_COLUMNS 컬럼의 DataFrame (건수 내림차순, 비중은 % 단위, 소수 첫째 자리)
+    """
+    filtered = frame[frame["접수일"] == pd.Timestamp(year=year, month=month, day=day)]
+    return _share_frame(filtered.groupby("가맹점명", observed=True)["TID명"].count())
+
+
+def daily_share_by_date(frame: pd.DataFrame) -> dict[pd.Timestamp, pd.DataFrame]:
+    """
+    모든 날짜의 build_daily_share() 결과를 (접수일, 가맹점명) groupby 한 번으로 미리 계산
+    (날짜를 넘길 때마다 전체 데이터를 다시 필터하지 않도록 다이얼로그를 열 때 한 번 호출)
+
+    :return: {접수일: DAILY_SHARE_COLUMNS DataFrame}
+    """
+    counts = frame.groupby(["접수일", "가맹점명"], observed=True)["TID명"].count()
+    return {
+        pd.Timestamp(day): _share_frame(group.droplevel(0))
+        for day, group in counts.groupby(level=0, sort=True)
+    }
+
+
+def _share_frame(counts: pd.Series) -> pd.DataFrame:
+    # 가맹점별 건수 → 건수 내림차순 DAILY_SHARE_COLUMNS DataFrame
+    counts = counts.sort_values(ascending=False, kind="stable")
+    total = counts.sum()
+    share = (counts / total * 100).round(1) if total else counts.astype(float)
+    return pd.DataFrame({
+        "가맹점명": counts.index.astype(str),
+        "민원건수": counts.to_numpy(),
+        "비중": share.to_numpy(),
+    })
+
+
+def build_monthly_rate(trend: TrendMatrix, year: int, month: int) -> pd.DataFrame:
+    """
+    선택월의 (가맹점, 카드사)별 전월 대비 민원 증감률 (월 단위 막대 차트 데이터)
+
+    첫 달은 전월이 없으므로 빈 DataFrame을 반환한다.
+
+    :param trend: 공용 ComplaintDataset.trend
+    :return: MONTHLY_RATE_COLUMNS 컬럼의 DataFrame (증감률은 % 단위, 전월 0건이면 0)
+             전월/당월 건수는 top_n_rate()에서 묶은 그룹의 증감률을 다시 계산할 때 사용
+    """
+    if not trend.periods or (year, month) <= trend.periods[0]:
+        return pd.DataFrame(columns=MONTHLY_RATE_COLUMNS)
+
+    # 전월/당월 건수는 추세 행렬의 열 조회로 바로 얻음 (월 변경마다 다시 피벗하지 않음)
+    pre, cur = trend.compare(year, month, months=1, lag=1)
+    return pd.DataFrame({
+        "가맹점명": np.asarray(trend.merchants, dtype=object)[trend.merchant_codes],
+        "카드사": np.asarray(trend.cards, dtype=object)[trend.card_codes],
+        "전월건수": pre,
+        "당월건수": cur,
+        "증감률": _rate(pre, cur),
+    })
+
+
+def top_n_share(report: pd.DataFrame, top_n: int | None = PIE_TOP_N) -> pd.DataFrame:
+    """
+    build_daily_share() 결과를 건수 상위 top_n개 가맹점 + "기타" 한 행으로 줄임 (top_n=None이면 그대로)
+
+    비중은 전체 합계로 다시 계산하므로 묶은 뒤에도 합이 100%가 된다.
+    """
+    if top_n is None or len(report) <= top_n:
+        return report
+    report = report.sort_values("민원건수", ascending=False, kind="stable")
+    total = report["민원건수"].sum()
+    rest = report["민원건수"].iloc[top_n:].sum()
+    others = pd.DataFrame({
+        "가맹점명": [OTHERS_LABEL],
+        "민원건수": [rest],
+        "비중": [round(rest / total * 100, 1) if total else 0.0],
+    })
+    return pd.concat([report.iloc[:top_n], others], ignore_index=True)
+
+
+def top_n_rate(report: pd.DataFrame, top_n: int | None = BAR_TOP_N, top_cards: int | None = BAR_TOP_CARDS) -> pd.DataFrame:
+    """
+    build_monthly_rate() 결과의 가맹점/카드사를 (전월+당월) 건수 순으로 정렬하고
+    상위 top_n개 가맹점 / top_cards개 카드사만 남긴 뒤 나머지는 "기타"로 묶음 (None이면 묶지 않고 정렬만)
+
+    묶은 그룹의 증감률은 전월/당월 건수 합계로 다시 계산한다. 가맹점 순서는 건수 내림차순, "기타"는 마지막.
+    """
+    if report.empty:
+        return report
+    volume = report["전월건수"] + report["당월건수"]
+    cards = _grouped_labels(report["카드사"], volume, top_cards)
+    merchants = _grouped_labels(report["가맹점명"], volume, top_n)
+    grouped = (
+        pd.DataFrame({
+            "가맹점명": merchants,
+            "카드사": cards,
+            "전월건수": report["전월건수"],
+            "당월건수": report["당월건수"],
+            "건수": volume,
+        })
+        .groupby(["가맹점명", "카드사"], sort=False)
+        .sum()
+        .reset_index()
+    )
+    # 가맹점 합계 건수 내림차순 ("기타"는 맨 뒤), 같은 가맹점 안에서는 카드사 이름순
+    merchant_total = grouped.groupby("가맹점명", sort=False)["건수"].transform("sum")
+    grouped["순서"] = merchant_total.where(grouped["가맹점명"] != OTHERS_LABEL, -1)
+    grouped = grouped.sort_values(["순서", "가맹점명", "카드사"], ascending=[False, True, True], kind="stable")
+    pre, cur = grouped["전월건수"].to_numpy(), grouped["당월건수"].to_numpy()
+    return pd.DataFrame({
+        "가맹점명": grouped["가맹점명"].to_numpy(),
+        "카드사": grouped["카드사"].to_numpy(),
+        "전월건수": pre,
+        "당월건수": cur,
+        "증감률": _rate(pre, cur),
+    })
+
+
+def _grouped_labels(labels: pd.Series, volume: pd.Series, top_n: int | None) -> np.ndarray:
+    # 건수 합계 상위 top_n개 이름은 그대로, 나머지는 OTHERS_LABEL
+    labels = labels.astype(object)
+    if top_n is None:
+        return labels.to_numpy()
+    totals = volume.groupby(labels.to_numpy(), sort=True).sum().sort_values(ascending=False, kind="stable")
+    if len(totals) <= top_n:
+        return labels.to_numpy()
+    return labels.where(labels.isin(totals.index[:top_n]), OTHERS_LABEL).to_numpy()
+
+
+def _rate(pre: np.ndarray, cur: np.ndarray) -> np.ndarray:
+    # 증감률 (% 단위, 소수 첫째 자리, 전월 0건이면 0)
+    rate = np.zeros(len(pre), dtype=float)
+    np.divide((cur - pre).astype(float), pre, out=rate, where=pre != 0)
+    return np.round(rate * 100, 1)
+
+
+def daily_share_chart_data(report: pd.DataFrame) -> dict[str, int]:
+    """
+    build_daily_share() 결과 → PieChartWidget 데이터 {가맹점명: 건수}
+    """
+    return dict(zip(report["가맹점명"].tolist(), report["민원건수"].tolist()))
+
+
+def monthly_rate_chart_data(report: pd.DataFrame) -> dict[str, dict[str, float]]:
+    """
+    build_monthly_rate() 결과 → BarChartWidget 데이터 {가맹점명: {카드사: 증감률}}
+    """
+    chart_data = {}
+    for merchant, card, value in zip(report["가맹점명"].tolist(), report["카드사"].tolist(), report["증감률"].tolist()):
+        chart_data.setdefault(merchant, {})[card] = value
+    return chart_data
+
+
+def daily_share_chart(title: str, report: pd.DataFrame, top_n: int | None = PIE_TOP_N):
+    """
+    build_daily_share() 결과로 파일 저장용 파이 차트(QChart) 생성 (상위 top_n개 + 기타, QApplication 필요)
+    """
+    from widgets.pie_chart_widget import build_pie_chart
+    return build_pie_chart(title, daily_share_chart_data(top_n_share(report, top_n)), animated=False)
+
+
+def monthly_rate_chart(title: str, report: pd.DataFrame, top_n: int | None = BAR_TOP_N):
+    """
+    build_monthly_rate() 결과로 파일 저장용 막대 차트(QChart) 생성 (상위 top_n개 가맹점 + 기타, QApplication 필요)
+    """
+    from widgets.bar_chart_widget import build_bar_chart
+    return build_bar_chart(title, monthly_rate_chart_data(top_n_rate(report, top_n)), animated=False)
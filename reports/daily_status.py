@@ -0,0 +1,41 @@
+import pandas as pd
+
+REPORT_COLUMNS = ["접수일", "가맹점명", "TID명", "날짜별민원비중", "민원건수", "기한내처리건수", "회신율"]
+
+
+def build_daily_status(cube, year: int, month: int, day: int) -> pd.DataFrame:
+    """
+    일 단위 민원 리포트 ((접수일, 가맹점명, TID명)별 건수/비중/회신율 + 합계 행)
+
+    :param cube: 데이터셋의 ComplaintCube
+    :return: REPORT_COLUMNS + "__row_type" ("detail" / "total") 컬럼의 DataFrame
+    """
+    # 사전 집계 큐브에서 선택일만 잘라 (접수일, 가맹점명, TID명) 단위로 합산
+    grouped = cube.rollup(
+        cube.slice(year, month, day),
+        ["접수일", "가맹점명", "TID명"],
+        measures=["민원건수", "처리완료건수"]
+    ).rename(columns={"처리완료건수": "기한내처리건수"})
+    grouped["회신율"] = ((grouped["기한내처리건수"] / grouped["민원건수"]) * 100).round(1).astype(str) + "%"
+    total_by_date = grouped.groupby("접수일")["민원건수"].transform("sum")
+    grouped["날짜별민원비중"] = ((grouped["민원건수"] / total_by_date) * 100).round(1).astype(str) + "%"
+    grouped = grouped[REPORT_COLUMNS].assign(__row_type="detail")
+
+    # 합계 행
+    total_mw_count = int(grouped["민원건수"].sum())
+    total_in_time = int(grouped["기한내처리건수"].sum())
+    if total_mw_count > 0:
+        reply_rate = f"{(total_in_time / total_mw_count * 100):.1f}%"
+    else:
+        reply_rate = "0.0%"
+    summary = pd.DataFrame([{
+        "접수일": pd.NaT,
+        "가맹점명": "합계",
+        "TID명": "",
+        "날짜별민원비중": "",  # 합계에서는 제외
+        "민원건수": total_mw_count,
+        "기한내처리건수": total_in_time,
+        "회신율": reply_rate,
+        "__row_type": "total",
+    }])
+    return pd.concat([grouped.astype({"가맹점명": object, "TID명": object}), summary], ignore_index=True)
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+from reports.trend import quarter_end_month
+
+NEW_LABEL = "신규"     # 기준 구간 0건, 선택 구간 발생
+ZERO_LABEL = "0.0%"    # 두 구간 모두 0건
+
+# 비교 기준: 표시 이름 -> (구간 개월 수, 기준 구간까지 간격, 기준/선택 구간 컬럼 접미사, 분기 단위 여부)
+COMPARISON_MODES = {
+    "전월 대비": {"months": 1, "lag": 1, "labels": ("전월", "당월"), "quarter": False},
+    "전년 동월 대비": {"months": 1, "lag": 12, "labels": ("전년동월", "당월"), "quarter": False},
+    "직전 3개월 대비": {"months": 3, "lag": 3, "labels": ("직전3개월", "최근3개월"), "quarter": False},
+    "전분기 대비": {"months": 3, "lag": 3, "labels": ("전분기", "당분기"), "quarter": True},
+    "전년 동분기 대비": {"months": 3, "lag": 12, "labels": ("전년동분기", "당분기"), "quarter": True},
+}
+DEFAULT_MODE = "전월 대비"
+
+
+def change_labels(previous: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """
+    기준 구간 대비 증감률 문자열 ("12.5%", 기준 구간이 0건이면 "신규" 또는 "0.0%")
+    """
+    rate = np.zeros(previous.shape, dtype=float)
+    np.divide((current - previous).astype(float), previous, out=rate, where=previous != 0)
+    rate *= 100
+    # 비율 값 종류는 많지 않으므로 고유값만 문자열로 만든 뒤 펼침
+    values, inverse = np.unique(rate, return_inverse=True)
+    labels = np.array([f"{v:.1f}%" for v in values.tolist()], dtype=object)[inverse].reshape(rate.shape)
+    labels[(previous == 0) & (current > 0)] = NEW_LABEL
+    labels[(previous == 0) & (current <= 0)] = ZERO_LABEL
+    return labels
+
+
+def build_monthly_comparison(trend, year: int, month: int, merchants=None, cards=None,
+                             mode: str = DEFAULT_MODE) -> pd.DataFrame:
+    """
+    월별 카드사 증감 현황 (가맹점 x 카드사별 기준 구간/선택 구간/증감률)을 한 번에 계산한다.
+
+    :param trend: 데이터셋의 TrendMatrix
+    :param merchants: 행으로 표시할 가맹점 목록 (기본: 데이터셋 전체 가맹점)
+    :param cards: 표시할 카드사 목록 (기본: 데이터셋 전체 카드사)
+    :param mode: COMPARISON_MODES의 비교 기준 (기본: 전월 대비)
+    :return: 가맹점명, {카드사}_{기준}, {카드사}_{선택}, {카드사}_증감률 ... 컬럼의 DataFrame
+    """
+    setting = COMPARISON_MODES[mode]
+    merchants = list(trend.merchants if merchants is None else merchants)
+    cards = list(trend.cards if cards is None else cards)
+    if setting["quarter"]:
+        month = quarter_end_month(month)
+
+    base_counts, current_counts = trend.compare(year, month, setting["months"], setting["lag"])
+    previous = trend.grid(base_counts, merchants, cards)
+    current = trend.grid(current_counts, merchants, cards)
+    labels = change_labels(previous, current)
+
+    base_label, current_label = setting["labels"]
+    columns = {"가맹점명": merchants}
+    for j, card in enumerate(cards):
+        columns[f"{card}_{base_label}"] = previous[:, j]
+        columns[f"{card}_{current_label}"] = current[:, j]
+        columns[f"{card}_증감률"] = labels[:, j]
+    return pd.DataFrame(columns)
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+REPORT_COLUMNS = [
+    "가맹점명", "TID명", "민원발생건수", "비중(%)", "민원처리건수", "회신율(%)", "거래액", "취소금액",
+    "미수금", "취소비율(%)", "미수비율(%)", "거래건수", "평균객단가", "평균할부"
+]
+MONEY_COLUMNS = ["거래액", "취소금액", "미수금", "평균객단가"]
+SUM_COLUMNS = ["민원발생건수", "민원처리건수", "거래액", "취소금액", "미수금", "할부합계"]
+
+ROW_DETAIL = "detail"
+ROW_SUBTOTAL = "subtotal"
+ROW_TOTAL = "total"
+
+
+def build_store_report(cells: pd.DataFrame) -> pd.DataFrame:
+    """
+    가맹점 종합 리포트 (TID별 상세 + 가맹점 소계 + 합계)를 한 번에 만든다.
+
+    (가맹점명, TID명) 단위로 한 번 집계한 뒤 소계/합계는 그 결과를 다시 합산하고,
+    세 종류 행을 이어 붙여 가맹점 순서대로 한 번에 정렬한다. 비율/평균 컬럼은 마지막에
+    전체 행에 대해 한 번만 계산하므로 소계/합계도 상세 행과 같은 규칙을 따른다.
+
+    :param cells: ComplaintCube 조각 (민원건수, 처리완료건수, 승인금액, 취소금액, 미수금, 할부합계 컬럼)
+    :return: REPORT_COLUMNS + "__row_type" ("detail" / "subtotal" / "total") 컬럼의 DataFrame
+             (상세 행의 가맹점명은 모두 채워 두고, 중복 표시 제거는 화면/PDF 쪽에서 한다)
+    """
+    detail = cells.groupby(["가맹점명", "TID명"], observed=True, sort=True).agg(
+        민원발생건수=("민원건수", "sum"),
+        민원처리건수=("처리완료건수", "sum"),
+        거래액=("승인금액", "sum"),
+        취소금액=("취소금액", "sum"),
+        미수금=("미수금", "sum"),
+        할부합계=("할부합계", "sum"),
+    ).reset_index()
+    detail["가맹점명"] = detail["가맹점명"].astype(str)
+    detail["TID명"] = detail["TID명"].astype(str)
+    # 금액은 TID 단위에서 원 단위로 자른 뒤 소계/합계를 낸다
+    detail[["거래액", "취소금액", "미수금"]] = detail[["거래액", "취소금액", "미수금"]].astype(np.int64)
+
+    store_codes, stores = pd.factorize(detail["가맹점명"], sort=False)
+    subtotal = detail.groupby(store_codes, sort=True)[SUM_COLUMNS].sum()
+    total = detail[SUM_COLUMNS].sum().to_frame().T
+
+    subtotal.insert(0, "가맹점명", [f"{store} >>" for store in stores])
+    subtotal.insert(1, "TID명", "소계")
+    total.insert(0, "가맹점명", "합계")
+    total.insert(1, "TID명", "")
+
+    detail["__row_type"] = ROW_DETAIL
+    subtotal["__row_type"] = ROW_SUBTOTAL
+    total["__row_type"] = ROW_TOTAL
+
+    # 정렬 키: 가맹점 순서 * 2 + (상세 0 / 소계 1), 합계는 맨 끝
+    sort_key = np.concatenate([
+        store_codes.astype(np.int64) * 2,
+        np.arange(len(stores), dtype=np.int64) * 2 + 1,
+        [len(stores) * 2],
+    ])
+    report = pd.concat([detail, subtotal.reset_index(drop=True), total], ignore_index=True)
+    report = report.iloc[np.argsort(sort_key, kind="stable")].reset_index(drop=True)
+    report[SUM_COLUMNS] = report[SUM_COLUMNS].astype(np.int64)
+
+    count = report["민원발생건수"].to_numpy(dtype=float)
+    amount = report["거래액"].to_numpy(dtype=float)
+    all_count = float(total["민원발생건수"].iloc[0])
+
+    report["비중(%)"] = _rate(count, np.full(len(report), all_count))
+    report["회신율(%)"] = _rate(report["민원처리건수"].to_numpy(dtype=float), count)
+    report["취소비율(%)"] = _rate(report["취소금액"].to_numpy(dtype=float), amount)
+    report["미수비율(%)"] = _rate(report["미수금"].to_numpy(dtype=float), amount)
+    report["거래건수"] = report["민원발생건수"]
+    report["평균객단가"] = np.round(_rate(amount, count, scale=1, decimals=None)).astype(np.int64)
+    report["평균할부"] = _rate(report["할부합계"].to_numpy(dtype=float), count, scale=1)
+
+    return report[REPORT_COLUMNS + ["__row_type"]]
+
+
+def store_count(report: pd.DataFrame) -> int:
+    return int((report["__row_type"] == ROW_SUBTOTAL).sum())
+
+
+def format_store_report(report: pd.DataFrame) -> list[list[str]]:
+    """
+    화면/PDF 표시용 문자열 행렬 (컬럼 단위로 한 번에 변환, 가맹점 내 첫 상세 행에만 가맹점명 표시)
+    """
+    stores = report["가맹점명"]
+    repeated = (report["__row_type"] == ROW_DETAIL) & (stores == stores.shift()) \
+        & (report["__row_type"].shift() == ROW_DETAIL)
+    report = report.assign(가맹점명=stores.where(~repeated, ""))
+    columns = []
+    for col in REPORT_COLUMNS:
+        values = report[col]
+        if col in MONEY_COLUMNS:
+            columns.append([f"{v:,}" for v in values.tolist()])
+        else:
+            columns.append([str(v) for v in values.tolist()])
+    return [list(row) for row in zip(*columns)]
+
+
+def _rate(numerator: np.ndarray, denominator: np.ndarray, scale: float = 100, decimals=1) -> np.ndarray:
+    # 분모가 0인 행은 0
+    out = np.zeros(len(numerator), dtype=float)
+    np.divide(numerator * scale, denominator, out=out, where=denominator != 0)
+    return out if decimals is None else np.round(out, decimals)
@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+
+class TrendMatrix:
+    """
+    (가맹점명, 카드사) x 월 민원건수 행렬
+
+    데이터셋마다 큐브에서 한 번만 만들고, 월 단위 누적합을 같이 보관해 둔다.
+    N개월 누적, 전년 동월 대비, 분기 합계 같은 기간 조회는 모두 누적합 두 열의 차이로 계산한다.
+    (원본 행을 다시 그룹핑하지 않음)
+
+    periods는 첫 달부터 마지막 달까지 빠짐없이 이어진 (연, 월) 목록이며, 범위 밖 기간은 0건으로 본다.
+    """
+
+    def __init__(self, merchants, cards, merchant_codes, card_codes, counts, first_period: int):
+        """
+        :param merchants: 가맹점명 목록 (merchant_codes가 가리키는 값)
+        :param cards: 카드사 목록 (card_codes가 가리키는 값)
+        :param merchant_codes: 행(조합)별 가맹점 코드
+        :param card_codes: 행(조합)별 카드사 코드
+        :param counts: 조합 x 월 건수 행렬
+        :param first_period: 첫 달의 월 번호 (연 * 12 + 월 - 1)
+        """
+        self.merchants = list(merchants)
+        self.cards = list(cards)
+        self.merchant_codes = np.asarray(merchant_codes, dtype=np.int64)
+        self.card_codes = np.asarray(card_codes, dtype=np.int64)
+        self.counts = counts
+        self.first_period = first_period
+        # 앞에 0열을 붙인 누적합: 구간 [a, b) 합계 = cumulative[:, b] - cumulative[:, a]
+        self._cumulative = np.zeros((counts.shape[0], counts.shape[1] + 1), dtype=np.int64)
+        np.cumsum(counts, axis=1, out=self._cumulative[:, 1:])
+
+    @property
+    def periods(self) -> list[tuple[int, int]]:
+        return [(p // 12, p % 12 + 1) for p in range(self.first_period, self.first_period + self.counts.shape[1])]
+
+    def __len__(self):
+        return self.counts.shape[0]
+
+    # ---- 기간 조회 (조합별 건수 배열) ----
+
+    def window(self, year: int, month: int, months: int = 1) -> np.ndarray:
+        """
+        (year, month)로 끝나는 months개월 누적 건수
+        """
+        end = self._position(year, month) + 1
+        n_periods = self.counts.shape[1]
+        start = min(max(end - months, 0), n_periods)
+        end = min(max(end, 0), n_periods)
+        return self._cumulative[:, end] - self._cumulative[:, start]
+
+    def month(self, year: int, month: int) -> np.ndarray:
+        return self.window(year, month, 1)
+
+    def quarter(self, year: int, quarter: int) -> np.ndarray:
+        return self.window(year, quarter * 3, 3)
+
+    def compare(self, year: int, month: int, months: int = 1, lag: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        :return: (기준 구간 건수, 선택 구간 건수). 기준 구간은 선택 구간을 lag개월 앞으로 옮긴 것
+                 (전월 대비: months=1, lag=1 / 전년 동월 대비: months=1, lag=12 / 전분기 대비: months=3, lag=3)
+        """
+        base_year, base_month = shift_month(year, month, -lag)
+        return self.window(base_year, base_month, months), self.window(year, month, months)
+
+    def yoy(self, year: int, month: int, months: int = 1) -> np.ndarray:
+        # 전년 같은 구간 대비 증감 건수
+        previous, current = self.compare(year, month, months, lag=12)
+        return current - previous
+
+    # ---- 표시용 변환 ----
+
+    def grid(self, values: np.ndarray, merchants=None, cards=None) -> np.ndarray:
+        """
+        조합별 값을 (가맹점 x 카드사) 행렬로 펼침 (목록에 없는 가맹점/카드사는 제외, 없는 조합은 0)
+        """
+        merchant_rows = self._remap(self.merchants, merchants)
+        card_cols = self._remap(self.cards, cards)
+        shape = (len(self.merchants) if merchants is None else len(merchants),
+                 len(self.cards) if cards is None else len(cards))
+        out = np.zeros(shape, dtype=values.dtype)
+        rows = merchant_rows[self.merchant_codes]
+        cols = card_cols[self.card_codes]
+        valid = (rows >= 0) & (cols >= 0)
+        out[rows[valid], cols[valid]] = values[valid]
+        return out
+
+    def _position(self, year: int, month: int) -> int:
+        return year * 12 + month - 1 - self.first_period
+
+    @staticmethod
+    def _remap(source, target) -> np.ndarray:
+        # source 위치 → target 위치 (target에 없으면 -1)
+        if target is None:
+            return np.arange(len(source), dtype=np.int64)
+        return pd.Index(list(target)).get_indexer(list(source)).astype(np.int64)
+
+
+def shift_month(year: int, month: int, offset: int) -> tuple[int, int]:
+    index = year * 12 + month - 1 + offset
+    return index // 12, index % 12 + 1
+
+
+def quarter_end_month(month: int) -> int:
+    return (month - 1) // 3 * 3 + 3
+
+
+def build_trend_matrix(cube) -> TrendMatrix:
+    """
+    ComplaintCube에서 (가맹점명, 카드사) x 월 건수 행렬을 만든다.
+    """
+    table = cube.table
+    merchant_codes, merchants = _codes(table["가맹점명"])
+    card_codes, cards = _codes(table["카드사"])
+    if table.empty:
+        return TrendMatrix(merchants, cards, [], [], np.zeros((0, 0), dtype=np.int64), 0)
+
+    period = table["접수년"].to_numpy(dtype=np.int64) * 12 + table["월"].to_numpy(dtype=np.int64) - 1
+    first_period = int(period.min())
+    n_periods = int(period.max()) - first_period + 1
+
+    pair_key = merchant_codes.astype(np.int64) * len(cards) + card_codes
+    pairs, pair_index = np.unique(pair_key, return_inverse=True)
+    flat = pair_index * n_periods + (period - first_period)
+    counts = np.bincount(flat, weights=table["민원건수"].to_numpy(), minlength=len(pairs) * n_periods)
+    counts = counts.astype(np.int64).reshape(len(pairs), n_periods)
+
+    return TrendMatrix(merchants, cards, pairs // len(cards), pairs % len(cards), counts, first_period)
+
+
+def _codes(series: pd.Series):
+    # 카테고리 컬럼이면 코드/카테고리를 그대로, 아니면 factorize
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy().astype(np.int64), series.cat.categories
+    codes, values = pd.factorize(series.astype(str), sort=True)
+    return codes.astype(np.int64), pd.Index(values)
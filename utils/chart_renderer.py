@@ -0,0 +1,124 @@
+from PyQt6.QtCore import QMarginsF, QPointF, QRectF, QSizeF, Qt
+from PyQt6.QtGui import QColor, QImage, QPageLayout, QPageSize, QPainter, QPdfWriter, QPicture
+from PyQt6.QtWidgets import QGraphicsScene
+from PyQt6.QtCharts import QChart
+from utils.export_job import ExportCancelled
+
+LOGICAL_DPI = 96    # 차트 레이아웃 기준 해상도 (폰트 pt와 여백 비율이 화면 차트와 같아지도록)
+DEFAULT_DPI = 300
+PAGE_MARGIN_MM = 10
+
+
+class ChartRenderer:
+    """
+    QChart를 화면 위젯 없이 그려 PDF(벡터) / PNG로 저장하는 렌더러
+
+    데이터로 새로 만든 QChart를 받아 애니메이션을 끄고, 창 크기와 상관없이 용지 본문 크기
+    (LOGICAL_DPI 기준)로 배치해 QPicture(벡터 그리기 명령)로 기록한 뒤 목표 DPI로 확대해 쓴다.
+    화면에 표시 중인 위젯은 건드리지 않는다.
+
+    QtCharts는 GUI 스레드에서만 안전하게 그릴 수 있으므로 record()는 GUI 스레드에서 호출하고
+    (차트 하나에 수 ms), 시간이 걸리는 파일 쓰기 write_pdf()/write_png()는 작업 스레드에서 해도 된다.
+    같은 렌더러로 여러 차트를 이어서 기록/저장할 수 있다.
+
+    :param orientation: "portrait" / "landscape"
+    :param dpi: PDF 해상도 / PNG 픽셀 밀도
+    """
+
+    def __init__(self, orientation: str = "landscape", dpi: int = DEFAULT_DPI, margin_mm: float = PAGE_MARGIN_MM):
+        self.dpi = dpi
+        self.page_layout = QPageLayout(
+            QPageSize(QPageSize.PageSizeId.A4),
+            QPageLayout.Orientation.Landscape if orientation == "landscape" else QPageLayout.Orientation.Portrait,
+            QMarginsF(margin_mm, margin_mm, margin_mm, margin_mm),
+            QPageLayout.Unit.Millimeter,
+        )
+        self._scene = QGraphicsScene()
+
+    def logical_size(self) -> QSizeF:
+        """
+        용지 본문 영역 크기 (LOGICAL_DPI 기준 px)
+        """
+        body = self.page_layout.paintRect(QPageLayout.Unit.Inch)
+        return QSizeF(body.width() * LOGICAL_DPI, body.height() * LOGICAL_DPI)
+
+    def record(self, chart: QChart) -> QPicture:
+        """
+        차트를 용지 본문 크기로 배치해 QPicture로 기록 (GUI 스레드에서 호출)
+        """
+        size = self.logical_size()
+        source = QRectF(QPointF(0, 0), size)
+        chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
+        self._scene.addItem(chart)
+        picture = QPicture()
+        try:
+            chart.setGeometry(source)
+            self._scene.setSceneRect(source)
+            painter = QPainter(picture)
+            try:
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+                self._scene.render(painter, source, source)
+            finally:
+                painter.end()
+        finally:
+            self._scene.removeItem(chart)
+        return picture
+
+    def write_pdf(self, picture: QPicture, file_path: str, title: str = "", on_page=None, is_cancelled=None):
+        """
+        record()한 차트를 한 페이지 벡터 PDF로 저장 (작업 스레드에서 호출 가능, ExportWorker용 진행/취소 콜백 지원)
+        """
+        if is_cancelled is not None and is_cancelled():
+            raise ExportCancelled()
+        writer = QPdfWriter(file_path)
+        writer.setResolution(self.dpi)
+        writer.setPageLayout(self.page_layout)
+        writer.setTitle(title)
+        painter = QPainter(writer)
+        try:
+            self._play(picture, painter, writer.width(), writer.height())
+        finally:
+            painter.end()
+        if on_page is not None:
+            on_page(1, 1)
+
+    def write_image(self, picture: QPicture) -> QImage:
+        """
+        record()한 차트를 목표 DPI의 QImage로 래스터화 (작업 스레드에서 호출 가능)
+        """
+        size = self.logical_size()
+        scale = self.dpi / LOGICAL_DPI
+        image = QImage(round(size.width() * scale), round(size.height() * scale), QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(QColor(Qt.GlobalColor.white))
+        dots_per_meter = round(self.dpi / 0.0254)
+        image.setDotsPerMeterX(dots_per_meter)
+        image.setDotsPerMeterY(dots_per_meter)
+        painter = QPainter(image)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            self._play(picture, painter, image.width(), image.height())
+        finally:
+            painter.end()
+        return image
+
+    def write_png(self, picture: QPicture, file_path: str):
+        if not self.write_image(picture).save(file_path, "PNG"):
+            raise OSError(f"PNG 저장 실패: {file_path}")
+
+    def render_pdf(self, chart: QChart, file_path: str, title: str = ""):
+        # 기록 + 저장을 한 번에 (GUI 스레드 / 명령줄 실행용)
+        self.write_pdf(self.record(chart), file_path, title=title)
+
+    def render_png(self, chart: QChart, file_path: str):
+        self.write_png(self.record(chart), file_path)
+
+    def _play(self, picture: QPicture, painter: QPainter, width: int, height: int):
+        # 기록 크기(LOGICAL_DPI) → 출력 장치 크기로 확대 (가로/세로 비율 유지)
+        # QPicture는 재생할 때 기록 DPI → 장치 DPI 비율만큼 스스로 확대되므로 그만큼은 빼고 맞춤
+        size = self.logical_size()
+        auto_scale = painter.device().logicalDpiX() / picture.logicalDpiX()
+        scale = min(width / size.width(), height / size.height()) / auto_scale
+        painter.scale(scale, scale)
+        painter.drawPicture(0, 0, picture)
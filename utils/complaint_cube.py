@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+from utils.date_index import DateIndex
+
+CUBE_KEYS = ["접수일", "가맹점명", "TID명", "카드사"]
+CUBE_MEASURES = ["민원건수", "처리완료건수", "승인금액", "입금금액", "취소금액", "미수금", "할부합계"]
+
+
+class ComplaintCube:
+    """
+    (접수일, 가맹점명, TID명, 카드사) 단위로 미리 집계해 둔 전체민원 큐브
+
+    데이터셋 버전마다 한 번만 만들고, 리포트 화면들은 원본 행 대신 큐브를 잘라 다시 합산한다.
+    (건수/합계만 보관하므로 어떤 상위 단위로 합산해도 원본에서 바로 집계한 값과 같다)
+
+    table 컬럼:
+        접수일 / 가맹점명 / TID명 / 카드사: 키 (접수일 오름차순 정렬)
+        접수년 / 월 / 일: 접수일에서 계산한 기간 컬럼
+        민원건수: 행 수
+        처리완료건수: 처리상태가 'Y'(대소문자 무시)인 행 수
+        승인금액 / 입금금액: 합계
+        취소금액: 취소여부가 '취소완료'인 행의 입금금액 합계
+        미수금: 입금여부가 '미입금'인 행의 입금금액 합계
+        할부합계: 할부 합계 (평균할부 = 할부합계 / 민원건수)
+    """
+
+    def __init__(self, table: pd.DataFrame):
+        self.table = table
+        self.date_index = DateIndex(table["접수일"])
+
+    @property
+    def empty(self) -> bool:
+        return self.table.empty
+
+    def __len__(self):
+        return len(self.table)
+
+    def slice(self, year: int, month: int = None, day: int = None) -> pd.DataFrame:
+        """
+        선택한 연/월/일에 해당하는 큐브 행만 반환 (접수일 정렬 구간을 복사 없이 잘라냄)
+        """
+        start, stop = self.date_index.range(year, month, day)
+        return self.table.iloc[start:stop]
+
+    @staticmethod
+    def rollup(cells: pd.DataFrame, by: list[str], measures=None) -> pd.DataFrame:
+        """
+        큐브 조각을 by 단위로 다시 합산 (by 컬럼은 일반 컬럼으로 반환)
+        """
+        measures = list(measures or CUBE_MEASURES)
+        return cells.groupby(by, observed=True, sort=True)[measures].sum().reset_index()
+
+
+def build_cube(frame: pd.DataFrame) -> ComplaintCube:
+    """
+    ComplaintDataset.frame(접수일 정규화, 카테고리/숫자 컬럼 변환 완료)에서 큐브를 만든다.
+    """
+    deposit = _numeric(frame, "입금금액")
+    measures = pd.DataFrame({
+        "민원건수": np.ones(len(frame), dtype=np.int64),
+        "처리완료건수": _text(frame, "처리상태").str.lower().eq("y").astype(np.int64).to_numpy(),
+        "승인금액": _numeric(frame, "승인금액"),
+        "입금금액": deposit,
+        "취소금액": np.where(_text(frame, "취소여부").eq("취소완료").to_numpy(), deposit, 0.0),
+        "미수금": np.where(_text(frame, "입금여부").eq("미입금").to_numpy(), deposit, 0.0),
+        "할부합계": _numeric(frame, "할부"),
+    })
+    for key in CUBE_KEYS:
+        measures[key] = frame[key].array if key in frame.columns else ""
+
+    table = measures.groupby(CUBE_KEYS, observed=True, sort=True, dropna=False)[CUBE_MEASURES].sum().reset_index()
+    received = table["접수일"]
+    table.insert(1, "접수년", received.dt.year.astype("int16"))
+    table.insert(2, "월", received.dt.month.astype("int8"))
+    table.insert(3, "일", received.dt.day.astype("int8"))
+    return ComplaintCube(table)
+
+
+def _text(frame: pd.DataFrame, col: str) -> pd.Series:
+    if col not in frame.columns:
+        return pd.Series("", index=frame.index)
+    return frame[col].astype(str)
+
+
+def _numeric(frame: pd.DataFrame, col: str) -> np.ndarray:
+    if col not in frame.columns:
+        return np.zeros(len(frame))
+    return pd.to_numeric(frame[col], errors="coerce").fillna(0.0).to_numpy(dtype=float)
@@ -0,0 +1,79 @@
+import itertools
+import numpy as np
+import pandas as pd
+from utils.complaint_cube import ComplaintCube, build_cube
+from utils.date_index import DateIndex
+from reports.trend import build_trend_matrix
+
+CATEGORY_COLUMNS = ["가맹점명", "카드사", "TID명"]
+NUMERIC_COLUMNS = ["승인금액", "입금금액", "할부"]
+
+_versions = itertools.count(1)
+
+
+class ComplaintDataset:
+    """
+    모든 리포트 화면이 공유하는 정규화된 전체민원 데이터
+
+    build_dataset()으로 로딩 직후 한 번만 만들고, 화면들은 frame을 읽기 전용으로 사용한다.
+    (복사나 컬럼 재계산 없이 필터/그룹만 수행)
+    데이터가 바뀔 때마다 새 객체가 만들어지며 version으로 구분한다.
+
+    frame은 접수일 오름차순으로 정렬되어 있고, date_index로 기간별 행 구간을 바로 찾는다.
+    (period_frame()은 복사 없는 iloc 구간 조회)
+
+    frame 컬럼:
+        접수일: datetime64 (시각 제거, 접수일이 없는 행은 제외)
+        접수년: int16, 월: int8, 일: int8
+        가맹점명 / 카드사 / TID명: category (앞뒤 공백 제거)
+        승인금액 / 입금금액 / 할부: float64 (변환 실패는 0)
+
+    cube는 같은 버전의 frame에서 만든 사전 집계 큐브 (ComplaintCube 참고),
+    trend는 큐브에서 만든 (가맹점, 카드사) x 월 건수 행렬 (TrendMatrix 참고)
+    """
+
+    def __init__(self, frame: pd.DataFrame, version: int, cube: ComplaintCube = None):
+        self.frame = frame
+        self.version = version
+        self.date_index = DateIndex(frame["접수일"])
+        self.cube = cube if cube is not None else build_cube(frame)
+        self.trend = build_trend_matrix(self.cube)
+
+    @property
+    def empty(self) -> bool:
+        return self.frame.empty
+
+    def __len__(self):
+        return len(self.frame)
+
+    def period_frame(self, year: int, month: int = None, day: int = None) -> pd.DataFrame:
+        start, stop = self.date_index.range(year, month, day)
+        return self.frame.iloc[start:stop]
+
+
+def build_dataset(df: pd.DataFrame) -> ComplaintDataset:
+    """
+    편집용 전체민원 DataFrame에서 리포트 공용 데이터셋을 만든다. (원본 df는 변경하지 않음)
+    """
+    received = pd.to_datetime(df["접수일"], errors="coerce")
+    keep = received.notna().to_numpy()
+
+    # 접수일 순으로 정렬해 두면 기간 선택이 연속 구간이 된다 (같은 날짜는 원래 순서 유지)
+    received = received[keep].dt.normalize()
+    order = np.argsort(received.to_numpy(), kind="stable")
+    frame = df.loc[keep].iloc[order].reset_index(drop=True)
+    received = received.iloc[order].reset_index(drop=True)
+    frame["접수일"] = received
+    frame["접수년"] = received.dt.year.astype("int16")
+    frame["월"] = received.dt.month.astype("int8")
+    frame["일"] = received.dt.day.astype("int8")
+
+    for col in CATEGORY_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].astype(str).str.strip().astype("category")
+
+    for col in NUMERIC_COLUMNS:
+        if col in frame.columns:
+            frame[col] = pd.to_numeric(frame[col], errors="coerce").fillna(0.0).astype("float64")
+
+    return ComplaintDataset(frame, next(_versions))
@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class DateIndex:
+    """
+    접수일 오름차순으로 정렬된 행에 대한 (연, 월, 일) → 행 구간 인덱스
+
+    날짜가 바뀌는 위치만 기억해 두고, 기간 선택은 날짜 경계를 이진 탐색해
+    (start, stop) 구간으로 돌려준다. 콤보박스에 넣을 연/월/일 목록도 여기서 바로 만든다.
+    """
+
+    def __init__(self, dates):
+        """
+        :param dates: 오름차순 정렬된 날짜 배열 (datetime64, 시각은 무시)
+        """
+        values = np.asarray(dates, dtype="datetime64[D]")
+        if len(values) and (values[1:] < values[:-1]).any():
+            raise ValueError("DateIndex는 접수일 오름차순으로 정렬된 데이터에만 만들 수 있습니다.")
+
+        boundaries = np.flatnonzero(values[1:] != values[:-1]) + 1
+        self._starts = np.concatenate([[0], boundaries]).astype(np.int64) if len(values) else np.empty(0, dtype=np.int64)
+        self._days = values[self._starts]
+        self._n_rows = len(values)
+
+        months = self._days.astype("datetime64[M]")
+        self._year = months.astype("datetime64[Y]").astype(np.int64) + 1970
+        self._month = months.astype(np.int64) % 12 + 1
+        self._day = (self._days - months).astype(np.int64) + 1
+        self._month_keys = np.unique(self._year * 12 + self._month - 1)
+
+    def __len__(self):
+        return self._n_rows
+
+    # ---- 콤보박스 목록 ----
+
+    def years(self) -> list[int]:
+        return np.unique(self._year).tolist()
+
+    def months(self, year: int) -> list[int]:
+        return np.unique(self._month[self._year == year]).tolist()
+
+    def days(self, year: int, month: int) -> list[int]:
+        return self._day[(self._year == year) & (self._month == month)].tolist()
+
+    # ---- 인접 기간 (데이터가 있는 기간 기준) ----
+
+    def adjacent_days(self, year: int, month: int, day: int) -> list[tuple[int, int, int]]:
+        """
+        :return: 선택일 바로 앞/뒤에 데이터가 있는 날짜 (연, 월, 일) 목록 (앞, 뒤 순서)
+        """
+        target = np.datetime64(f"{year:04d}-{month:02d}-{day:02d}", "D")
+        position = int(np.searchsorted(self._days, target))
+        found = position < len(self._days) and self._days[position] == target
+        neighbours = []
+        for i in (position - 1, position + 1 if found else position):
+            if 0 <= i < len(self._days):
+                neighbours.append((int(self._year[i]), int(self._month[i]), int(self._day[i])))
+        return neighbours
+
+    def adjacent_months(self, year: int, month: int) -> list[tuple[int, int]]:
+        """
+        :return: 선택월 바로 앞/뒤에 데이터가 있는 월 (연, 월) 목록 (앞, 뒤 순서)
+        """
+        target = year * 12 + month - 1
+        position = int(np.searchsorted(self._month_keys, target))
+        found = position < len(self._month_keys) and self._month_keys[position] == target
+        neighbours = []
+        for i in (position - 1, position + 1 if found else position):
+            if 0 <= i < len(self._month_keys):
+                key = int(self._month_keys[i])
+                neighbours.append((key // 12, key % 12 + 1))
+        return neighbours
+
+    # ---- 기간 → 행 구간 ----
+
+    def range(self, year: int, month: int = None, day: int = None) -> tuple[int, int]:
+        """
+        :return: 선택 기간에 해당하는 행 구간 (start, stop). 해당 행이 없으면 start == stop
+        """
+        if month is None:
+            first = np.datetime64(f"{year:04d}-01-01", "D")
+            last = np.datetime64(f"{year + 1:04d}-01-01", "D")
+        elif day is None:
+            first = np.datetime64(f"{year:04d}-{month:02d}", "M")
+            last = (first + 1).astype("datetime64[D]")
+            first = first.astype("datetime64[D]")
+        else:
+            first = np.datetime64(f"{year:04d}-{month:02d}-{day:02d}", "D")
+            last = first + 1
+        lo, hi = np.searchsorted(self._days, [first, last])
+        return self._row_at(lo), self._row_at(hi)
+
+    def _row_at(self, position: int) -> int:
+        return int(self._starts[position]) if position < len(self._starts) else self._n_rows
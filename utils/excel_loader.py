@@ -0,0 +1,200 @@
+import threading
+from PyQt6.QtCore import QObject, pyqtSignal
+import pandas as pd
+from utils.workbook_reader import WorkbookReader
+from utils.workbook_cache import WorkbookCache
+from utils.complaint_dataset import build_dataset
+from utils.search_index import RowSearchIndex
+
+DATE_COLUMNS = ["접수일", "처리기한", "처리완료일", "취소일자", "입금일자"]
+MONEY_COLUMNS = ["승인금액", "입금금액"]
+
+
+class ExcelLoadCancelled(Exception):
+    pass
+
+
+def normalize_complaints(df: pd.DataFrame, is_cancelled=None) -> pd.DataFrame:
+    """
+    전체민원 시트 공통 전처리 (컬럼명 정리, 날짜/금액 컬럼 변환)
+
+    WorkbookReader가 이미 타입을 맞춘 컬럼은 그대로 두고,
+    문자열로 들어온 컬럼만 datetime64/float64로 변환한다.
+
+    :param df: 시트 DataFrame
+    :param is_cancelled: 컬럼 단위로 확인할 취소 여부 콜백
+    """
+    # ✅ 컬럼명 공백 및 줄바꿈 제거
+    df.columns = df.columns.str.strip().str.replace("\n", "").str.replace("\r", "")
+
+    # ✅ 날짜 컬럼을 datetime64로 변환 (변환 실패는 NaT)
+    for col in DATE_COLUMNS:
+        if is_cancelled and is_cancelled():
+            raise ExcelLoadCancelled()
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+
+    # ✅ 금액 컬럼을 float으로 변환
+    for col in MONEY_COLUMNS:
+        if is_cancelled and is_cancelled():
+            raise ExcelLoadCancelled()
+        if col in df.columns and not pd.api.types.is_float_dtype(df[col]):
+            df[col] = (
+                df[col]
+                .astype(str)
+                .str.replace(",", "", regex=False)
+                .str.replace("₩", "", regex=False)
+                .str.strip()
+                .replace("", "0")
+                .astype(float)
+            )
+    return df
+
+
+class ExcelLoadWorker(QObject):
+    """
+    QThread 위에서 엑셀 시트를 읽고 전처리하는 작업 객체
+
+    progress(stage, bytes_read, bytes_total, rows_parsed) 시그널로 진행 상황을 알리고,
+    cancel()이 호출되면 다음 확인 지점에서 중단 후 cancelled 시그널을 보낸다.
+    시트 선택 때 열어 둔 WorkbookReader를 넘겨받아 사용하고, 작업이 끝나면 닫는다.
+    cache가 주어지면 같은 파일/시트의 정규화 결과를 Parquet 캐시에서 바로 읽는다.
+    완료 시 finished(편집용 DataFrame, 리포트 공용 ComplaintDataset, 검색 인덱스)를 보낸다.
+    """
+    progress = pyqtSignal(str, int, int, int)
+    finished = pyqtSignal(object, object, object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, reader: WorkbookReader, sheet_name: str, cache: WorkbookCache = None):
+        super().__init__()
+        self.reader = reader
+        self.sheet_name = sheet_name
+        self.cache = cache
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        # GUI 스레드에서 호출 가능 (Event는 스레드 안전)
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self):
+        try:
+            df = self.load()
+            self.progress.emit("리포트 데이터 구성 중", 0, 0, len(df))
+            dataset = build_dataset(df)
+            self.progress.emit("검색 인덱스 구성 중", 0, 0, len(df))
+            search_index = RowSearchIndex(df, money_columns=MONEY_COLUMNS)
+        except ExcelLoadCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(df, dataset, search_index)
+        finally:
+            self.reader.close()
+
+    def load(self) -> pd.DataFrame:
+        return read_complaints(
+            self.reader,
+            self.sheet_name,
+            cache=self.cache,
+            on_progress=self.progress.emit,
+            is_cancelled=self.is_cancelled,
+        )
+
+
+def read_complaints(reader: WorkbookReader, sheet_name: str, cache: WorkbookCache = None,
+                    on_progress=None, is_cancelled=None) -> pd.DataFrame:
+    """
+    전체민원 시트를 읽어 정규화된 DataFrame으로 반환 (Qt 없이 호출 가능, 명령줄 실행과 화면 로딩 공용)
+
+    cache가 주어지면 같은 파일/시트의 정규화 결과를 Parquet 캐시에서 바로 읽고,
+    새로 읽은 결과는 다음 번을 위해 캐시에 저장한다.
+
+    :param on_progress: on_progress(stage, bytes_read, bytes_total, rows_parsed)
+    :param is_cancelled: True를 반환하면 ExcelLoadCancelled를 던져 중단
+    """
+    total = reader.bytes_total
+    is_cancelled = is_cancelled or (lambda: False)
+
+    def progress(stage, done, rows):
+        if on_progress is not None:
+            on_progress(stage, done, total, rows)
+
+    # 0) 캐시 확인 (파일 내용 해시는 파일이 바뀌었을 때만 다시 계산)
+    cache_key = None
+    if cache is not None:
+        try:
+            cache_key = cache.key_for(
+                reader.file_path,
+                sheet_name,
+                on_progress=lambda done, _total: progress("파일 확인 중", done, 0),
+                is_cancelled=is_cancelled,
+            )
+            if cache_key is None:
+                raise ExcelLoadCancelled()
+            df = cache.load(cache_key)
+        except ExcelLoadCancelled:
+            raise
+        except Exception as e:
+            print("캐시 확인 실패:", e)
+            cache_key = None
+            df = None
+        if df is not None:
+            progress("캐시에서 불러옴", total, len(df))
+            return df
+
+    # 1) 시트 스트리밍 파싱 (청크 단위로 진행률 보고)
+    df = reader.read_sheet(
+        sheet_name,
+        date_columns=DATE_COLUMNS,
+        money_columns=MONEY_COLUMNS,
+        on_progress=lambda rows: progress("시트 읽는 중", reader.bytes_read, rows),
+        is_cancelled=is_cancelled,
+    )
+    if df is None or is_cancelled():
+        raise ExcelLoadCancelled()
+    rows = len(df)
+
+    # 2) 날짜/금액 정규화
+    progress("데이터 정리 중", total, rows)
+    df = normalize_complaints(df, is_cancelled=is_cancelled)
+
+    # 3) 다음 번 열기를 위해 캐시에 저장 (실패해도 로딩은 계속)
+    if cache_key is not None:
+        progress("캐시 저장 중", total, rows)
+        try:
+            cache.store(cache_key, df, description=f"{reader.file_path} [{sheet_name}]")
+        except Exception as e:
+            print("캐시 저장 실패:", e)
+
+    progress("완료", total, rows)
+    return df
+
+
+class DatasetBuildWorker(QObject):
+    """
+    QThread 위에서 편집된 전체민원 DataFrame으로 리포트 공용 데이터셋을 다시 만드는 작업 객체
+
+    df는 GUI 스레드에서 copy(deep=False)로 떠 둔 스냅샷이다 (Copy-on-Write라 이후 편집이 번지지 않음).
+    generation은 요청 시점의 편집 세대로 결과와 함께 돌려보내, 그 사이 편집/새 파일이 있으면 화면에서 버린다.
+    완료 시 finished(generation, ComplaintDataset)를 보낸다.
+    """
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, df: pd.DataFrame, generation: int):
+        super().__init__()
+        self.df = df
+        self.generation = generation
+
+    def run(self):
+        try:
+            dataset = build_dataset(self.df)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(self.generation, dataset)
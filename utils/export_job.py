@@ -0,0 +1,62 @@
+import os
+import threading
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class ExportWorker(QObject):
+    """
+    QThread 위에서 PDF 등 파일 저장을 실행하는 작업 객체
+
+    export는 export(file_path, on_page=..., is_cancelled=...) 형태의 함수로,
+    페이지를 하나 쓸 때마다 on_page(완료 페이지 수, 전체 페이지 수)를 부르고
+    is_cancelled()가 True이면 ExportCancelled를 던져 중단한다.
+    진행 상황은 progress 시그널로 GUI 스레드에 전달하고, 취소되면 쓰다 만 파일은 지운다.
+    위젯을 건드리지 않는 데이터(리포트 DataFrame, 미리 그려 둔 QPicture 등)만 넘겨야 한다.
+    """
+    progress = pyqtSignal(int, int)  # (완료 페이지 수, 전체 페이지 수)
+    finished = pyqtSignal(str)       # 저장 경로
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, export, file_path: str):
+        super().__init__()
+        self.export = export
+        self.file_path = file_path
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        # GUI 스레드에서 호출 가능 (Event는 스레드 안전)
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self):
+        try:
+            self.export(
+                self.file_path,
+                on_page=lambda done, total: self.progress.emit(done, total),
+                is_cancelled=self.is_cancelled,
+            )
+            if self.is_cancelled():
+                raise ExportCancelled()
+        except ExportCancelled:
+            self._remove_partial_file()
+            self.cancelled.emit()
+        except Exception as e:
+            self._remove_partial_file()
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(self.file_path)
+
+    def _remove_partial_file(self):
+        # 단일 파일 저장만 해당 (폴더에 여러 파일을 쓰는 export는 취소/실패 시 스스로 정리)
+        try:
+            if os.path.isfile(self.file_path):
+                os.remove(self.file_path)
+        except OSError as e:
+            print(f"⚠️ 저장 중단된 파일 삭제 실패: {e}")
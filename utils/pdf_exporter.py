@@ -1,115 +1,385 @@
-import matplotlib.pyplot as plt
-from matplotlib import font_manager
-from matplotlib.backends.backend_pdf import PdfPages
-from matplotlib.table import Table
-from PyQt6.QtWidgets import QTableWidget
-
-def export_table_to_pdf(table: QTableWidget, file_path: str, title: str, orientation: str = 'portrait', font_size: int = 12):
-    try:
-        TITLE_FONT_SIZE = 14  # 타이틀용 폰트 크기 (고정)
-        import sys
-        font_prop = font_manager.FontProperties(
-            family='Malgun Gothic' if sys.platform == 'win32' else 'AppleGothic',
-            size=font_size
+import math
+import os
+import sys
+import pandas as pd
+from PyQt6.QtCore import Qt, QAbstractItemModel
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.units import mm
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Table, TableStyle, PageBreak, NextPageTemplate
+from widgets.report_table_model import ColumnSpec, ROW_TYPE_COLUMN, report_row_types, repeat_mask
+from utils.export_job import ExportCancelled
+
+
+def _base_dir() -> str:
+    # 프로그램 폴더 (PyInstaller 실행 파일이면 압축 해제 폴더)
+    if getattr(sys, "frozen", False):
+        return sys._MEIPASS
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# 한글 TTF가 있으면 PDF에 내장하고, 없으면 reportlab 내장 CID 폰트(뷰어의 한글 폰트 사용)로 대체
+# 프로그램 폴더의 fonts/NanumGothic.ttf를 가장 먼저 사용 (배포본에 같이 넣으면 어느 PC에서나 내장됨)
+FONT_CANDIDATES = [
+    ("NanumGothic", os.path.join(_base_dir(), "fonts", "NanumGothic.ttf"), os.path.join(_base_dir(), "fonts", "NanumGothicBold.ttf")),
+    ("MalgunGothic", r"C:\Windows\Fonts\malgun.ttf", r"C:\Windows\Fonts\malgunbd.ttf"),
+    ("AppleGothic", "/System/Library/Fonts/Supplemental/AppleGothic.ttf", None),
+    ("NanumGothic", "/usr/share/fonts/truetype/nanum/NanumGothic.ttf", "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf"),
+]
+CID_FONT_NAME = "HYGothic-Medium"
+TITLE_FONT_SIZE = 14
+MIN_FONT_SIZE = 6
+PAGE_MARGIN = 10 * mm
+CELL_PADDING_H = 3  # 셀 좌우 여백 (pt)
+CELL_PADDING_V = 2  # 셀 상하 여백 (pt)
+
+HEADER_BACKGROUND = colors.HexColor("#e0f0ff")
+ROW_BACKGROUNDS = {
+    "subtotal": colors.HexColor("#f2f2f2"),
+    "total": colors.HexColor("#dde6f0"),
+}
+
+_fonts = None
+
+
+def _register_fonts() -> tuple[str, str]:
+    """
+    :return: (본문 폰트 이름, 굵은 폰트 이름). 굵은 글꼴이 없으면 본문 폰트와 같음
+    """
+    global _fonts
+    if _fonts is None:
+        for name, regular_path, bold_path in FONT_CANDIDATES:
+            if not os.path.exists(regular_path):
+                continue
+            try:
+                pdfmetrics.registerFont(TTFont(name, regular_path))
+                bold = name
+                if bold_path and os.path.exists(bold_path):
+                    pdfmetrics.registerFont(TTFont(f"{name}-Bold", bold_path))
+                    bold = f"{name}-Bold"
+                _fonts = (name, bold)
+                break
+            except Exception as e:
+                print(f"⚠️ PDF 폰트 등록 실패 ({regular_path}): {e}")
+        else:
+            print(
+                f"⚠️ 한글 TTF 폰트를 찾지 못해 PDF에 폰트를 내장하지 않습니다 ({CID_FONT_NAME} CID 폰트 사용, "
+                f"보는 PC에 한글 폰트가 없으면 글자가 깨질 수 있음). fonts/NanumGothic.ttf를 추가하세요."
+            )
+            pdfmetrics.registerFont(UnicodeCIDFont(CID_FONT_NAME))
+            _fonts = (CID_FONT_NAME, CID_FONT_NAME)
+    return _fonts
+
+
+class ReportSection:
+    """
+    PDF에 넣을 리포트 한 개 (여러 리포트를 한 파일로 합칠 때 섹션 단위로 사용)
+
+    :param frame: 리포트 DataFrame (__row_type 컬럼이 있으면 소계/합계 행 구분에 사용)
+    :param columns: ColumnSpec 목록 (None이면 __row_type을 뺀 모든 컬럼)
+    :param title: 페이지 상단 제목 (뒤에 섹션 내 페이지 번호가 붙음)
+    :param orientation: "portrait" / "landscape" (A4)
+    :param font_size: 기본 글자 크기 (열이 페이지 폭을 넘으면 MIN_FONT_SIZE까지 줄이고, 그래도 넘치면 열 단위로 페이지 분할)
+    """
+
+    def __init__(self, frame: pd.DataFrame, columns: list, title: str, orientation: str = "portrait", font_size: int = 12):
+        self.frame = frame
+        self.columns = columns
+        self.title = title
+        self.orientation = orientation
+        self.font_size = font_size
+
+
+def export_report_to_pdf(
+    frame: pd.DataFrame,
+    columns: list,
+    file_path: str,
+    title: str,
+    orientation: str = "portrait",
+    font_size: int = 12,
+    on_page=None,
+    is_cancelled=None
+) -> int:
+    """
+    리포트 DataFrame을 표 형태의 PDF로 저장 (reportlab platypus)
+
+    문자열 변환은 컬럼 단위로 한 번만 하고, 열 너비와 행 높이는 실제 글자 폭/폰트 크기로 계산한다.
+    열이 한 줄로 페이지 폭에 들어가도록 글자 크기를 MIN_FONT_SIZE까지 줄이고, 그래도 넘치면 열을 측정 폭
+    그대로 두고 여러 페이지로 나눈다 (기준 열은 매 페이지 반복). 행 높이는 줄 수로 계산해 한 페이지에
+    들어갈 행을 미리 나눠 페이지 단위 표로 넘긴다. (큰 표 하나를 페이지마다 다시 나누지 않음)
+    헤더는 매 페이지 반복하고, group_by로 비운 칸(중복 가맹점명 등)은 페이지 첫 행에서 다시 표시한다.
+    소계/합계 행은 배경색과 (굵은 글꼴이 있으면) 굵은 글씨로 구분한다.
+
+    :param file_path: 저장 경로
+    :param on_page: 페이지를 하나 쓸 때마다 on_page(완료 페이지 수, 전체 페이지 수) 호출
+    :param is_cancelled: 페이지를 시작할 때마다 확인해 True이면 ExportCancelled를 던짐
+    :return: 저장한 페이지 수
+    (나머지 인자는 ReportSection 참고)
+    """
+    section = ReportSection(frame, columns, title, orientation=orientation, font_size=font_size)
+    return export_sections_to_pdf([section], file_path, on_page=on_page, is_cancelled=is_cancelled)
+
+
+def export_sections_to_pdf(sections: list, file_path: str, on_page=None, is_cancelled=None) -> int:
+    """
+    여러 리포트(ReportSection)를 순서대로 한 PDF에 저장. 섹션마다 새 페이지에서 시작하고
+    섹션별 용지 방향과 제목을 따른다. (인자는 export_report_to_pdf 참고)
+    """
+    fonts = _register_fonts()
+
+    # 섹션별 페이지 표를 먼저 만들어 두고, 절대 페이지 번호 → (제목, 섹션 내 페이지 번호)를 기억
+    flowables = []
+    page_titles = []
+    for index, section in enumerate(sections):
+        tables = _section_tables(section, fonts)
+        if index > 0:
+            flowables.append(NextPageTemplate(section.orientation))
+            flowables.append(PageBreak())
+        for page, table in enumerate(tables, start=1):
+            if page > 1:
+                flowables.append(PageBreak())
+            flowables.append(table)
+            page_titles.append((section.title, section.orientation, page))
+    page_count = len(page_titles)
+
+    def draw_title(canvas, doc):
+        if is_cancelled is not None and is_cancelled():
+            raise ExportCancelled()
+        title, orientation, page = page_titles[min(doc.page, page_count) - 1]
+        page_size = _page_size(orientation)
+        canvas.saveState()
+        canvas.setFont(fonts[0], TITLE_FONT_SIZE)
+        canvas.drawCentredString(
+            page_size[0] / 2, page_size[1] - PAGE_MARGIN - TITLE_FONT_SIZE, f"{title} (p.{page})"
         )
+        canvas.restoreState()
+
+    def page_done(canvas, doc):
+        if on_page is not None:
+            on_page(doc.page, page_count)
+
+    templates = []
+    first_orientation = sections[0].orientation if sections else "portrait"
+    for orientation in sorted({"portrait", "landscape"}, key=lambda o: o != first_orientation):
+        page_size = _page_size(orientation)
+        avail_width, avail_height = _body_size(page_size)
+        body = Frame(
+            PAGE_MARGIN, PAGE_MARGIN, avail_width, avail_height,
+            leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0, id=f"body_{orientation}"
+        )
+        templates.append(PageTemplate(
+            id=orientation, frames=[body], pagesize=page_size, onPage=draw_title, onPageEnd=page_done
+        ))
+
+    doc = BaseDocTemplate(
+        file_path, pagesize=_page_size(first_orientation), title=sections[0].title if sections else "",
+        leftMargin=PAGE_MARGIN, rightMargin=PAGE_MARGIN, topMargin=PAGE_MARGIN, bottomMargin=PAGE_MARGIN
+    )
+    doc.addPageTemplates(templates)
+    doc.build(flowables)
+    return doc.page
+
+
+def _page_size(orientation: str):
+    return landscape(A4) if orientation == "landscape" else A4
+
+
+def _body_size(page_size) -> tuple[float, float]:
+    # 여백과 제목 줄을 뺀 표 영역 (폭, 높이)
+    return page_size[0] - 2 * PAGE_MARGIN, page_size[1] - 2 * PAGE_MARGIN - TITLE_FONT_SIZE * 1.8
+
+
+def _section_tables(section: ReportSection, fonts: tuple[str, str]) -> list:
+    # 한 섹션을 페이지 단위 Table 목록으로 변환
+    font_name, bold_font_name = fonts
+    frame = section.frame
+    columns = section.columns
+    if columns is None:
+        columns = [ColumnSpec(col) for col in frame.columns if col != ROW_TYPE_COLUMN]
+    avail_width, avail_height = _body_size(_page_size(section.orientation))
+
+    # ---- 컬럼 단위 문자열 변환 ----
+    row_types = report_row_types(frame)
+    headers = [spec.title for spec in columns]
+    texts = [spec.format_values(frame[spec.name].tolist()) for spec in columns]
+    masks = [repeat_mask(frame, spec, row_types) for spec in columns]
+    display = [
+        texts[c] if masks[c] is None else ["" if blank else t for t, blank in zip(texts[c], masks[c].tolist())]
+        for c in range(len(columns))
+    ]
+
+    # ---- 글자 크기 / 열 너비 / 행 높이 ----
+    unit_widths = [
+        max(pdfmetrics.stringWidth(t, bold_font_name, 1) for t in set(texts[c]) | {headers[c]})
+        for c in range(len(columns))
+    ]
+    font_size = _fit_font_size(unit_widths, avail_width, section.font_size)
+    natural_widths = [w * font_size + 2 * CELL_PADDING_H for w in unit_widths]
+    groups, col_widths = _column_groups(columns, natural_widths, avail_width)
+
+    # 열은 측정 폭보다 좁히지 않으므로, 한 열이 페이지보다 넓을 때만 그 열의 글자를 줄바꿈하고 행 높이를 늘림
+    line_height = font_size * 1.2
+    header_lines = 1
+    row_lines = [1] * len(frame)
+    for c in range(len(columns)):
+        if col_widths[c] >= natural_widths[c] - 0.01:
+            continue
+        inner_width = col_widths[c] - 2 * CELL_PADDING_H
+        wrapped = {}
+        for t in set(texts[c]) | {headers[c]}:
+            wrapped[t] = _wrap_text(t, bold_font_name, font_size, inner_width)
+        header_lines = max(header_lines, len(wrapped[headers[c]]))
+        headers[c] = "\n".join(wrapped[headers[c]])
+        row_lines = [max(lines, len(wrapped[t])) for lines, t in zip(row_lines, texts[c])]
+        texts[c] = ["\n".join(wrapped[t]) for t in texts[c]]
+        display[c] = [t if t == "" else "\n".join(wrapped[t]) for t in display[c]]
+    header_height = header_lines * line_height + 2 * CELL_PADDING_V
+    row_heights = [lines * line_height + 2 * CELL_PADDING_V for lines in row_lines]
+    blocks = _row_blocks(row_heights, avail_height - header_height)
+
+    # ---- 페이지 단위 표 (행 묶음마다 열 묶음 순서로) ----
+    tables = []
+    for start, stop in blocks:
+        row_styles = []
+        for offset, row_type in enumerate(row_types[start:stop].tolist(), start=1):
+            background = ROW_BACKGROUNDS.get(row_type)
+            if background is not None:
+                row_styles.append(("BACKGROUND", (0, offset), (-1, offset), background))
+                row_styles.append(("FONT", (0, offset), (-1, offset), bold_font_name, font_size))
+
+        for group in groups:
+            page_columns = []
+            for c in group:
+                values = display[c][start:stop]
+                if masks[c] is not None and start < stop and masks[c][start]:
+                    values[0] = texts[c][start]  # 앞 페이지에서 이어지는 그룹은 첫 행에 다시 표시
+                page_columns.append(values)
+            page_rows = [[headers[c] for c in group]] + [list(row) for row in zip(*page_columns)]
+
+            style = [
+                ("FONT", (0, 0), (-1, -1), font_name, font_size),
+                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+                ("BACKGROUND", (0, 0), (-1, 0), HEADER_BACKGROUND),
+                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                ("LEFTPADDING", (0, 0), (-1, -1), CELL_PADDING_H),
+                ("RIGHTPADDING", (0, 0), (-1, -1), CELL_PADDING_H),
+                ("TOPPADDING", (0, 0), (-1, -1), 0),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+            ]
+            for position, c in enumerate(group):
+                style.append(("ALIGN", (position, 1), (position, -1), _cell_align(columns[c].align)))
+            style += row_styles
+
+            tables.append(Table(
+                page_rows,
+                colWidths=[col_widths[c] for c in group],
+                rowHeights=[header_height] + row_heights[start:stop],
+                repeatRows=1,
+                style=TableStyle(style),
+            ))
+    return tables
+
+
+def _column_groups(columns: list, natural_widths: list, avail_width: float) -> tuple[list, list]:
+    """
+    열을 페이지 폭에 맞게 묶음
+
+    모든 열이 들어가면 묶음 하나 (남는 폭은 비율대로 나눠 넓힘).
+    넘치면 열을 측정 폭 그대로 두고 여러 페이지로 나누며, 앞쪽 기준 열(group_by 열, 없으면 첫 열)을
+    매 페이지 왼쪽에 반복한다. 기준 열은 페이지 폭의 절반, 나머지 열은 남은 폭까지만 쓰고 넘치는 글자는 줄바꿈.
+
+    :return: (열 번호 묶음 목록, 열 너비 목록)
+    """
+    count = len(natural_widths)
+    total = sum(natural_widths)
+    if count == 0 or total <= avail_width:
+        scale = avail_width / total if total else 1
+        return [list(range(count))], [w * scale for w in natural_widths]
+
+    keys = []
+    for c, spec in enumerate(columns):
+        if spec.group_by is None:
+            break
+        keys.append(c)
+    if not keys or sum(natural_widths[c] for c in keys) > avail_width / 2:
+        keys = [0]
+    widths = list(natural_widths)
+    for c in keys:
+        widths[c] = min(widths[c], avail_width / 2)
+    room = avail_width - sum(widths[c] for c in keys)
+
+    groups, current, used = [], [], 0.0
+    for c in range(count):
+        if c in keys:
+            continue
+        widths[c] = min(widths[c], room)
+        if current and used + widths[c] > room:
+            groups.append(keys + current)
+            current, used = [], 0.0
+        current.append(c)
+        used += widths[c]
+    if current or not groups:
+        groups.append(keys + current)
+    return groups, widths
+
+
+def _row_blocks(row_heights: list, avail_height: float) -> list[tuple[int, int]]:
+    # 행 높이를 누적해 한 페이지에 들어가는 (시작, 끝) 행 구간 목록 (페이지마다 최소 한 행)
+    blocks = []
+    start, used = 0, 0.0
+    for row, height in enumerate(row_heights):
+        if row > start and used + height > avail_height:
+            blocks.append((start, row))
+            start, used = row, 0.0
+        used += height
+    blocks.append((start, len(row_heights)))
+    return blocks
+
+
+def _wrap_text(text: str, font_name: str, font_size: float, width: float) -> list[str]:
+    # 폭 안에 들어가도록 줄 나눔 (공백 기준, 공백 없이 폭보다 긴 부분은 글자 단위)
+    lines = []
+    for line in simpleSplit(text, font_name, font_size, width) or [""]:
+        while len(line) > 1 and pdfmetrics.stringWidth(line, font_name, font_size) > width:
+            cut = len(line) - 1
+            while cut > 1 and pdfmetrics.stringWidth(line[:cut], font_name, font_size) > width:
+                cut -= 1
+            lines.append(line[:cut])
+            line = line[cut:]
+        lines.append(line)
+    return lines
+
+
+def export_table_to_pdf(table, file_path: str, title: str, orientation: str = 'portrait', font_size: int = 12, **hooks) -> int:
+    """
+    리포트 QTableView (또는 ReportTableModel)에 표시 중인 리포트를 PDF로 저장
+
+    위젯 셀을 읽지 않고 모델이 들고 있는 리포트 DataFrame과 ColumnSpec을 그대로 사용한다.
+    """
+    model = table if isinstance(table, QAbstractItemModel) else table.model()
+    return export_report_to_pdf(
+        model.report_frame(), model.column_specs(), file_path, title,
+        orientation=orientation, font_size=font_size, **hooks
+    )
+
+
+def _fit_font_size(unit_widths: list, avail_width: float, font_size: float) -> float:
+    # 모든 열이 한 줄로 페이지 폭에 들어가는 가장 큰 글자 크기 (font_size ~ MIN_FONT_SIZE)
+    text_width = sum(unit_widths)
+    if text_width <= 0:
+        return font_size
+    fitted = (avail_width - 2 * CELL_PADDING_H * len(unit_widths)) / text_width
+    return max(MIN_FONT_SIZE, min(font_size, math.floor(fitted * 2) / 2))
+
 
-        with PdfPages(file_path) as pdf:  # 페이지를 위한 PDF 파일 저장 시작
-            headers = [table.horizontalHeaderItem(i).text() for i in range(table.columnCount())]  # 테이블의 헤더 추출
-            rows = []
-            for row in range(table.rowCount()):
-                row_data = [table.item(row, col).text() if table.item(row, col) else "" for col in range(table.columnCount())]
-                rows.append(row_data)  # 테이블의 모든 데이터 행 추출
-
-            table_data = [headers] + rows  # headers 포함된 상태로 테이블 전체 데이터 구성
-            col_count = table.columnCount()
-            col_lengths = [max(len(str(table_data[row][col])) for row in range(len(table_data))) for col in range(col_count)]  # 열별 최대 텍스트 길이 계산
-            total_length = sum(col_lengths)
-            col_widths = [length / total_length for length in col_lengths]  # 열 너비 비율 계산
-
-            # Calculate how many rows fit per page
-            global_prev_value = None
-
-            current_row = 0
-            page_num = 1
-            while current_row < len(table_data):  # 페이지 반복 출력
-                if orientation == 'landscape':
-                    fig, ax = plt.subplots(figsize=(11.69, 8.27))  # A4 가로/세로 크기 지정
-                else:
-                    fig, ax = plt.subplots(figsize=(8.27, 11.69))  # A4 가로/세로 크기 지정
-
-                fig.suptitle(f"{title} (p.{page_num})", fontproperties=font_prop, fontsize=TITLE_FONT_SIZE, y=0.98)  # 타이틀 설정
-                fig.subplots_adjust(left=0.02, right=0.98, top=0.96, bottom=0.04)  # 여백 조정 (왼쪽, 오른쪽, 상단, 하단)
-                ax.axis('off')  # 축 숨김 처리
-
-                # Calculate how many rows fit on this page based on actual heights
-                rows_per_page = 30 - 1  # 헤더 포함으로 실제 데이터 행 수는 29
-                end_row = min(current_row + rows_per_page, len(table_data))  # 고정된 행 수만큼 출력
-
-                page_rows = []
-                for i in range(current_row, end_row):
-                    row = table_data[i]
-                    original_first_col = row[0]
-
-                    if original_first_col and global_prev_value == original_first_col:
-                        row = [""] + row[1:]
-                    elif original_first_col:
-                        global_prev_value = original_first_col
-
-                    if i == current_row and row[0] == "" and global_prev_value:
-                        row[0] = global_prev_value
-
-                    page_rows.append(row)
-
-                # 첫 페이지인 경우 (헤더 이미 포함됨)에는 중복 방지
-                if current_row == 0:
-                    page_rows = [headers] + page_rows[1:]
-                else:
-                    page_rows = [headers] + page_rows
-
-                # 빈 행 추가: 총 행 수가 30 + 헤더 1개 = 31이 되도록 유지
-                while len(page_rows) < rows_per_page + 1:
-                    page_rows.append([""] * col_count)
-
-                adjusted_bbox = [0.01, 0.02, 0.98, 0.96]
-
-                tab = Table(ax, bbox=adjusted_bbox)  # 테이블 생성
-                from PyQt6.QtCore import Qt
-                for i, row in enumerate(page_rows):
-                    for j, cell in enumerate(row):
-                        alignment = Qt.AlignmentFlag.AlignCenter  # 기본값
-                        if i > 0 and table.item(current_row + i - 1, j):  # 데이터 행이고, 셀이 존재한다면
-                            alignment = table.item(current_row + i - 1, j).textAlignment()
-
-                        if alignment & Qt.AlignmentFlag.AlignLeft:
-                            cell_loc = 'left'
-                        elif alignment & Qt.AlignmentFlag.AlignRight:
-                            cell_loc = 'right'
-                        else:
-                            cell_loc = 'center'  # 기본값
-
-                        cell_height = (adjusted_bbox[3] - adjusted_bbox[1]) / len(page_rows)
-                        cell_obj = tab.add_cell(
-                            i, j, col_widths[j], cell_height, text=cell, loc=cell_loc,
-                            facecolor='#e0f0ff' if i == 0 else 'white'  # 헤더는 회색, 나머지는 흰색 배경
-                        )
-                        cell_obj.PAD = 0.1
-                        cell_obj.get_text().set_fontproperties(font_prop)  # 셀 텍스트 설정 및 폰트 속성 적용
-                        cell_obj.get_text().set_fontsize(font_size)  # 셀 내부 폰트 크기 (기본값 12)
-                        if i > 0 and ">>" in row[0]:
-                            cell_obj.get_text().set_weight("bold")
-                        else:
-                            cell_obj.get_text().set_weight("normal")
-                        cell_obj.set_height(cell_height)  # 셀 높이 지정
-
-                        # 빈 행이면 테두리 투명 처리
-                        if all(c == "" for c in row):
-                            cell_obj.set_edgecolor((1, 1, 1, 0))  # 테두리 투명
-                            cell_obj.set_facecolor("white")      # 배경은 흰색 유지
-
-                ax.add_table(tab)  # 테이블 추가
-                pdf.savefig(fig)  # PDF 저장 및 다음 페이지로
-                plt.close(fig)
-                current_row = end_row
-                page_num += 1
-    except Exception as e:
-        print("[PDF EXPORT ERROR]", str(e))  # 예외 발생 시 출력
\ No newline at end of file
+def _cell_align(align) -> str:
+    if align is not None and align & Qt.AlignmentFlag.AlignLeft:
+        return "LEFT"
+    if align is not None and align & Qt.AlignmentFlag.AlignRight:
+        return "RIGHT"
+    return "CENTER"
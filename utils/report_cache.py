@@ -0,0 +1,89 @@
+import sys
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 리포트 결과 전체 용량 상한 (대략 256MB)
+
+
+class ReportCache:
+    """
+    리포트 계산 결과 메모리 캐시 (LRU)
+
+    키는 (화면 이름, 데이터셋 버전, 선택 기간/옵션) 튜플로 만든다.
+    항목 수나 대략적인 용량이 상한을 넘으면 가장 오래 사용하지 않은 결과부터 버린다.
+    데이터셋이 바뀌면 clear()로 한 번에 비운다. (버전이 키에 들어가므로 이전 결과가 잘못 쓰이지는 않음)
+    백그라운드 계산에서도 저장할 수 있도록 내부 잠금을 사용한다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes: int = None):
+        if nbytes is None:
+            nbytes = estimate_bytes(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            if nbytes > self.max_bytes:
+                return  # 한 항목이 상한보다 크면 보관하지 않음
+            self._entries[key] = (value, nbytes)
+            self._total_bytes += nbytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._total_bytes -= nbytes
+
+
+def estimate_bytes(value) -> int:
+    """
+    캐시 용량 계산용 대략적인 크기 (DataFrame은 문자열 내용까지 포함)
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_bytes(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(v) for v in value.values())
+    return sys.getsizeof(value)
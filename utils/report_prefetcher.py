@@ -0,0 +1,75 @@
+import threading
+from PyQt6.QtCore import QRunnable, QThreadPool
+
+
+class _PrefetchTask(QRunnable):
+    def __init__(self, prefetcher, key, compute, generation):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.key = key
+        self.compute = compute
+        self.generation = generation
+        self.setAutoDelete(True)
+
+    def run(self):
+        prefetcher = self.prefetcher
+        try:
+            if prefetcher.is_stale(self.generation) or self.key in prefetcher.cache:
+                return
+            result = self.compute()
+            # 계산 중에 데이터셋이 바뀌었으면 결과를 버림
+            if not prefetcher.is_stale(self.generation):
+                prefetcher.cache.put(self.key, result)
+        except Exception as e:
+            print(f"❌ 리포트 미리 계산 중 오류 발생: {e}")
+        finally:
+            prefetcher._finish(self.key)
+
+
+class ReportPrefetcher:
+    """
+    인접 기간 리포트를 백그라운드 스레드에서 미리 계산해 ReportCache에 넣어 두는 도우미
+
+    요청은 전용 QThreadPool(기본 1스레드)에 순서대로 쌓이고, 이미 캐시에 있거나 계산 중인 키는 건너뛴다.
+    cancel()을 부르면 대기 중인 요청은 버리고, 실행 중인 계산은 끝난 뒤 결과를 저장하지 않는다.
+    """
+
+    def __init__(self, cache, max_threads: int = 1):
+        """
+        :param cache: 결과를 넣을 ReportCache
+        :param max_threads: 동시에 계산할 최대 스레드 수
+        """
+        self.cache = cache
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        self._generation = 0
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def prefetch(self, key, compute):
+        """
+        :param key: ReportCache 키
+        :param compute: 인자 없이 호출하면 결과를 반환하는 함수 (위젯을 건드리지 않는 순수 계산)
+        """
+        with self._lock:
+            if key in self._pending or key in self.cache:
+                return
+            self._pending.add(key)
+            generation = self._generation
+        self.pool.start(_PrefetchTask(self, key, compute, generation))
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+            self._pending.clear()
+        self.pool.clear()
+
+    def is_stale(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self.pool.waitForDone(msecs)
+
+    def _finish(self, key):
+        with self._lock:
+            self._pending.discard(key)
@@ -0,0 +1,34 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class ReportTaskSignals(QObject):
+    finished = pyqtSignal(object, object)  # (context, 결과)
+    failed = pyqtSignal(object, str)       # (context, 오류 메시지)
+
+
+class ReportTask(QRunnable):
+    """
+    리포트 계산 함수를 QThreadPool 스레드에서 실행하고 결과를 시그널로 돌려주는 작업
+
+    context는 요청 시점 정보(세대 번호, 선택값 등)로, 결과와 함께 그대로 돌려준다.
+    시그널은 GUI 스레드에 있는 signals 객체를 통해 전달되므로 슬롯은 GUI 스레드에서 실행된다.
+    """
+
+    def __init__(self, compute, context):
+        """
+        :param compute: 인자 없이 호출하면 결과를 반환하는 함수 (위젯을 건드리지 않는 순수 계산)
+        :param context: 결과와 함께 돌려줄 요청 정보
+        """
+        super().__init__()
+        self.compute = compute
+        self.context = context
+        self.signals = ReportTaskSignals()
+        self.setAutoDelete(True)
+
+    def run(self):
+        try:
+            result = self.compute()
+        except Exception as e:
+            self.signals.failed.emit(self.context, str(e))
+            return
+        self.signals.finished.emit(self.context, result)
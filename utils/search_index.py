@@ -0,0 +1,229 @@
+import numpy as np
+import pandas as pd
+
+SEPARATOR = "\n"  # 고유값 사이 구분자 (검색창 입력에는 들어올 수 없는 문자)
+NARROW_RATIO = 8  # 이전 결과가 전체 고유값의 1/8 이하일 때만 이전 결과 안에서 재검색
+VERIFY_RATIO = 2  # 글자쌍 후보가 전체 고유값의 1/2 이하면 후보만 문자열로 확인, 그보다 많으면 전체 벡터 검색
+
+
+def format_column_text(series: pd.Series, is_money: bool = False) -> list[str]:
+    """
+    컬럼 전체를 화면 표시 문자열로 변환 (DataFrameTableModel.format_value와 같은 규칙)
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime("%Y-%m-%d").fillna("").tolist()
+    if is_money and pd.api.types.is_numeric_dtype(series):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        valid = ~np.isnan(values)
+        out = np.full(len(values), "", dtype=object)
+        out[valid] = [f"{v:,}" for v in values[valid].astype(np.int64).tolist()]
+        return out.tolist()
+    if pd.api.types.is_float_dtype(series):
+        return series.astype(str).where(series.notna(), "").tolist()
+    return series.astype(str).tolist()
+
+
+class Postings:
+    """
+    정수 키 → 고유값 번호 목록 (키 순으로 정렬해 이어 붙인 배열 + 키별 시작 위치)
+
+    :param pairs: (키 << 32 | 고유값 번호) 배열 (중복 허용)
+    """
+
+    def __init__(self, pairs: np.ndarray):
+        pairs = np.unique(pairs)
+        keys = (pairs >> 32).astype(np.uint32)
+        self.ids = (pairs & 0xFFFFFFFF).astype(np.uint32)
+        self.starts = np.concatenate([[0], np.flatnonzero(np.diff(keys)) + 1, [len(keys)]]).astype(np.int64)
+        self.keys = keys[self.starts[:-1]]
+
+    def get(self, key: int) -> np.ndarray:
+        # key가 들어 있는 고유값 번호 (오름차순)
+        position = np.searchsorted(self.keys, key)
+        if position >= len(self.keys) or self.keys[position] != key:
+            return np.empty(0, dtype=np.int64)
+        return self.ids[self.starts[position]:self.starts[position + 1]]
+
+
+class RowSearchIndex:
+    """
+    전체민원 검색용 인덱스
+
+    로딩 시 한 번 컬럼별 표시 문자열을 고유값 사전(코드 + 소문자 고유값)으로 만들고,
+    모든 고유값을 하나의 UTF-32 배열로 이어 붙여 numpy 비교로 부분 문자열을 찾는다.
+    찾은 고유값을 행 코드 행렬에 매핑해 행 결과를 만든다.
+
+    한 글자 / 두 글자 검색어는 로딩 때 만든 글자 / 글자쌍(bigram) → 고유값 번호 목록에서 바로 찾는다.
+    검색어가 이전 검색어를 포함하는 방향으로만 늘어나면 이전에 일치한 고유값 안에서만 다시 찾는다.
+    로딩 이후 편집/추가된 행은 행 단위 문자열로 따로 관리한다.
+    """
+
+    def __init__(self, df: pd.DataFrame, money_columns=()):
+        money_columns = set(money_columns)
+        self._n_rows = len(df)
+
+        codes_list = []
+        uniques = []
+        col_offsets = []
+        for col in df.columns:
+            texts = format_column_text(df[col], col in money_columns)
+            codes, col_uniques = pd.factorize(np.asarray(texts, dtype=object))
+            col_offsets.append(len(uniques))
+            codes_list.append(codes.astype(np.int32) + len(uniques))
+            uniques.extend(str(u).lower() for u in col_uniques)
+
+        self._uniques = uniques
+        self._col_offsets = np.asarray(col_offsets + [len(uniques)], dtype=np.int64)
+        self._codes = codes_list  # 컬럼별 행 코드 (전체 고유값 번호)
+
+        text = SEPARATOR.join(uniques) + SEPARATOR
+        self._chars = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        lengths = np.fromiter((len(u) + 1 for u in uniques), dtype=np.int64, count=len(uniques))
+        self._starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.int64)
+        # 검색어에서 가장 드문 글자를 기준으로 후보 위치를 잡기 위한 글자 빈도
+        self._char_counts = np.bincount(self._chars) if len(self._chars) else np.zeros(1, dtype=np.int64)
+        self._build_postings(lengths)
+
+        self._overrides = {}  # 편집/추가된 행: 행 위치 -> 소문자 행 문자열
+        self.reset_history()
+
+    def __len__(self):
+        return self._n_rows + sum(1 for row in self._overrides if row >= self._n_rows)
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        :return: query가 포함된 행의 원본 행 위치 배열 (오름차순)
+        """
+        return np.flatnonzero(self._match(query))
+
+    def search_mask(self, query: str):
+        """
+        :return: 행 위치별 일치 여부 bool 배열 (빈 검색어면 필터하지 않는다는 뜻으로 None)
+        """
+        if not query.strip():
+            return None
+        return self._match(query)
+
+    def _match(self, query: str) -> np.ndarray:
+        # 행 위치별 일치 여부 (편집/추가된 행 포함, 길이 len(self))
+        query = query.lower()
+        if self._last_query is not None and self._last_query in query:
+            unique_ids = self._narrow(query, self._last_ids)
+        else:
+            unique_ids = self._scan(query)
+        self._last_query = query
+        self._last_ids = unique_ids
+
+        mask = np.zeros(len(self), dtype=bool)
+        if len(unique_ids):
+            lookup = np.zeros(len(self._uniques), dtype=bool)
+            lookup[unique_ids] = True
+            # 일치한 고유값이 있는 컬럼만 행 코드를 조회 (일치 비율이 높은 컬럼부터)
+            # 한 컬럼의 고유값이 모두 일치하면 모든 행이 일치하므로 조회 없이 끝냄
+            col_sizes = np.diff(self._col_offsets)
+            col_hits = np.zeros(len(col_sizes), dtype=np.int64)
+            filled = col_sizes > 0
+            col_hits[filled] = np.add.reduceat(lookup, self._col_offsets[:-1][filled], dtype=np.int64)
+            rows = mask[:self._n_rows]
+            for col in np.argsort(-(col_hits / np.maximum(col_sizes, 1)), kind="stable"):
+                if not col_hits[col]:
+                    break
+                if col_hits[col] == col_sizes[col]:
+                    rows[:] = True
+                    break
+                rows |= lookup[self._codes[col]]
+                if rows.all():
+                    break
+
+        if self._overrides:
+            for row, blob in self._overrides.items():
+                mask[row] = query in blob
+        return mask
+
+    def update_row(self, row: int, values, money_flags):
+        # 셀 편집 후 해당 행만 행 단위 문자열로 다시 관리
+        texts = [
+            format_column_text(pd.Series([value]), is_money)[0]
+            for value, is_money in zip(values, money_flags)
+        ]
+        self._overrides[row] = SEPARATOR.join(texts).lower()
+        self.reset_history()
+
+    def append_row(self):
+        self._overrides[len(self)] = ""
+        self.reset_history()
+
+    def _scan(self, query: str) -> np.ndarray:
+        # 전체 고유값 배열에서 벡터 비교로 부분 문자열 위치를 찾고 고유값 번호로 변환
+        needle = np.frombuffer(query.encode("utf-32-le"), dtype=np.uint32)
+        k = len(needle)
+        if k == 0 or k > len(self._chars):
+            return np.arange(len(self._uniques)) if k == 0 else np.empty(0, dtype=np.int64)
+        counts = np.array([self._char_counts[c] if c < len(self._char_counts) else 0 for c in needle])
+        if not counts.all():
+            return np.empty(0, dtype=np.int64)
+        if self._char_postings is not None:
+            # 글자 / 글자쌍 목록으로 찾음 (목록을 만들지 않았으면 아래 전체 벡터 검색)
+            if k == 1:
+                return self._char_postings.get(int(self._dense_chars[needle[0]]))
+            candidates = self._bigram_candidates(needle)
+            if k == 2:
+                return candidates
+            if len(candidates) * VERIFY_RATIO <= len(self._uniques):
+                uniques = self._uniques
+                return np.asarray([i for i in candidates.tolist() if query in uniques[i]], dtype=np.int64)
+        chars = self._chars
+
+        # 가장 드문 글자 위치에서 시작해 나머지 글자를 후보 위치에서만 비교
+        anchor = int(counts.argmin())
+        positions = np.flatnonzero(chars == needle[anchor]) - anchor
+        positions = positions[(positions >= 0) & (positions <= len(chars) - k)]
+        for j in range(k):
+            if j != anchor and len(positions):
+                positions = positions[chars[positions + j] == needle[j]]
+
+        # 위치가 오름차순이므로 고유값 번호도 오름차순 → 이웃 중복만 제거
+        ids = np.searchsorted(self._starts, positions, side="right") - 1
+        return ids[np.concatenate([[True], ids[1:] != ids[:-1]])] if len(ids) else ids
+
+    def _build_postings(self, lengths: np.ndarray):
+        # 글자 → 그 글자가 들어 있는 고유값 번호, 인접 두 글자 → 그 글자쌍이 들어 있는 고유값 번호
+        self._char_postings = self._bigram_postings = None
+        alphabet = np.flatnonzero(self._char_counts)
+        if len(self._chars) < 2 or len(alphabet) >= 1 << 16 or len(self._uniques) >= 1 << 32:
+            return  # 글자 종류/고유값이 너무 많으면 전체 검색으로만 처리
+        dense = np.zeros(len(self._char_counts), dtype=np.uint64)
+        dense[alphabet] = np.arange(len(alphabet), dtype=np.uint64)
+        self._dense_chars = dense
+        codes = dense[self._chars]
+        owners = np.repeat(np.arange(len(self._uniques), dtype=np.uint64), lengths)
+        separator = self._chars == ord(SEPARATOR)
+        self._char_postings = Postings((codes << 32 | owners)[~separator])
+        valid = ~separator[:-1] & ~separator[1:]
+        self._bigram_postings = Postings((((codes[:-1] << 16) | codes[1:]) << 32 | owners[:-1])[valid])
+
+    def _bigram_ids(self, first: int, second: int) -> np.ndarray:
+        return self._bigram_postings.get((int(self._dense_chars[first]) << 16) | int(self._dense_chars[second]))
+
+    def _bigram_candidates(self, needle: np.ndarray) -> np.ndarray:
+        # 검색어의 모든 글자쌍을 가진 고유값 번호 (두 글자 검색어면 정확한 결과, 세 글자 이상이면 후보)
+        postings = sorted((self._bigram_ids(a, b) for a, b in zip(needle[:-1], needle[1:])), key=len)
+        candidates = postings[0]
+        if len(postings) > 1 and len(candidates):
+            seen = np.zeros(len(self._uniques), dtype=bool)
+            for posting in postings[1:]:
+                seen[posting] = True
+                candidates = candidates[seen[candidates]]
+                seen[posting] = False
+        return candidates
+
+    def _narrow(self, query: str, previous_ids: np.ndarray) -> np.ndarray:
+        if len(previous_ids) * NARROW_RATIO > len(self._uniques):
+            return self._scan(query)
+        uniques = self._uniques
+        return np.asarray([i for i in previous_ids.tolist() if query in uniques[i]], dtype=np.int64)
+
+    def reset_history(self):
+        # 다음 검색을 이전 검색 결과로 좁히지 않고 처음부터 찾도록 초기화
+        self._last_query = None
+        self._last_ids = None
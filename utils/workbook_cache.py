@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".excelboo", "cache")
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 캐시 전체 용량 상한 (1GB)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 전처리 결과 형태가 바뀌면 올려서 이전 캐시를 무효화
+CACHE_VERSION = 1
+
+
+class WorkbookCache:
+    """
+    정규화가 끝난 시트 DataFrame을 Parquet 파일로 보관하는 로컬 캐시
+
+    키는 (파일 경로, 크기, 수정 시각, 내용 해시, 시트 이름)으로 만들고,
+    전체 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지운다.
+    같은 (경로, 크기, 수정 시각)이면 저장해 둔 내용 해시를 재사용해 파일을 다시 읽지 않는다.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._manifest_path = os.path.join(cache_dir, "manifest.json")
+        self._lock = threading.Lock()
+
+    # ---- 키 ----
+
+    def key_for(self, file_path: str, sheet_name: str, on_progress=None, is_cancelled=None) -> str:
+        """
+        :param on_progress: 내용 해시 계산 중 on_progress(bytes_hashed, bytes_total) 호출
+        :param is_cancelled: True를 반환하면 None을 반환
+        """
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        stat_key = f"{file_path}|{stat.st_size}|{stat.st_mtime_ns}"
+
+        with self._lock:
+            content_hash = self._read_manifest()["hashes"].get(stat_key)
+        if content_hash is None:
+            content_hash = self._hash_file(file_path, stat.st_size, on_progress, is_cancelled)
+            if content_hash is None:
+                return None
+            with self._lock:
+                manifest = self._read_manifest()
+                # 같은 경로의 예전 해시는 정리
+                manifest["hashes"] = {
+                    k: v for k, v in manifest["hashes"].items() if not k.startswith(file_path + "|")
+                }
+                manifest["hashes"][stat_key] = content_hash
+                self._write_manifest(manifest)
+
+        raw = json.dumps(
+            [CACHE_VERSION, file_path, stat.st_size, stat.st_mtime_ns, content_hash, sheet_name],
+            ensure_ascii=False,
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _hash_file(file_path, total, on_progress=None, is_cancelled=None):
+        digest = hashlib.blake2b(digest_size=20)
+        done = 0
+        with open(file_path, "rb") as f:
+            while True:
+                if is_cancelled and is_cancelled():
+                    return None
+                chunk = f.read(HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                done += len(chunk)
+                if on_progress:
+                    on_progress(done, total)
+        return digest.hexdigest()
+
+    # ---- 조회 / 저장 ----
+
+    def load(self, key: str):
+        path = self._entry_path(key)
+        with self._lock:
+            manifest = self._read_manifest()
+            entry = manifest["entries"].get(key)
+            if entry is None or not os.path.exists(path):
+                return None
+            entry["last_access"] = time.time()
+            self._write_manifest(manifest)
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            print("캐시 읽기 실패:", e)
+            self.remove(key)
+            return None
+
+    def store(self, key: str, df: pd.DataFrame, description: str = ""):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path + ".tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest["entries"][key] = {
+                "size": os.path.getsize(path),
+                "last_access": time.time(),
+                "description": description,
+            }
+            self._evict(manifest)
+            self._write_manifest(manifest)
+
+    def remove(self, key: str):
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest["entries"].pop(key, None)
+            self._remove_file(key)
+            self._write_manifest(manifest)
+
+    def clear(self):
+        with self._lock:
+            manifest = self._read_manifest()
+            for key in list(manifest["entries"]):
+                self._remove_file(key)
+            self._write_manifest({"entries": {}, "hashes": {}})
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(e["size"] for e in self._read_manifest()["entries"].values())
+
+    # ---- 내부 ----
+
+    def _evict(self, manifest):
+        # LRU: 마지막 사용 시각이 오래된 항목부터 용량 상한 아래로 내려갈 때까지 삭제
+        entries = manifest["entries"]
+        total = sum(e["size"] for e in entries.values())
+        for key, entry in sorted(entries.items(), key=lambda item: item[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= entry["size"]
+            del entries[key]
+            self._remove_file(key)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.parquet")
+
+    def _remove_file(self, key: str):
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _read_manifest(self) -> dict:
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"entries": {}, "hashes": {}}
+        manifest.setdefault("entries", {})
+        manifest.setdefault("hashes", {})
+        return manifest
+
+    def _write_manifest(self, manifest: dict):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self._manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, self._manifest_path)
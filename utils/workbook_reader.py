@@ -0,0 +1,174 @@
+import datetime
+import numpy as np
+import pandas as pd
+
+
+class _CountingFile:
+    # zip 내부를 읽는 위치를 추적해 읽은 바이트 수를 근사치로 알려주는 파일 래퍼
+    def __init__(self, f):
+        self._f = f
+        self.bytes_read = 0
+
+    def read(self, *args):
+        data = self._f.read(*args)
+        self.bytes_read = max(self.bytes_read, self._f.tell())
+        return data
+
+    def seek(self, *args):
+        return self._f.seek(*args)
+
+    def tell(self):
+        return self._f.tell()
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        self._f.close()
+
+
+class WorkbookReader:
+    """
+    xlsx 파일을 한 번만 열어 시트 목록 조회와 시트 읽기를 모두 처리하는 리더
+
+    openpyxl read-only 모드로 행을 스트리밍하면서 컬럼별 버퍼에 값을 모으고,
+    날짜/금액 컬럼은 문자열을 거치지 않고 바로 datetime64/float64로 만든다.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = _CountingFile(open(file_path, "rb"))
+        self.bytes_total = self._file._f.seek(0, 2)
+        self._file.seek(0)
+        from openpyxl import load_workbook  # 처음 파일을 열 때 불러옴 (프로그램 시작 시간 단축)
+        self._workbook = load_workbook(self._file, read_only=True, data_only=True, keep_links=False)
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return self._workbook.sheetnames
+
+    @property
+    def bytes_read(self) -> int:
+        return self._file.bytes_read
+
+    def close(self):
+        if self._workbook is not None:
+            self._workbook.close()
+            self._file.close()
+            self._workbook = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def read_sheet(self, sheet_name: str, date_columns=(), money_columns=(),
+                   on_progress=None, is_cancelled=None, chunk_rows: int = 5000) -> pd.DataFrame:
+        """
+        시트를 컬럼 버퍼로 읽어 DataFrame을 만든다.
+
+        :param sheet_name: 읽을 시트 이름
+        :param date_columns: datetime64로 변환할 컬럼명 (정리된 컬럼명 기준)
+        :param money_columns: float64로 변환할 금액 컬럼명
+        :param on_progress: chunk_rows 행마다 on_progress(rows_parsed) 호출
+        :param is_cancelled: True를 반환하면 None을 반환하고 읽기를 중단
+        """
+        sheet = self._workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        columns = _clean_header(header)
+        width = len(columns)
+        buffers = [[] for _ in range(width)]
+
+        parsed = 0
+        last_non_empty = 0
+        for row in rows:
+            if len(row) < width:
+                row = tuple(row) + (None,) * (width - len(row))
+            empty = True
+            for buf, value in zip(buffers, row):
+                buf.append(value)
+                if value is not None and value != "":
+                    empty = False
+            parsed += 1
+            if not empty:
+                last_non_empty = parsed
+            if parsed % chunk_rows == 0:
+                if is_cancelled and is_cancelled():
+                    return None
+                if on_progress:
+                    on_progress(parsed)
+
+        # 서식만 남아 있는 끝부분 빈 행 제거
+        if last_non_empty < parsed:
+            buffers = [buf[:last_non_empty] for buf in buffers]
+        if on_progress:
+            on_progress(last_non_empty)
+
+        date_columns = set(date_columns)
+        money_columns = set(money_columns)
+        data = {}
+        for name, buf in zip(columns, buffers):
+            if name in date_columns:
+                data[name] = _to_datetime(buf)
+            elif name in money_columns:
+                data[name] = _to_money(buf)
+            else:
+                data[name] = _to_text(buf)
+        return pd.DataFrame(data, columns=columns)
+
+
+def _clean_header(header) -> list[str]:
+    columns = []
+    seen = {}
+    for i, value in enumerate(header):
+        name = "" if value is None else str(value)
+        name = name.strip().replace("\n", "").replace("\r", "")
+        if not name:
+            name = f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+
+def _to_datetime(values) -> pd.Series:
+    return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce")
+
+
+def _to_money(values) -> np.ndarray:
+    out = np.zeros(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        if value is None:
+            continue
+        if isinstance(value, (int, float)):
+            out[i] = value
+            continue
+        text = str(value).replace(",", "").replace("₩", "").strip()
+        if text:
+            out[i] = float(text)
+    return out
+
+
+def _to_text(values) -> np.ndarray:
+    # pandas read_excel(dtype=str)과 같은 문자열 표현 (정수 실수는 소수점 제거)
+    out = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        if value is None:
+            out[i] = ""
+        elif isinstance(value, str):
+            out[i] = value
+        elif isinstance(value, float) and value.is_integer():
+            out[i] = str(int(value))
+        elif isinstance(value, datetime.datetime):
+            out[i] = str(pd.Timestamp(value))
+        else:
+            out[i] = str(value)
+    return out
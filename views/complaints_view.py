@@ -1,12 +1,17 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QFileDialog, QHBoxLayout
-from PyQt6.QtWidgets import QLineEdit, QApplication
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableView, QPushButton, QFileDialog, QHBoxLayout
+from PyQt6.QtWidgets import QLineEdit, QApplication, QLabel, QProgressBar
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 import pandas as pd
 import os
 from dialogs.sheet_select_dialog import SheetSelectDialog
+from widgets.dataframe_table_model import DataFrameTableModel
+from utils.excel_loader import DatasetBuildWorker, ExcelLoadWorker, MONEY_COLUMNS
+from utils.workbook_reader import WorkbookReader
+from utils.workbook_cache import WorkbookCache
 
 class ComplaintsView(QWidget):
     data_loaded = pyqtSignal(pd.DataFrame)
+    dataset_changed = pyqtSignal(object)  # ComplaintDataset (로딩 완료 / 편집 반영 시)
 
     def __init__(self):
         super().__init__()
@@ -15,8 +20,35 @@ class ComplaintsView(QWidget):
         layout = QVBoxLayout(self)
 
         self.last_dir = ""
+        self.workbook_cache = WorkbookCache()
 
-        self.table = QTableWidget()
+        self.model = DataFrameTableModel(money_columns=MONEY_COLUMNS)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
+
+        # 편집이 이어지는 동안에는 모았다가 한 번만 리포트 데이터셋 재구성 (백그라운드 스레드)
+        # 편집/새 파일마다 세대 번호를 올려, 계산 중에 낡아진 결과는 버린다
+        self.dataset = None
+        self._dataset_generation = 0
+        self._rebuild_thread = None
+        self._rebuild_worker = None
+        self._rebuild_pending = False
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(500)
+        self._rebuild_timer.timeout.connect(self.rebuild_dataset)
+        self.model.dataChanged.connect(self._rebuild_timer.start)
+        self.model.rowsInserted.connect(self._rebuild_timer.start)
+
+        # 검색: 로딩 시 만든 인덱스 사용, 빠른 연속 입력은 마지막 입력 한 번으로 모아서 처리
+        self.search_index = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(lambda: self.search_data(self.search_box.text()))
+        self.model.dataChanged.connect(self.on_cells_edited)
+        self.model.rowsInserted.connect(self.on_rows_inserted)
 
         # Create a horizontal layout for the buttons
         button_layout = QHBoxLayout()
@@ -39,98 +71,169 @@ class ComplaintsView(QWidget):
         # Add the horizontal button layout before the search box
         layout.addLayout(button_layout)
 
+        # 불러오기 진행 상황 (로딩 중에만 표시)
+        self._load_thread = None
+        self._load_worker = None
+        self.progress_frame = QWidget()
+        progress_layout = QHBoxLayout(self.progress_frame)
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+        self.progress_label = QLabel()
+        self.progress_bar = QProgressBar()
+        self.cancel_button = QPushButton("취소")
+        self.cancel_button.clicked.connect(self.cancel_loading)
+        progress_layout.addWidget(self.progress_label)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+        self.progress_frame.hide()
+        layout.addWidget(self.progress_frame)
+
         self.search_box = QLineEdit()
         self.search_box.setProperty("class", "search-box")
         self.search_box.setPlaceholderText("검색어를 입력하세요...")
-        self.search_box.textChanged.connect(self.search_data)
+        self.search_box.textChanged.connect(self._search_timer.start)
         layout.addWidget(self.search_box)
         layout.addWidget(self.table)
 
     def load_excel(self):
         try:
+            if self._load_thread is not None:
+                return
             dialog = QFileDialog(self)
             dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
             file, _ = dialog.getOpenFileName(self, "엑셀 파일 선택", self.last_dir, "Excel Files (*.xlsx)")
             if file:
                 self.last_dir = os.path.dirname(file)
-                excel_file = pd.ExcelFile(file)
-                sheet_names = excel_file.sheet_names
+                # 파일은 한 번만 열고, 시트 목록 조회와 시트 읽기에 같이 사용
+                reader = WorkbookReader(file)
 
                 # 시트 선택 다이얼로그
                 QApplication.setStyle("Fusion")
-                dialog = SheetSelectDialog(sheet_names, is_dark_mode=False, parent=self)
-                if dialog.exec():
-                    sheet = dialog.get_selected_sheet()
-                    df = pd.read_excel(file, sheet_name=sheet, dtype=str).fillna("")
-                    # ✅ 컬럼명 공백 및 줄바꿈 제거
-                    df.columns = df.columns.str.strip().str.replace("\n", "").str.replace("\r", "")
-
-                    # ✅ 날짜 컬럼을 datetime으로 변환하고 NaT는 공백 처리
-                    date_cols = ["접수일", "처리기한", "처리완료일", "취소일자", "입금일자"]
-                    for col in date_cols:
-                        if col in df.columns:
-                            df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
-                            df[col] = df[col].fillna("")
-
-                    # ✅ 금액 컬럼을 float으로 변환
-                    money_cols = ["승인금액", "입금금액"]
-                    for col in money_cols:
-                        if col in df.columns:
-                            df[col] = (
-                                df[col]
-                                .astype(str)
-                                .str.replace(",", "", regex=False)
-                                .str.replace("₩", "", regex=False)
-                                .str.strip()
-                                .replace("", "0")
-                                .astype(float)
-                            )
-
-                    self.original_df = df.copy()
-                    self.table.setRowCount(len(df))
-                    self.table.setColumnCount(len(df.columns))
-                    self.table.setHorizontalHeaderLabels(df.columns)
-
-                    self.table.setSortingEnabled(False)
-
-                    for i in range(len(df)):
-                        for j, col in enumerate(df.columns):
-                            val = df.iloc[i, j]
-                            if col in ["승인금액", "입금금액"]:
-                                try:
-                                    val = f"{int(float(val)):,}"
-                                except:
-                                    val = str(val)
-                            else:
-                                val = str(val)
-                            item = QTableWidgetItem(val)
-                            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-                            if col in ["승인금액", "입금금액"]:
-                                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                            else:
-                                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                            self.table.setItem(i, j, item)
-
-                    self.table.setSortingEnabled(True)
-                    self.data_loaded.emit(df)
+                dialog = SheetSelectDialog(reader.sheet_names, is_dark_mode=False, parent=self)
+                if dialog.exec() and dialog.get_selected_sheet():
+                    self.start_loading(reader, dialog.get_selected_sheet())
+                else:
+                    reader.close()
         except Exception as e:
             print("엑셀 불러오기 실패:", e)
 
-    def save_to_excel(self):
-        try:
-            rows = self.table.rowCount()
-            cols = self.table.columnCount()
-            headers = [self.table.horizontalHeaderItem(j).text() for j in range(cols)]
+    def start_loading(self, reader, sheet):
+        # 백그라운드 스레드에서 시트 읽기 시작
+        self._load_thread = QThread(self)
+        self._load_worker = ExcelLoadWorker(reader, sheet, cache=self.workbook_cache)
+        self._load_worker.moveToThread(self._load_thread)
+
+        self._load_thread.started.connect(self._load_worker.run)
+        self._load_worker.progress.connect(self.on_load_progress)
+        self._load_worker.finished.connect(self.on_load_finished)
+        self._load_worker.failed.connect(self.on_load_failed)
+        self._load_worker.cancelled.connect(self.on_load_cancelled)
+        for signal in (self._load_worker.finished, self._load_worker.failed, self._load_worker.cancelled):
+            signal.connect(self._load_thread.quit)
+        self._load_thread.finished.connect(self.cleanup_loading)
+
+        self.load_button.setEnabled(False)
+        self.progress_label.setText("불러오는 중...")
+        self.progress_bar.setRange(0, 0)
+        self.progress_frame.show()
+        self._load_thread.start()
+
+    def cancel_loading(self):
+        if self._load_worker is not None:
+            self._load_worker.cancel()
+            self.progress_label.setText("취소하는 중...")
+
+    def on_load_progress(self, stage, bytes_read, bytes_total, rows_parsed):
+        if stage in ("파일 확인 중", "시트 읽는 중") and bytes_total > 0:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(int(bytes_read / bytes_total * 100))
+        else:
+            self.progress_bar.setRange(0, 0)
+        text = f"{stage} ({bytes_read / 1024 / 1024:.1f}MB / {bytes_total / 1024 / 1024:.1f}MB"
+        if rows_parsed:
+            text += f", {rows_parsed:,}행"
+        self.progress_label.setText(text + ")")
+
+    def on_load_finished(self, df, dataset, search_index):
+        self.search_index = search_index
+        self.model.set_dataframe(df)
+        self.table.sortByColumn(-1, Qt.SortOrder.AscendingOrder)
+        if self.search_box.text().strip():
+            self._search_timer.start()
+        self.data_loaded.emit(df)
+        self._dataset_generation += 1  # 이전 파일 기준으로 진행 중인 재구성 결과는 버림
+        self._rebuild_pending = False
+        self.publish_dataset(dataset)
+
+    def rebuild_dataset(self):
+        df = self.model.dataframe()
+        if df.empty or "접수일" not in df.columns:
+            return
+        self._dataset_generation += 1
+        if self._rebuild_thread is not None:
+            self._rebuild_pending = True  # 진행 중인 계산이 끝나면 최신 편집으로 한 번 더
+            return
+        self.start_rebuild(df)
+
+    def start_rebuild(self, df):
+        # 편집 스냅샷으로 백그라운드 스레드에서 데이터셋 재구성
+        self._rebuild_pending = False
+        self._rebuild_thread = QThread(self)
+        self._rebuild_worker = DatasetBuildWorker(df.copy(deep=False), self._dataset_generation)
+        self._rebuild_worker.moveToThread(self._rebuild_thread)
+
+        self._rebuild_thread.started.connect(self._rebuild_worker.run)
+        self._rebuild_worker.finished.connect(self.on_rebuild_finished)
+        self._rebuild_worker.failed.connect(self.on_rebuild_failed)
+        for signal in (self._rebuild_worker.finished, self._rebuild_worker.failed):
+            signal.connect(self._rebuild_thread.quit)
+        self._rebuild_thread.finished.connect(self.cleanup_rebuild)
+        self._rebuild_thread.start()
+
+    def on_rebuild_finished(self, generation, dataset):
+        if generation != self._dataset_generation:
+            return  # 계산하는 동안 다시 편집됐거나 새 파일을 불러옴
+        self.publish_dataset(dataset)
 
-            data = []
-            for i in range(rows):
-                row = []
-                for j in range(cols):
-                    item = self.table.item(i, j)
-                    row.append(item.text() if item else "")
-                data.append(row)
+    def on_rebuild_failed(self, message):
+        print("리포트 데이터 갱신 실패:", message)
 
-            df = pd.DataFrame(data, columns=headers)
+    def cleanup_rebuild(self):
+        self._rebuild_worker.deleteLater()
+        self._rebuild_thread.deleteLater()
+        self._rebuild_worker = None
+        self._rebuild_thread = None
+        if self._rebuild_pending:
+            self.start_rebuild(self.model.dataframe())
+
+    def wait_rebuild(self):
+        # 종료 전 데이터셋 재구성 스레드가 끝날 때까지 기다림
+        self._rebuild_pending = False
+        if self._rebuild_thread is not None:
+            self._rebuild_thread.quit()
+            self._rebuild_thread.wait()
+
+    def publish_dataset(self, dataset):
+        self.dataset = dataset
+        self.dataset_changed.emit(dataset)
+
+    def on_load_failed(self, message):
+        print("엑셀 불러오기 실패:", message)
+
+    def on_load_cancelled(self):
+        print("엑셀 불러오기 취소됨")
+
+    def cleanup_loading(self):
+        self.progress_frame.hide()
+        self.load_button.setEnabled(True)
+        self._load_worker.deleteLater()
+        self._load_thread.deleteLater()
+        self._load_worker = None
+        self._load_thread = None
+
+    def save_to_excel(self):
+        try:
+            # 화면에 보이는 행(검색/정렬 반영)을 그대로 저장
+            df = self.model.visible_dataframe()
 
             dialog = QFileDialog(self)
             dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
@@ -140,48 +243,32 @@ class ComplaintsView(QWidget):
                 df.to_excel(file, index=False)
         except Exception as e:
             print("엑셀 저장 실패:", e)
+
     def add_row(self):
-        self.table.setSortingEnabled(False)
-        current_rows = self.table.rowCount()
-        self.table.insertRow(current_rows)
-        for col in range(self.table.columnCount()):
-            item = QTableWidgetItem("")
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(current_rows, col, item)
-        self.table.setSortingEnabled(True)
+        self.model.append_empty_row()
+        self.table.scrollToBottom()
 
     def search_data(self, text):
-        if not hasattr(self, 'original_df'):
+        if self.search_index is None:
             return
 
-        filtered_df = self.original_df[self.original_df.apply(
-            lambda row: text.lower() in ''.join(row.astype(str)).lower(), axis=1
-        )]
-
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(filtered_df))
-        self.table.setColumnCount(len(filtered_df.columns))
-        self.table.setHorizontalHeaderLabels(filtered_df.columns)
-
-        for i in range(len(filtered_df)):
-            for j, col in enumerate(filtered_df.columns):
-                val = filtered_df.iloc[i, j]
-                if col in ["승인금액", "입금금액"]:
-                    try:
-                        val = f"{int(float(val)):,}"
-                    except:
-                        val = str(val)
-                else:
-                    val = str(val)
-                item = QTableWidgetItem(val)
-                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-                if col in ["승인금액", "입금금액"]:
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                else:
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                # Reset background to default
-                item.setBackground(Qt.GlobalColor.white)
-                if text.lower() in val.lower() and text.strip() != "":
-                    item.setBackground(Qt.GlobalColor.yellow)
-                self.table.setItem(i, j, item)
-        self.table.setSortingEnabled(True)
\ No newline at end of file
+        # 빈 검색어는 필터하지 않음 (search_mask가 None)
+        mask = self.search_index.search_mask(text)
+        if mask is None:
+            self.model.set_row_filter(None)
+            return
+        self.model.set_row_filter(mask, highlight=text)
+
+    def on_cells_edited(self, top_left, bottom_right, roles=None):
+        if self.search_index is None:
+            return
+        df = self.model.dataframe()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            source = self.model.source_row(row)
+            self.search_index.update_row(source, df.iloc[source].tolist(), self.model.money_flags)
+
+    def on_rows_inserted(self, parent, first, last):
+        if self.search_index is None:
+            return
+        for _ in range(first, last + 1):
+            self.search_index.append_row()
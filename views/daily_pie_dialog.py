@@ -1,9 +1,19 @@
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QComboBox, QLabel
-from PyQt6.QtWidgets import QFileDialog, QPushButton
-from utils.pdf_chart_exporter import export_qchartview_to_pdf
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QLabel, QSpinBox, QStackedWidget
+from PyQt6.QtWidgets import QFileDialog, QPushButton, QSizePolicy
+from PyQt6.QtCore import QTimer
+from PyQt6.QtCharts import QChart
+from functools import partial
+from utils.chart_renderer import ChartRenderer
+from utils.report_cache import ReportCache
+from dialogs.export_progress_dialog import start_export
 import pandas as pd
+from reports.charts import DAILY_SHARE_COLUMNS, PIE_TOP_N, daily_share_by_date, daily_share_chart, daily_share_chart_data, top_n_share
 from widgets.pie_chart_widget import PieChartWidget
 
+# 그려 둔 날짜별 차트 이미지 캐시 상한 (600x500 이미지 한 장이 대략 1MB)
+PIXMAP_CACHE_ENTRIES = 120
+PIXMAP_CACHE_BYTES = 128 * 1024 * 1024
+
 class DailyPieDialog(QDialog):
     def __init__(self, df: pd.DataFrame, parent=None):
         super().__init__(parent)
@@ -15,54 +25,103 @@ class DailyPieDialog(QDialog):
         self.layout = QVBoxLayout()
 
         # 콤보박스용 데이터 로딩
-        self.df = df.copy()
-        self.df["접수일"] = pd.to_datetime(self.df["접수일"], errors="coerce").dt.date
-        self.dates = sorted(self.df["접수일"].dropna().unique())
-        
+        # df는 공용 ComplaintDataset.frame (접수일이 이미 날짜 단위 datetime64, 복사하지 않음)
+        self.df = df
+        self.dates = sorted(self.df["접수일"].unique())
+
+        # ✅ 날짜별 가맹점 건수/비중을 groupby 한 번으로 미리 계산 (날짜를 넘길 때는 조회만)
+        self.reports = daily_share_by_date(self.df)
+
+        # ✅ 한 번 그린 날짜는 이미지로 보관해 다시 선택하면 바로 표시 (키: (날짜, 표시 가맹점 수))
+        self.pixmaps = ReportCache(max_entries=PIXMAP_CACHE_ENTRIES, max_bytes=PIXMAP_CACHE_BYTES)
+        self.current_key = None
+        self.snapshot_timer = QTimer(self)
+        self.snapshot_timer.setSingleShot(True)
+        self.snapshot_timer.timeout.connect(self.cache_snapshot)
 
         # 날짜 선택 콤보박스
         self.combo = QComboBox()
         for d in self.dates:
-            self.combo.addItem(str(d))
+            self.combo.addItem(pd.Timestamp(d).strftime("%Y-%m-%d"))
         self.combo.currentIndexChanged.connect(self.update_chart)
 
         self.layout.addWidget(QLabel("날짜 선택"))
         self.layout.addWidget(self.combo)
 
+        # 표시할 가맹점 수 (건수 상위 N곳, 나머지는 "기타" 한 조각)
+        self.top_n_spin = QSpinBox()
+        self.top_n_spin.setRange(1, 50)
+        self.top_n_spin.setValue(PIE_TOP_N)
+        self.top_n_spin.valueChanged.connect(self.update_chart)
+        top_n_layout = QHBoxLayout()
+        top_n_layout.addWidget(QLabel("표시할 가맹점 수 (나머지는 기타)"))
+        top_n_layout.addWidget(self.top_n_spin)
+        top_n_layout.addStretch()
+        self.layout.addLayout(top_n_layout)
+
         self.export_button = QPushButton("PDF로 저장")
         self.export_button.clicked.connect(self.export_pdf)
         self.layout.addWidget(self.export_button)
 
+        # 차트 위젯과 캐시된 이미지를 같은 자리에 겹쳐 두고 전환
+        self.stack = QStackedWidget()
+        self.stack.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.snapshot = QLabel()
+        self.stack.addWidget(self.snapshot)
+        self.layout.addWidget(self.stack)
+
         # 첫 날짜 차트 생성
         self.chart = None
         self.update_chart()
 
         self.setLayout(self.layout)
 
+    def selected_report(self) -> pd.DataFrame:
+        # 선택 날짜의 가맹점별 건수/비중 (미리 계산한 결과 조회)
+        index = self.combo.currentIndex()
+        if index < 0:
+            return pd.DataFrame(columns=DAILY_SHARE_COLUMNS)
+        return self.reports.get(pd.Timestamp(self.dates[index]), pd.DataFrame(columns=DAILY_SHARE_COLUMNS))
+
     def update_chart(self):
         # 현재 날짜 선택
         selected_date = self.combo.currentText()
         if not selected_date:
             return
 
-        filtered = self.df[self.df["접수일"] == pd.to_datetime(selected_date).date()]
-        total = filtered["TID명"].count()
-        data_dict = {
-            name: {"count": count, "percent": round(count / total * 100, 1)}
-            for name, count in filtered.groupby("가맹점명")["TID명"].count().items()
-        }
-        chart_data = {k: v["count"] for k, v in data_dict.items()}
-
-        # 기존 차트 제거
-        if self.chart:
-            self.layout.removeWidget(self.chart)
-            self.chart.deleteLater()
-
-        # 새 차트 추가
-        self.chart = PieChartWidget(f"{selected_date} 가맹점별 민원 비중", chart_data)
-        from PyQt6.QtWidgets import QSizePolicy
-        self.chart.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
-        self.layout.addWidget(self.chart)
+        top_n = self.top_n_spin.value()
+        self.current_key = (selected_date, top_n)
+
+        # 이미 그려 본 날짜면 이미지만 바꿔 끼움
+        pixmap = self.pixmaps.get(self.current_key)
+        if pixmap is not None:
+            self.snapshot_timer.stop()
+            self.snapshot.setPixmap(pixmap)
+            self.stack.setCurrentWidget(self.snapshot)
+            return
+
+        chart_data = daily_share_chart_data(top_n_share(self.selected_report(), top_n))
+        title = f"{selected_date} 가맹점별 민원 비중"
+
+        if self.chart is None:
+            # 처음 한 번만 차트 추가
+            self.chart = PieChartWidget(title, chart_data)
+            self.stack.addWidget(self.chart)
+        else:
+            # 차트가 이미 있으면 조각 값만 제자리 갱신
+            self.chart.set_data(title, chart_data)
+        self.stack.setCurrentWidget(self.chart)
+
+        # 갱신 애니메이션이 끝난 뒤 화면을 이미지로 보관 (그 사이 다른 날짜로 넘어가면 취소)
+        chart = self.chart.chart_view.chart()
+        animated = chart.animationOptions() != QChart.AnimationOption.NoAnimation
+        self.snapshot_timer.start(chart.animationDuration() + 50 if animated else 0)
+
+    def cache_snapshot(self):
+        if self.current_key is None or self.stack.currentWidget() is not self.chart or not self.chart.isVisible():
+            return
+        pixmap = self.chart.grab()
+        self.pixmaps.put(self.current_key, pixmap, nbytes=pixmap.width() * pixmap.height() * pixmap.depth() // 8)
 
     def export_pdf(self):
         if not self.chart:
@@ -71,4 +130,8 @@ class DailyPieDialog(QDialog):
         if file_path:
             selected_date = self.combo.currentText()
             title = f"{selected_date} 가맹점별 민원 비중 차트"
-            export_qchartview_to_pdf(self.chart.chart_view, file_path, title=title)
\ No newline at end of file
+            # 표시 중인 화면 대신 같은 데이터로 차트를 새로 만들어 용지 크기로 기록하고, PDF 파일 쓰기만 백그라운드에서 실행
+            renderer = ChartRenderer(orientation="landscape")
+            chart = daily_share_chart(f"{selected_date} 가맹점별 민원 비중", self.selected_report(), self.top_n_spin.value())
+            picture = renderer.record(chart)
+            start_export(self, partial(renderer.write_pdf, picture, title=title), file_path, title)
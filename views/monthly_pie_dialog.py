@@ -1,25 +1,30 @@
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QComboBox, QLabel, QFileDialog, QPushButton
-from utils.pdf_chart_exporter import export_qchartview_to_pdf
-import pandas as pd
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QComboBox, QLabel, QFileDialog, QPushButton, QSizePolicy
+from PyQt6.QtCore import Qt
+from functools import partial
+from utils.chart_renderer import ChartRenderer
+from dialogs.export_progress_dialog import start_export
+from reports.trend import TrendMatrix
+from reports.charts import build_monthly_rate, monthly_rate_chart, monthly_rate_chart_data, top_n_rate
 from widgets.bar_chart_widget import BarChartWidget
 
 class MonthlyPieDialog(QDialog):
     # 바 차트로 구성된 월별 증감률 다이얼로그
-    def __init__(self, df: pd.DataFrame, parent=None):
+    def __init__(self, trend: TrendMatrix, parent=None):
         super().__init__(parent)
         self.setWindowTitle("월 단위 민원 비중 차트")
         self.resize(500, 400)
 
         self.layout = QVBoxLayout()
 
-        self.df = df.copy()
-        self.df["접수일"] = pd.to_datetime(self.df["접수일"], errors="coerce")
-        self.df["연월"] = self.df["접수일"].dt.to_period("M")
-        self.months = sorted(self.df["연월"].dropna().unique())
+        # trend는 공용 ComplaintDataset.trend (데이터셋마다 한 번 만든 (가맹점, 카드사) x 월 건수 행렬)
+        self.trend = trend
+        self.months = [f"{y}-{m:02d}" for y, m in trend.periods]
 
+        # 가장 최근 월을 기본 선택 (첫 달은 비교할 전월이 없음)
         self.combo = QComboBox()
         for m in self.months:
-            self.combo.addItem(str(m))
+            self.combo.addItem(m)
+        self.combo.setCurrentIndex(len(self.months) - 1)
         self.combo.currentIndexChanged.connect(self.update_chart)
 
         self.layout.addWidget(QLabel("월 선택"))
@@ -29,7 +34,14 @@ class MonthlyPieDialog(QDialog):
         self.export_button.clicked.connect(self.export_pdf)
         self.layout.addWidget(self.export_button)
 
+        # 첫 달을 고르면 차트 대신 표시
+        self.placeholder = QLabel("비교 월 없음 (전월 데이터가 없는 첫 달입니다)")
+        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.placeholder.hide()
+        self.layout.addWidget(self.placeholder)
+
         self.chart = None
+        self.report = None
 
         self.setLayout(self.layout)
 
@@ -37,61 +49,35 @@ class MonthlyPieDialog(QDialog):
 
     def update_chart(self):
         selected_month = self.combo.currentText()
-        if not selected_month or not self.df is not None:
+        if not selected_month or self.trend is None:
             return
 
         try:
-            selected_period = pd.Period(selected_month)
-            df = self.df.copy()
-            df["월"] = df["접수일"].dt.to_period("M").astype(str)
-            df["카드사"] = df["카드사"].astype(str).str.strip()
-            df["가맹점명"] = df["가맹점명"].astype(str).str.strip()
-
-            grouped = df.groupby(["월", "가맹점명", "카드사"]).size().reset_index(name="민원건수")
-            pivot = grouped.pivot_table(index=["가맹점명", "카드사"], columns="월", values="민원건수", fill_value=0)
-            pivot = pivot.sort_index(axis=1)
-
-            if selected_month not in pivot.columns:
-                chart_data = {}
-                if self.chart:
-                    self.layout.removeWidget(self.chart)
-                    self.chart.deleteLater()
-                self.chart = BarChartWidget(f"{selected_month} 가맹점별 카드사 증감률", chart_data)
-                from PyQt6.QtWidgets import QSizePolicy
-                self.chart.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
-                self.layout.addWidget(self.chart)
+            year, month = (int(v) for v in selected_month.split("-"))
+            if self.combo.currentIndex() == 0:
+                # 전월이 존재하지 않음 → 이전 달 차트를 남기지 않고 안내 문구 표시
+                self.report = None
+                if self.chart is not None:
+                    self.chart.hide()
+                self.placeholder.show()
+                self.export_button.setEnabled(False)
+                return
+            self.placeholder.hide()
+            self.export_button.setEnabled(True)
+
+            # 화면은 가맹점을 건수 순으로 모두 두고 쪽을 나눠 표시 (카드사만 상위 N개 + 기타로 묶음)
+            self.report = build_monthly_rate(self.trend, year, month)
+            chart_data = monthly_rate_chart_data(top_n_rate(self.report, top_n=None))
+
+            title = f"{selected_month} 가맹점별 카드사 민원 증감률"
+
+            # 차트가 이미 있으면 막대 값만 제자리 갱신
+            if self.chart is not None:
+                self.chart.set_data(title, chart_data)
+                self.chart.show()
                 return
 
-            month_index = list(pivot.columns).index(selected_month)
-            if month_index == 0:
-                return  # 전월이 존재하지 않음
-
-            pre_month = list(pivot.columns)[month_index - 1]
-            cur_month = selected_month
-
-            pivot = pivot.reset_index()
-            merchants = pivot["가맹점명"].unique()
-            chart_data = {}
-
-            for merchant in merchants:
-                merchant_df = pivot[pivot["가맹점명"] == merchant]
-                card_data = {}
-                for _, row in merchant_df.iterrows():
-                    pre = row.get(pre_month, 0)
-                    cur = row.get(cur_month, 0)
-                    if pre == 0:
-                        rate = 0
-                    else:
-                        rate = ((cur - pre) / pre) * 100
-                    card_data[row["카드사"]] = round(rate, 1)
-                chart_data[merchant] = card_data
-
-            if self.chart:
-                self.layout.removeWidget(self.chart)
-                self.chart.deleteLater()
-
-            self.chart = BarChartWidget(f"{selected_month} 가맹점별 카드사 민원 증감률", chart_data)
-            from PyQt6.QtWidgets import QSizePolicy
+            self.chart = BarChartWidget(title, chart_data)
             self.chart.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
             self.layout.addWidget(self.chart)
 
@@ -99,10 +85,14 @@ class MonthlyPieDialog(QDialog):
             print(f"차트 갱신 오류: {e}")
 
     def export_pdf(self):
-        if not self.chart:
+        if not self.chart or self.report is None:
             return
         file_path, _ = QFileDialog.getSaveFileName(self, "PDF로 저장", "", "PDF Files (*.pdf)")
         if file_path:
             selected_month = self.combo.currentText()
             title = f"{selected_month} 가맹점별 카드사 증감률"
-            export_qchartview_to_pdf(self.chart.chart_view, file_path, title=title)
\ No newline at end of file
+            # 표시 중인 위젯 대신 같은 데이터로 차트를 새로 만들어 용지 크기로 기록하고, PDF 파일 쓰기만 백그라운드에서 실행
+            # (한 장에 들어가도록 상위 가맹점 + 기타로 묶음, 명령줄 저장과 같은 차트)
+            renderer = ChartRenderer(orientation="landscape")
+            picture = renderer.record(monthly_rate_chart(self.chart.title, self.report))
+            start_export(self, partial(renderer.write_pdf, picture, title=title), file_path, title)
\ No newline at end of file
@@ -1,85 +1,65 @@
 import sys
-from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from itertools import islice
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
 from PyQt6.QtCharts import QChart, QChartView, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis
 from PyQt6.QtGui import QPainter, QFont, QColor
 from PyQt6.QtCore import Qt, QMarginsF, QSize
+from reports.charts import OTHERS_LABEL
+
+BAR_COLORS = [
+    "#e41a1c",  # red
+    "#377eb8",  # blue
+    "#4daf4a",  # green
+    "#984ea3",  # purple
+    "#ff7f00",  # orange
+    "#ffff33",  # yellow
+    "#a65628",  # brown
+    "#f781bf",  # pink
+    "#999999",  # grey
+    "#66c2a5"   # teal
+]
+ANIMATION_MAX_ITEMS = 50  # 막대가 이보다 많으면 애니메이션 생략
+PAGE_SIZE = 20            # 한 쪽에 표시할 가맹점 수
 
 
 class BarChartWidget(QWidget):
-    def __init__(self, title: str, data: dict[str, int], parent=None):
+    def __init__(self, title: str, data: dict[str, dict[str, float]], parent=None, page_size: int = PAGE_SIZE):
         """
         재사용 가능한 그룹화 막대 차트 위젯 클래스 (PDF 저장용 고정 사이즈)
 
+        가맹점이 많으면 page_size개씩 쪽을 나눠 현재 쪽의 막대만 그린다 (가맹점 수와 상관없이 차트 구성 시간 일정).
+
         :param title: 차트 제목 (문자열)
-        :param data: 막대 차트에 표시할 데이터 (예: {"A": 10, "B": 20})
+        :param data: {"가맹점": {"카드사": 값}} 형태의 데이터 (표시 순서대로 정렬된 전체 가맹점)
         :param parent: 부모 위젯
+        :param page_size: 한 쪽에 표시할 가맹점 수
         """
         super().__init__(parent)
         self.title = title
         self.data = data
+        self.page_size = page_size
+        self.page = 0
         self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout(self)
 
-        chart = QChart()
-        chart.setTitle(self.title)
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
-
-        if sys.platform == "darwin":
-            font = QFont("Apple SD Gothic Neo", 12)
-        else:
-            font = QFont("Malgun Gothic", 12)
-        font.setPointSize(14)
-        chart.setFont(font)
-
-        series = QBarSeries()
-
-        merchants = list(self.data.keys())
-        all_cards = set()
-        for card_data in self.data.values():
-            all_cards.update(card_data.keys())
-        all_cards = sorted(all_cards)
-
-        colors = [
-            "#e41a1c",  # red
-            "#377eb8",  # blue
-            "#4daf4a",  # green
-            "#984ea3",  # purple
-            "#ff7f00",  # orange
-            "#ffff33",  # yellow
-            "#a65628",  # brown
-            "#f781bf",  # pink
-            "#999999",  # grey
-            "#66c2a5"   # teal
-        ]
-
-        for card in all_cards:
-            bar_set = QBarSet(card)
-            bar_set.setColor(QColor(colors[all_cards.index(card) % len(colors)]))
-            for merchant in merchants:
-                bar_set.append(self.data[merchant].get(card, 0))
-            series.append(bar_set)
-
-        chart.addSeries(series)
-
-        axis_x = QBarCategoryAxis()
-        axis_x.append(merchants)
-        chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
-        axis_x.setLabelsAngle(40)
-        series.attachAxis(axis_x)
-
-        axis_y = QValueAxis()
-        chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
-        series.attachAxis(axis_y)
-
-        chart.legend().setVisible(True)
-        chart.legend().setAlignment(Qt.AlignmentFlag.AlignRight)
-        legend_font = QFont(font)
-        legend_font.setPointSizeF(16.0)  # or 12.0 등으로 조정
-        chart.legend().setFont(legend_font)
-
-        self.chart_view = QChartView(chart)
+        # 쪽 이동 (가맹점이 한 쪽을 넘을 때만 표시)
+        self.prev_button = QPushButton("◀ 이전")
+        self.prev_button.clicked.connect(lambda: self.set_page(self.page - 1))
+        self.next_button = QPushButton("다음 ▶")
+        self.next_button.clicked.connect(lambda: self.set_page(self.page + 1))
+        self.page_label = QLabel()
+        self.page_bar = QWidget()
+        page_layout = QHBoxLayout(self.page_bar)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.addWidget(self.prev_button)
+        page_layout.addWidget(self.page_label)
+        page_layout.addWidget(self.next_button)
+        page_layout.addStretch()
+        layout.addWidget(self.page_bar)
+
+        self.chart_view = QChartView(build_bar_chart(self.title, self.page_data()))
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # ✅ A4 사이즈 기준 고정 크기 설정 (단위: px, 300dpi 기준)
@@ -89,6 +69,55 @@ class BarChartWidget(QWidget):
 
         layout.addWidget(self.chart_view)
         self.setLayout(layout)
+        self.update_page_bar()
+
+    def set_data(self, title: str, data: dict[str, dict[str, float]]):
+        """
+        차트를 새로 만들지 않고 제목과 막대 값만 제자리 갱신 (월을 빠르게 넘길 때 사용, 첫 쪽으로 이동)
+        """
+        self.title = title
+        self.data = data
+        self.page = 0
+        self.chart_view.chart().setTitle(title)
+        self.show_page()
+
+    def page_count(self) -> int:
+        return max(1, -(-len(self.data) // self.page_size))
+
+    def page_data(self) -> dict[str, dict[str, float]]:
+        # 현재 쪽의 가맹점 데이터
+        start = self.page * self.page_size
+        return dict(islice(self.data.items(), start, start + self.page_size))
+
+    def set_page(self, page: int):
+        page = min(max(page, 0), self.page_count() - 1)
+        if page != self.page:
+            self.page = page
+            self.show_page()
+
+    def show_page(self):
+        """
+        현재 쪽의 막대만 제자리 갱신 (막대가 많으면 갱신 애니메이션 생략)
+        """
+        data = self.page_data()
+        chart = self.chart_view.chart()
+        chart.setAnimationOptions(
+            QChart.AnimationOption.SeriesAnimations if _bar_count(data) <= ANIMATION_MAX_ITEMS
+            else QChart.AnimationOption.NoAnimation
+        )
+        series = chart.series()[0]
+        axes = series.attachedAxes()
+        axis_x = next(axis for axis in axes if isinstance(axis, QBarCategoryAxis))
+        axis_y = next(axis for axis in axes if isinstance(axis, QValueAxis))
+        update_bar_series(series, axis_x, axis_y, data)
+        self.update_page_bar()
+
+    def update_page_bar(self):
+        count = self.page_count()
+        self.page_bar.setVisible(count > 1)
+        self.page_label.setText(f"{self.page + 1} / {count} 쪽 (가맹점 {len(self.data)}곳)")
+        self.prev_button.setEnabled(self.page > 0)
+        self.next_button.setEnabled(self.page < count - 1)
 
     def get_chart_view_copy(self) -> QChartView:
         original_chart = self.chart_view.chart()
@@ -131,4 +160,96 @@ class BarChartWidget(QWidget):
         chart_view_copy.setRenderHint(QPainter.RenderHint.Antialiasing)
         chart_view_copy.setFixedSize(self.chart_view.size())
 
-        return chart_view_copy
\ No newline at end of file
+        return chart_view_copy
+
+
+def build_bar_chart(title: str, data: dict[str, dict[str, float]], animated: bool = True) -> QChart:
+    """
+    가맹점별 카드사 그룹 막대 차트(QChart) 생성 (뷰 없이 utils.chart_renderer로 바로 그릴 수 있음)
+
+    :param title: 차트 제목
+    :param data: {"가맹점": {"카드사": 값}} 형태의 데이터
+    :param animated: 화면 표시용 애니메이션 사용 여부 (파일 저장용은 False)
+    """
+    chart = QChart()
+    chart.setTitle(title)
+    if animated and _bar_count(data) <= ANIMATION_MAX_ITEMS:
+        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+
+    if sys.platform == "darwin":
+        font = QFont("Apple SD Gothic Neo", 12)
+    else:
+        font = QFont("Malgun Gothic", 12)
+    font.setPointSize(14)
+    chart.setFont(font)
+
+    series = QBarSeries()
+    chart.addSeries(series)
+
+    axis_x = QBarCategoryAxis()
+    chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
+    axis_x.setLabelsAngle(40)
+    series.attachAxis(axis_x)
+
+    axis_y = QValueAxis()
+    chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
+    series.attachAxis(axis_y)
+
+    update_bar_series(series, axis_x, axis_y, data)
+
+    chart.legend().setVisible(True)
+    chart.legend().setAlignment(Qt.AlignmentFlag.AlignRight)
+    legend_font = QFont(font)
+    legend_font.setPointSizeF(16.0)  # or 12.0 등으로 조정
+    chart.legend().setFont(legend_font)
+    return chart
+
+
+def update_bar_series(series: QBarSeries, axis_x: QBarCategoryAxis, axis_y: QValueAxis, data: dict[str, dict[str, float]]):
+    """
+    막대 세트를 data에 맞게 제자리 갱신 (카드사별 QBarSet은 재사용하고 바뀐 값만 교체, 가맹점 축은 달라졌을 때만 교체)
+
+    카드사는 이름순(색이 월마다 바뀌지 않도록), 묶인 "기타"는 맨 뒤에 둔다.
+
+    값 축은 막대를 나중에 바꾸면 범위를 자동으로 다시 계산하지 않으므로 0을 포함한 최소~최대로 직접 맞춘다.
+    """
+    merchants = list(data.keys())
+    all_cards = set()
+    for card_data in data.values():
+        all_cards.update(card_data.keys())
+    all_cards = sorted(all_cards, key=lambda card: (card == OTHERS_LABEL, card))
+
+    existing = {bar_set.label(): bar_set for bar_set in series.barSets()}
+    for card in set(existing) - set(all_cards):
+        series.remove(existing.pop(card))
+
+    if axis_x.categories() != merchants:
+        axis_x.setCategories(merchants)
+
+    low, high = 0.0, 0.0
+    for index, card in enumerate(all_cards):
+        values = [data[merchant].get(card, 0) for merchant in merchants]
+        bar_set = existing.get(card)
+        if bar_set is None:
+            bar_set = QBarSet(card)
+            bar_set.append(values)
+            series.insert(index, bar_set)
+        elif bar_set.count() == len(values):
+            for position, value in enumerate(values):
+                if bar_set.at(position) != value:
+                    bar_set.replace(position, value)
+        else:
+            bar_set.remove(0, bar_set.count())
+            bar_set.append(values)
+        bar_set.setColor(QColor(BAR_COLORS[index % len(BAR_COLORS)]))
+        low, high = min(low, *values), max(high, *values)
+
+    axis_y.setRange(low, high if high > low else low + 1)
+
+
+def _bar_count(data: dict[str, dict[str, float]]) -> int:
+    # 그려질 막대 수 (가맹점 수 x 카드사 수)
+    cards = set()
+    for card_data in data.values():
+        cards.update(card_data.keys())
+    return len(data) * len(cards)
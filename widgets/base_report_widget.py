@@ -1,24 +1,47 @@
+from functools import partial
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton,
-    QLabel, QTableWidget
+    QLabel, QTableView, QProgressBar, QFileDialog
 )
-from PyQt6.QtCore import Qt
-import pandas as pd
+from PyQt6.QtCore import Qt, QThreadPool
+from dialogs.export_progress_dialog import start_export
+from utils.report_task import ReportTask
+from widgets.period_filter import PeriodFilter
+from widgets.report_table_model import ReportTableModel
 
 
 class BaseReportWidget(QWidget):
+    """
+    기간 콤보 + 리포트 테이블 화면의 공통 틀
+
+    하위 화면은 compute_report() (데이터셋 → 결과, 위젯을 건드리지 않는 순수 계산)와
+    render_report() (결과 → 화면, 보통 self.model.set_report() 한 번)만 구현한다. 선택 기간이 바뀌면 refresh()가
+    (report_name, 데이터셋 버전, report_params()) 키로 ReportCache를 먼저 확인하고,
+    없을 때만 계산해서 저장한 뒤 화면을 그린다.
+
+    계산은 QThreadPool 스레드에서 실행하고, 요청마다 세대 번호를 올려 가장 마지막 요청의
+    결과만 화면에 반영한다. (이전 선택의 결과는 캐시에만 넣고 버림)
+    한 화면에서 동시에 실행되는 계산은 하나뿐이며, 계산 중에 들어온 요청은 마지막 것만 남겨 두었다가 이어서 실행한다.
+    """
+
+    report_name = ""  # 캐시 키에 쓰는 화면 이름 (하위 클래스에서 지정)
+
     def __init__(
         self,
         title_text: str,
         parent=None,
         pdf_button_label: str = "PDF 저장",
-        on_combo_change=None,
         on_pdf_click=None,
         extra_buttons=None
     ):
         super().__init__(parent)
+        self.dataset = None
         self.full_df = None
-        self.on_combo_change = on_combo_change
+        self.report_cache = None
+        self.prefetcher = None
+        self._generation = 0        # 리포트 요청 세대 번호 (마지막 요청만 화면에 반영)
+        self._computing = False     # 백그라운드 계산 실행 중 여부
+        self._queued_request = None  # 계산 중에 들어온 마지막 요청
         self.setWindowTitle(title_text)
         self.resize(1200, 800)
 
@@ -38,6 +61,10 @@ class BaseReportWidget(QWidget):
         self.filter_layout.addWidget(self.month_combo)
         self.filter_layout.addWidget(self.day_combo)
 
+        # 콤보 시그널은 여기서 한 번만 연결 (데이터셋이 바뀌어도 다시 연결하지 않음)
+        self.period_filter = PeriodFilter(self.year_combo, self.month_combo, self.day_combo, parent=self)
+        self.period_filter.selection_changed.connect(self._on_period_changed)
+
         self.export_button = QPushButton(pdf_button_label)
         if on_pdf_click:
             self.export_button.clicked.connect(on_pdf_click)
@@ -45,6 +72,14 @@ class BaseReportWidget(QWidget):
             self.export_button.clicked.connect(self.export_pdf)
         self.filter_layout.addWidget(self.export_button)
 
+        # 계산 중 표시
+        self.busy_bar = QProgressBar()
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.setTextVisible(False)
+        self.busy_bar.setMaximumWidth(120)
+        self.busy_bar.hide()
+        self.filter_layout.addWidget(self.busy_bar)
+
         # extra_buttons 추가
         if extra_buttons:
             for text, slot in extra_buttons:
@@ -59,29 +94,168 @@ class BaseReportWidget(QWidget):
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.layout.addWidget(self.label)
 
-        # 테이블
-        self.table = QTableWidget()
-        # 콤보박스 필터 초기화 (초기 데이터가 있다면 적용)
-        if self.full_df is not None:
-            from utils.combo_filter import combo_fillter  # 필요한 경우 파일 경로 조정
-            combo_fillter(
-                self.full_df,
-                self.year_combo,
-                self.month_combo,
-                self.day_combo,
-                date_column="접수일",
-                on_change_callback=on_combo_change
-            )
+        # 테이블 (render_report에서 self.model.set_report()로 결과 DataFrame을 통째로 교체)
+        self.model = ReportTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setDefaultSectionSize(30)
+        self.table.setAlternatingRowColors(True)
         self.layout.addWidget(self.table)
 
-    def set_data(self, df: pd.DataFrame):
-        from utils.combo_filter import combo_fillter  # 필요한 경우 파일 경로 조정
-        self.full_df = df
-        combo_fillter(
-            df,
-            self.year_combo,
-            self.month_combo,
-            self.day_combo,
-            date_column="접수일",
-            on_change_callback=self.on_combo_change  # ensure this is stored in __init__
-        )
\ No newline at end of file
+    def set_dataset(self, dataset):
+        """
+        공용 ComplaintDataset을 받아 콤보박스를 구성하고 리포트를 갱신한다.
+        dataset.frame은 복사하지 않고 그대로 참조한다.
+        """
+        if dataset is None or dataset.empty:
+            return
+        self.dataset = dataset
+        self.full_df = dataset.frame
+        self.period_filter.set_date_index(dataset.date_index)
+
+    def set_report_cache(self, report_cache, prefetcher=None):
+        """
+        :param report_cache: 여러 화면이 함께 쓰는 ReportCache (None이면 캐시 없이 매번 계산)
+        :param prefetcher: 인접 기간을 미리 계산할 ReportPrefetcher (None이면 미리 계산하지 않음)
+        """
+        self.report_cache = report_cache
+        self.prefetcher = prefetcher
+
+    # ---- 리포트 갱신 ----
+
+    def report_params(self, selection) -> tuple:
+        """
+        계산에 필요한 선택값 (캐시 키의 일부). 기간 외 옵션이 있는 화면은 재정의한다.
+
+        :param selection: PeriodFilter.selection() 값 (연, 월, 일)
+        """
+        return tuple(selection)
+
+    def compute_report(self, dataset, params):
+        raise NotImplementedError
+
+    def render_report(self, result, params):
+        raise NotImplementedError
+
+    def cache_key(self, params) -> tuple:
+        return (self.report_name, self.dataset.version, params)
+
+    def refresh(self):
+        try:
+            self._update_report()
+        except Exception as e:
+            print(f"❌ 리포트 갱신 중 오류 발생: {e}")
+
+    def _update_report(self):
+        selection = self.period_filter.selection()
+        if self.dataset is None or selection is None:
+            return
+        params = self.report_params(selection)
+        key = self.cache_key(params)
+        self._generation += 1
+
+        result = self.report_cache.get(key) if self.report_cache is not None else None
+        if result is not None:
+            self._queued_request = None
+            self._show_result(result, params, selection)
+            return
+
+        self._queued_request = (self._generation, self.dataset, params, key, selection)
+        self.busy_bar.show()
+        if not self._computing:
+            self._start_queued_request()
+
+    def _start_queued_request(self):
+        generation, dataset, params, key, selection = self._queued_request
+        self._queued_request = None
+        self._computing = True
+        task = ReportTask(
+            lambda: self.compute_report(dataset, params),
+            (generation, params, key, selection)
+        )
+        task.signals.finished.connect(self._on_report_computed)
+        task.signals.failed.connect(self._on_report_failed)
+        self._task_signals = task.signals  # 시그널 전달이 끝날 때까지 참조 유지
+        QThreadPool.globalInstance().start(task)
+
+    def _on_report_computed(self, context, result):
+        generation, params, key, selection = context
+        self._computing = False
+        # 이미 지난 요청이거나 그 사이 데이터셋이 바뀌었으면 화면에도 캐시에도 반영하지 않음
+        current = generation == self._generation and self.dataset is not None and key[1] == self.dataset.version
+        if current and self.report_cache is not None:
+            self.report_cache.put(key, result)
+        if current:
+            try:
+                self._show_result(result, params, selection)
+            except Exception as e:
+                print(f"❌ 리포트 갱신 중 오류 발생: {e}")
+        self._continue_queue()
+
+    def _on_report_failed(self, context, message):
+        self._computing = False
+        print(f"❌ 리포트 계산 중 오류 발생: {message}")
+        self._continue_queue()
+
+    def _continue_queue(self):
+        if self._queued_request is not None:
+            self._start_queued_request()
+        elif not self._computing:
+            self.busy_bar.hide()
+
+    def _show_result(self, result, params, selection):
+        if not self._computing:
+            self.busy_bar.hide()
+        self.render_report(result, params)
+        self.prefetch_neighbours(selection)
+
+    def is_busy(self) -> bool:
+        return self._computing or self._queued_request is not None
+
+    def neighbour_selections(self, selection) -> list:
+        """
+        미리 계산할 인접 기간 선택값 (일 콤보를 쓰면 앞/뒤 날짜, 아니면 앞/뒤 월)
+        """
+        year, month, day = selection
+        date_index = self.dataset.date_index
+        if day is not None:
+            return date_index.adjacent_days(year, month, day)
+        return [(y, m, None) for y, m in date_index.adjacent_months(year, month)]
+
+    def prefetch_neighbours(self, selection):
+        if self.prefetcher is None or self.report_cache is None:
+            return
+        dataset = self.dataset
+        for neighbour in self.neighbour_selections(selection):
+            params = self.report_params(neighbour)
+            self.prefetcher.prefetch(
+                self.cache_key(params),
+                lambda dataset=dataset, params=params: self.compute_report(dataset, params)
+            )
+
+    def _on_period_changed(self, selection):
+        self.refresh()
+
+    # ---- PDF 저장 ----
+
+    def export_report_pdf(self, title: str, orientation: str = "portrait", font_size: int = 12):
+        """
+        현재 표시 중인 리포트를 백그라운드에서 PDF로 저장 (진행 창 + 취소, 완료/오류 메시지)
+
+        저장에는 화면에 표시 중인 리포트 DataFrame을 그대로 넘기므로, 저장하는 동안
+        다른 기간을 선택해도 저장 내용은 바뀌지 않는다.
+        """
+        if self.model.rowCount() == 0:
+            print("❌ 출력할 데이터가 없습니다.")
+            return None
+
+        save_path, _ = QFileDialog.getSaveFileName(self, "PDF 저장", "", "PDF Files (*.pdf)")
+        if not save_path:
+            return None
+
+        from utils.pdf_exporter import export_report_to_pdf  # reportlab은 처음 저장할 때 불러옴 (시작 시간 단축)
+        export = partial(
+            export_report_to_pdf, self.model.report_frame(), self.model.column_specs(),
+            title=title, orientation=orientation, font_size=font_size
+        )
+        return start_export(self, export, save_path, title)
@@ -0,0 +1,181 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+import numpy as np
+import pandas as pd
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    def __init__(self, df: pd.DataFrame = None, money_columns=None, parent=None):
+        """
+        DataFrame 컬럼을 그대로 읽어 보여주는 테이블 모델
+
+        셀 문자열은 화면에 보이는 셀에 대해서만 data() 호출 시점에 만들어지고,
+        편집 내용은 원본 DataFrame에 바로 기록된다.
+
+        :param df: 표시할 DataFrame
+        :param money_columns: 천 단위 콤마로 표시할 금액 컬럼명 목록
+        :param parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.money_columns = set(money_columns or [])
+        self._highlight = ""
+        self.set_dataframe(df if df is not None else pd.DataFrame())
+
+    # ---- 데이터 교체 / 조회 ----
+
+    def set_dataframe(self, df: pd.DataFrame):
+        self.beginResetModel()
+        self._df = df.reset_index(drop=True)
+        self._columns = list(self._df.columns)
+        self._money_flags = [col in self.money_columns for col in self._columns]
+        self._order = np.arange(len(self._df))           # 정렬 순서 (원본 행 위치)
+        self._visible = np.ones(len(self._df), dtype=bool)  # 검색 필터 결과
+        self._rows = self._order
+        self.endResetModel()
+
+    def dataframe(self) -> pd.DataFrame:
+        return self._df
+
+    def visible_dataframe(self) -> pd.DataFrame:
+        # 현재 화면에 보이는 행(필터/정렬 반영)만 반환
+        return self._df.iloc[self._rows]
+
+    def source_row(self, row: int) -> int:
+        return int(self._rows[row])
+
+    @property
+    def money_flags(self) -> list[bool]:
+        # 컬럼 순서대로 금액 컬럼 여부
+        return self._money_flags
+
+    # ---- QAbstractTableModel 구현 ----
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            value = self._df.iat[self._rows[index.row()], col]
+            return self.format_value(value, self._money_flags[col])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if self._money_flags[col]:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.BackgroundRole and self._highlight:
+            value = self._df.iat[self._rows[index.row()], col]
+            text = self.format_value(value, self._money_flags[col])
+            if self._highlight in text.lower():
+                return QColor(Qt.GlobalColor.yellow)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._columns[section])
+        return str(self._rows[section] + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        row = self._rows[index.row()]
+        col = index.column()
+        try:
+            self._df.iat[row, col] = self.parse_value(value, self._df.dtypes.iloc[col], self._money_flags[col])
+        except (ValueError, TypeError) as e:
+            print("셀 수정 실패:", e)
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column < 0 or column >= len(self._columns):
+            return
+        self.layoutAboutToBeChanged.emit()
+        series = self._df.iloc[:, column]
+        if series.dtype == object:
+            keys = series.astype(str).to_numpy()
+        else:
+            keys = series.to_numpy()
+        order_idx = np.argsort(keys, kind="stable")
+        if order == Qt.SortOrder.DescendingOrder:
+            order_idx = order_idx[::-1]
+        self._order = order_idx
+        self._rows = self._order[self._visible[self._order]]
+        self.layoutChanged.emit()
+
+    # ---- 필터 / 행 추가 ----
+
+    def set_row_filter(self, mask, highlight: str = ""):
+        """
+        표시할 행을 불리언 마스크(원본 행 위치 기준)로 제한한다. None이면 전체 표시.
+        """
+        self.beginResetModel()
+        if mask is None:
+            self._visible = np.ones(len(self._df), dtype=bool)
+        else:
+            self._visible = np.asarray(mask, dtype=bool)
+        self._highlight = highlight.lower().strip()
+        self._rows = self._order[self._visible[self._order]]
+        self.endResetModel()
+
+    def append_empty_row(self):
+        empty = {}
+        for col, dtype in self._df.dtypes.items():
+            if pd.api.types.is_datetime64_any_dtype(dtype):
+                empty[col] = pd.NaT
+            elif pd.api.types.is_numeric_dtype(dtype):
+                empty[col] = np.nan
+            else:
+                empty[col] = ""
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._df = pd.concat([self._df, pd.DataFrame([empty])], ignore_index=True)
+        new_row = len(self._df) - 1
+        self._order = np.append(self._order, new_row)
+        self._visible = np.append(self._visible, True)
+        self._rows = np.append(self._rows, new_row)
+        self.endInsertRows()
+
+    # ---- 값 포맷 ----
+
+    @staticmethod
+    def format_value(value, is_money: bool = False) -> str:
+        if value is None or value is pd.NaT:
+            return ""
+        if isinstance(value, pd.Timestamp):
+            return value.strftime("%Y-%m-%d")
+        if isinstance(value, float) and np.isnan(value):
+            return ""
+        if is_money:
+            try:
+                return f"{int(float(value)):,}"
+            except (ValueError, TypeError):
+                return str(value)
+        return str(value)
+
+    @staticmethod
+    def parse_value(value, dtype, is_money: bool = False):
+        text = str(value).strip()
+        if is_money:
+            text = text.replace(",", "").replace("₩", "")
+            if pd.api.types.is_numeric_dtype(dtype):
+                return float(text) if text else 0.0
+            return text
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return pd.to_datetime(text, errors="coerce") if text else pd.NaT
+        if pd.api.types.is_numeric_dtype(dtype):
+            return float(text) if text else np.nan
+        return text
@@ -0,0 +1,123 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QComboBox
+
+DEFAULT_DEBOUNCE_MS = 120  # 연달아 바뀌는 콤보 변경을 한 번의 갱신으로 묶는 대기 시간
+
+
+class PeriodFilter(QObject):
+    """
+    리포트 화면의 연/월/일 콤보박스 상태를 관리하는 필터 컨트롤러
+
+    콤보 시그널은 생성 시 한 번만 연결하고, 데이터셋이 바뀌면 목록만 다시 채운다.
+    연도 변경 → 월/일 목록 갱신처럼 이어지는 변경은 시그널을 막은 채 처리하고,
+    사용자 조작 한 번에 selection_changed를 한 번만 보낸다. (debounce_ms 동안 모아서)
+
+    emit_count는 지금까지 보낸 selection_changed 횟수 (조작 한 번당 재계산 한 번인지 확인용)
+    """
+
+    selection_changed = pyqtSignal(object)  # (연, 월, 일) — 일 콤보를 쓰지 않으면 일은 None
+
+    def __init__(self, year_combo: QComboBox, month_combo: QComboBox, day_combo: QComboBox = None,
+                 debounce_ms: int = DEFAULT_DEBOUNCE_MS, parent=None):
+        """
+        :param year_combo: 연도 콤보박스
+        :param month_combo: 월 콤보박스
+        :param day_combo: 일 콤보박스 (숨겨져 있으면 사용하지 않음)
+        :param debounce_ms: 변경을 모으는 시간 (ms)
+        :param parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.year_combo = year_combo
+        self.month_combo = month_combo
+        self.day_combo = day_combo
+        self.date_index = None
+        self.emit_count = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._emit)
+
+        self.year_combo.currentIndexChanged.connect(self._on_year_changed)
+        self.month_combo.currentIndexChanged.connect(self._on_month_changed)
+        if self.day_combo is not None:
+            self.day_combo.currentIndexChanged.connect(self._on_day_changed)
+
+    def uses_day(self) -> bool:
+        return self.day_combo is not None and not self.day_combo.isHidden()
+
+    def set_date_index(self, date_index):
+        """
+        새 데이터셋의 DateIndex로 목록을 다시 채우고 가장 최근 기간을 선택한 뒤 바로 한 번 알린다.
+        """
+        self.date_index = date_index
+        self._timer.stop()
+        self._fill(self.year_combo, date_index.years(), keep_current=False)
+        self._fill_months(keep_current=False)
+        if self.year_combo.count():
+            self._emit()
+
+    def selection(self):
+        """
+        :return: (연, 월, 일) 정수 튜플. 선택값이 비어 있으면 None
+        """
+        year = self.year_combo.currentText()
+        month = self.month_combo.currentText()
+        if not year or not month:
+            return None
+        day = None
+        if self.uses_day():
+            day = self.day_combo.currentText()
+            if not day:
+                return None
+            day = int(day)
+        return int(year), int(month), day
+
+    # ---- 콤보 변경 처리 ----
+
+    def _on_year_changed(self, *_):
+        self._fill_months(keep_current=True)
+        self._timer.start()
+
+    def _on_month_changed(self, *_):
+        self._fill_days(keep_current=True)
+        self._timer.start()
+
+    def _on_day_changed(self, *_):
+        self._timer.start()
+
+    def _fill_months(self, keep_current: bool):
+        year = self.year_combo.currentText()
+        months = self.date_index.months(int(year)) if self.date_index is not None and year else []
+        self._fill(self.month_combo, months, keep_current)
+        self._fill_days(keep_current)
+
+    def _fill_days(self, keep_current: bool):
+        if not self.uses_day():
+            return
+        year = self.year_combo.currentText()
+        month = self.month_combo.currentText()
+        days = []
+        if self.date_index is not None and year and month:
+            days = self.date_index.days(int(year), int(month))
+        self._fill(self.day_combo, days, keep_current)
+
+    @staticmethod
+    def _fill(combo: QComboBox, values, keep_current: bool):
+        # 시그널을 막은 채 목록 교체 (가능하면 기존 선택 유지, 아니면 마지막 값 선택)
+        current = combo.currentText()
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems([str(v) for v in values])
+        if keep_current and combo.findText(current) >= 0:
+            combo.setCurrentText(current)
+        elif values:
+            combo.setCurrentIndex(len(values) - 1)
+        combo.blockSignals(False)
+
+    def _emit(self):
+        selection = self.selection()
+        if selection is None:
+            return
+        self.emit_count += 1
+        self.selection_changed.emit(selection)
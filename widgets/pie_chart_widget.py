@@ -4,6 +4,10 @@ from PyQt6.QtCharts import QChart, QChartView, QPieSeries, QPieSlice
 from PyQt6.QtGui import QPainter, QFont, QColor
 from PyQt6.QtCore import Qt
 
+# 파스텔톤 색상 리스트 (연녹색, 연주황, 연파랑 등)
+PIE_COLORS = ["#A8E6CF", "#FFD3B6", "#B3E5FC", "#FFFACD", "#D7BDE2"]
+ANIMATION_MAX_ITEMS = 50  # 조각/막대가 이보다 많으면 데이터 갱신 때 애니메이션 생략
+
 
 class PieChartWidget(QWidget):
     def __init__(self, title: str, data: dict[str, int], parent=None):
@@ -24,48 +28,8 @@ class PieChartWidget(QWidget):
         # 전체 레이아웃을 수직 박스로 설정
         layout = QVBoxLayout(self)
 
-        # QChart 객체 생성 (차트의 메인 영역)
-        chart = QChart()
-        chart.setTitle(self.title)  # 차트 상단 제목 설정
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)  # 애니메이션 효과 활성화
-
-        # 시스템에 따라 한글 폰트 설정 (macOS: AppleGothic, Windows: Malgun Gothic)
-        if sys.platform == "darwin":
-            font = QFont("Apple SD Gothic Neo", 10)
-        else:
-            font = QFont("Malgun Gothic", 10)
-
-        chart.setFont(font)  # 차트 제목 폰트 적용
-
-        # 파이 데이터 시리즈 객체 생성
-        series = QPieSeries()
-
-        # 파스텔톤 색상 리스트 (연녹색, 연주황, 연파랑 등)
-        colors = ["#A8E6CF", "#FFD3B6", "#B3E5FC", "#FFFACD", "#D7BDE2"]
-
-        # 전달받은 딕셔너리 데이터를 기반으로 파이 조각 추가
-        for index, (label, value) in enumerate(self.data.items()):
-            slice = QPieSlice(label, value)
-            slice.setBrush(QColor(colors[index % len(colors)]))
-            slice.setLabelVisible(True)
-            percentage = value / sum(self.data.values()) * 100
-            slice.setLabel(f"{label} ({value}건, {percentage:.1f}%)")
-            if slice.percentage() > 0.3:
-                slice.setLabelPosition(QPieSlice.LabelPosition.LabelInsideHorizontal)
-            else:
-                slice.setLabelPosition(QPieSlice.LabelPosition.LabelOutside)
-            series.append(slice)
-
-        # 차트에 시리즈 추가
-        chart.addSeries(series)
-
-        # 범례(legend) 표시 및 우측 정렬
-        chart.legend().setVisible(True)  # 범례 보이기
-        chart.legend().setAlignment(Qt.AlignmentFlag.AlignRight)  # 우측 정렬
-        chart.legend().setFont(font)  # 범례 폰트 적용
-
         # 차트를 보여줄 뷰 생성 및 부드럽게 렌더링 설정
-        self.chart_view = QChartView(chart)
+        self.chart_view = QChartView(build_pie_chart(self.title, self.data))
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)  # 안티앨리어싱(부드럽게)
 
         # 최종 차트 뷰를 레이아웃에 추가
@@ -74,6 +38,22 @@ class PieChartWidget(QWidget):
         # 레이아웃 설정
         self.setLayout(layout)
 
+    def set_data(self, title: str, data: dict[str, int]):
+        """
+        차트를 새로 만들지 않고 제목과 조각 값만 제자리 갱신 (날짜를 빠르게 넘길 때 사용)
+
+        조각이 많으면 갱신 애니메이션을 생략한다.
+        """
+        self.title = title
+        self.data = data
+        chart = self.chart_view.chart()
+        chart.setAnimationOptions(
+            QChart.AnimationOption.SeriesAnimations if len(data) <= ANIMATION_MAX_ITEMS
+            else QChart.AnimationOption.NoAnimation
+        )
+        chart.setTitle(title)
+        update_pie_series(chart.series()[0], data, chart.font())
+
     def get_chart_view_copy(self) -> QChartView:
         """
         현재 chart_view의 복사본을 생성하여 반환 (PDF 저장용)
@@ -109,4 +89,77 @@ class PieChartWidget(QWidget):
         chart_view_copy = QChartView(new_chart)
         chart_view_copy.setRenderHint(QPainter.RenderHint.Antialiasing)
         return chart_view_copy
-    
+
+
+def build_pie_chart(title: str, data: dict[str, int], animated: bool = True) -> QChart:
+    """
+    파이 차트(QChart) 생성 (뷰 없이 utils.chart_renderer로 바로 그릴 수 있음)
+
+    :param title: 차트 제목
+    :param data: {"A": 10, "B": 20} 형태의 데이터
+    :param animated: 화면 표시용 애니메이션 사용 여부 (파일 저장용은 False)
+    """
+    # QChart 객체 생성 (차트의 메인 영역)
+    chart = QChart()
+    chart.setTitle(title)  # 차트 상단 제목 설정
+    if animated and len(data) <= ANIMATION_MAX_ITEMS:
+        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)  # 애니메이션 효과 활성화
+
+    # 시스템에 따라 한글 폰트 설정 (macOS: AppleGothic, Windows: Malgun Gothic)
+    if sys.platform == "darwin":
+        font = QFont("Apple SD Gothic Neo", 10)
+    else:
+        font = QFont("Malgun Gothic", 10)
+
+    chart.setFont(font)  # 차트 제목 폰트 적용
+
+    # 파이 데이터 시리즈 객체 생성 후 조각 추가
+    series = QPieSeries()
+    update_pie_series(series, data, font)
+
+    # 차트에 시리즈 추가
+    chart.addSeries(series)
+
+    # 범례(legend) 표시 및 우측 정렬
+    chart.legend().setVisible(True)  # 범례 보이기
+    chart.legend().setAlignment(Qt.AlignmentFlag.AlignRight)  # 우측 정렬
+    chart.legend().setFont(font)  # 범례 폰트 적용
+    return chart
+
+
+def update_pie_series(series: QPieSeries, data: dict[str, int], font: QFont):
+    """
+    시리즈의 조각을 data에 맞게 제자리 갱신 (같은 이름의 조각은 값/라벨만 바꾸고, 없어진 조각만 제거, 새 조각만 추가)
+
+    조각 이름은 표시 라벨("이름 (n건, p%)")과 별도로 동적 속성 "key"에 저장해 두고 비교한다.
+    """
+    existing = {slice.property("key"): slice for slice in series.slices()}
+    for key in set(existing) - set(data):
+        series.remove(existing.pop(key))
+
+    total = sum(data.values())
+    for label, value in data.items():
+        slice = existing.get(label)
+        if slice is None:
+            slice = QPieSlice(label, value)
+            slice.setProperty("key", label)
+            slice.setBrush(QColor(PIE_COLORS[series.count() % len(PIE_COLORS)]))
+            slice.setLabelVisible(True)
+            slice.setLabelFont(font)
+            series.append(slice)
+        else:
+            slice.setValue(value)
+        percentage = value / total * 100 if total else 0.0
+        slice.setLabel(f"{label} ({value}건, {percentage:.1f}%)")
+        if percentage > 30:
+            slice.setLabelPosition(QPieSlice.LabelPosition.LabelInsideHorizontal)
+        else:
+            slice.setLabelPosition(QPieSlice.LabelPosition.LabelOutside)
+        existing[label] = slice
+
+    # 조각 순서를 data 순서에 맞춤 (기존 조각 객체는 그대로 두고 순서만 바꿈)
+    ordered = [existing[label] for label in data]
+    if series.slices() != ordered:
+        for slice in ordered:
+            series.take(slice)
+        series.append(ordered)
@@ -0,0 +1,175 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFont
+import numpy as np
+import pandas as pd
+
+ROW_TYPE_ROLE = Qt.ItemDataRole.UserRole + 1   # 행 종류 ("detail" / "subtotal" / "total")
+RAW_VALUE_ROLE = Qt.ItemDataRole.UserRole + 2  # 포맷 전 원래 값
+
+ROW_TYPE_COLUMN = "__row_type"
+BOLD_ROW_TYPES = {"subtotal", "total"}
+
+ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+
+class ColumnSpec:
+    """
+    리포트 테이블 컬럼 표시 규칙
+
+    :param name: DataFrame 컬럼명
+    :param title: 헤더 문구 (기본: name)
+    :param kind: "text" (str 그대로) / "money" (천 단위 콤마 정수) / "date" (YYYY-MM-DD)
+    :param align: 정렬 (기본: money는 오른쪽, 나머지는 가운데)
+    :param group_by: 지정한 컬럼 값이 바로 위 상세 행과 같으면 이 칸을 비워서 표시 (중복 가맹점명 등)
+    """
+
+    def __init__(self, name: str, title: str = None, kind: str = "text", align=None, group_by: str = None):
+        self.name = name
+        self.title = title or name
+        self.kind = kind
+        self.align = align if align is not None else (ALIGN_RIGHT if kind == "money" else ALIGN_CENTER)
+        self.group_by = group_by
+
+    def format(self, value) -> str:
+        if value is None or pd.isna(value):
+            return ""
+        if self.kind == "money":
+            try:
+                return f"{int(float(value)):,}"
+            except (ValueError, TypeError):
+                return str(value)
+        if self.kind == "date" and isinstance(value, (pd.Timestamp, np.datetime64)):
+            return pd.Timestamp(value).strftime("%Y-%m-%d")
+        return str(value)
+
+    def format_values(self, values) -> list[str]:
+        # 같은 값은 한 번만 변환 (리포트 컬럼은 반복 값이 많음)
+        cache = {}
+        texts = []
+        for value in values:
+            try:
+                text = cache[value]
+            except KeyError:
+                text = cache[value] = self.format(value)
+            except TypeError:
+                text = self.format(value)
+            texts.append(text)
+        return texts
+
+
+def report_row_types(frame: pd.DataFrame) -> np.ndarray:
+    """
+    :return: 행 종류 배열 (__row_type 컬럼이 없으면 모두 "detail")
+    """
+    if ROW_TYPE_COLUMN in frame.columns:
+        return frame[ROW_TYPE_COLUMN].to_numpy()
+    return np.full(len(frame), "detail", dtype=object)
+
+
+def repeat_mask(frame: pd.DataFrame, spec: ColumnSpec, row_types: np.ndarray = None):
+    """
+    :return: group_by 값이 바로 위 상세 행과 같은 상세 행 마스크 (해당 칸을 비움). group_by가 없으면 None
+    """
+    if spec.group_by is None:
+        return None
+    if row_types is None:
+        row_types = report_row_types(frame)
+    keys = frame[spec.group_by].to_numpy()
+    detail = row_types == "detail"
+    mask = np.zeros(len(keys), dtype=bool)
+    if len(keys) > 1:
+        mask[1:] = (keys[1:] == keys[:-1]) & detail[1:] & detail[:-1]
+    return mask
+
+
+class ReportTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        """
+        집계가 끝난 리포트 DataFrame을 그대로 보여주는 읽기 전용 테이블 모델
+
+        컬럼별 값 배열만 들고 있다가 화면에 보이는 셀만 data() 시점에 문자열로 만든다.
+        행 종류(__row_type 컬럼)는 ROW_TYPE_ROLE로 제공하고, 소계/합계 행은 굵게 표시한다.
+
+        :param parent: 부모 객체
+        """
+        super().__init__(parent)
+        self._frame = pd.DataFrame()
+        self._specs = []
+        self._values = []
+        self._blank = []
+        self._row_types = np.empty(0, dtype=object)
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    # ---- 데이터 교체 / 조회 ----
+
+    def set_report(self, frame: pd.DataFrame, columns=None):
+        """
+        :param frame: 리포트 DataFrame (__row_type 컬럼이 있으면 행 종류로 사용)
+        :param columns: ColumnSpec 목록 (기본: __row_type을 뺀 모든 컬럼을 text로)
+        """
+        if columns is None:
+            columns = [ColumnSpec(col) for col in frame.columns if col != ROW_TYPE_COLUMN]
+        self.beginResetModel()
+        self._frame = frame
+        self._specs = list(columns)
+        self._values = [frame[spec.name].to_numpy() for spec in self._specs]
+        self._row_types = report_row_types(frame)
+        self._blank = [repeat_mask(frame, spec, self._row_types) for spec in self._specs]
+        self.endResetModel()
+
+    def report_frame(self) -> pd.DataFrame:
+        return self._frame
+
+    def column_specs(self) -> list:
+        return self._specs
+
+    def headers(self) -> list[str]:
+        return [spec.title for spec in self._specs]
+
+    def row_type(self, row: int) -> str:
+        return self._row_types[row]
+
+    def display_text(self, row: int, col: int) -> str:
+        if self._blank[col] is not None and self._blank[col][row]:
+            return ""
+        return self._specs[col].format(self._values[col][row])
+
+    # ---- QAbstractTableModel 구현 ----
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._row_types)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._specs)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_text(row, col)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._specs[col].align
+        if role == Qt.ItemDataRole.FontRole:
+            return self._bold_font if self._row_types[row] in BOLD_ROW_TYPES else None
+        if role == ROW_TYPE_ROLE:
+            return self._row_types[row]
+        if role == RAW_VALUE_ROLE:
+            return self._values[col][row]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._specs[section].title
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable